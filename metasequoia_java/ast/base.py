@@ -34,6 +34,7 @@ class Tree(abc.ABC):
 
     @staticmethod
     def mock() -> "Tree":
+        """构造模拟节点，仅在单元测试和文档测试中使用"""
         return MockTree(
             kind=TreeKind.MOCK,
             start_pos=None,
@@ -1,3 +1,4 @@
 from metasequoia_java.grammar.grammar_enum.enumerator_estimate import EnumeratorEstimate
 from metasequoia_java.grammar.grammar_enum.operator_precedence import OperatorPrecedence
+from metasequoia_java.grammar.grammar_enum.parens_action import ParensAction
 from metasequoia_java.grammar.grammar_enum.pattern_result import PatternResult
@@ -0,0 +1,28 @@
+"""
+分析括号中的内容时，根据 Token 类型执行的动作的枚举类
+"""
+
+import enum
+
+__all__ = [
+    "ParensAction"
+]
+
+
+class ParensAction(enum.Enum):
+    """分析括号中的内容时（analyze_parens），根据 Token 类型执行的动作的枚举类"""
+
+    DEFAULT = enum.auto()  # 其他 Token：返回默认结果
+    COMMA = enum.auto()  # ,
+    SKIP = enum.auto()  # extends、super、.、&：直接跳过
+    QUES = enum.auto()  # ?
+    PRIMITIVE = enum.auto()  # 基本类型或 void
+    LPAREN = enum.auto()  # (
+    RPAREN = enum.auto()  # )
+    IDENTIFIER = enum.auto()  # 类似标识符的 Token
+    EXPLICIT_LAMBDA = enum.auto()  # final、...：显式 lambda 表达式
+    MONKEYS_AT = enum.auto()  # @
+    LBRACKET = enum.auto()  # [
+    LT = enum.auto()  # <
+    GT = enum.auto()  # >、>>、>>>
+
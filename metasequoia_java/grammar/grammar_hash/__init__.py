@@ -1,6 +1,10 @@
+from metasequoia_java.grammar.grammar_hash.angle_bracket_depth import ANGLE_BRACKET_TO_DEPTH_DELTA
 from metasequoia_java.grammar.grammar_hash.assign_operator import ASSIGN_OPERATOR_TO_TREE_KIND
 from metasequoia_java.grammar.grammar_hash.binary_operator import BINARY_OPERATOR_TO_TREE_KIND
+from metasequoia_java.grammar.grammar_hash.modifier import MODIFIER_TO_BIT
+from metasequoia_java.grammar.grammar_hash.modifier import NON_VIRTUAL_MODIFIER_MASK
 from metasequoia_java.grammar.grammar_hash.modifier import TOKEN_TO_MODIFIER
+from metasequoia_java.grammar.grammar_hash.parens_action import TOKEN_TO_PARENS_ACTION
 from metasequoia_java.grammar.grammar_hash.primitive_type import TOKEN_TO_TYPE_KIND
 from metasequoia_java.grammar.grammar_hash.token_precedence import TOKEN_TO_OPERATOR_PRECEDENCE
 from metasequoia_java.grammar.grammar_hash.unary_operator import UNARY_OPERATOR_TO_TREE_KIND
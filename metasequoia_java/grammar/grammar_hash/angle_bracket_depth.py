@@ -0,0 +1,17 @@
+"""
+尖括号 Token 类型到泛型嵌套层数变化量的映射关系
+"""
+
+from metasequoia_java.lexical import TokenKind
+
+__all__ = [
+    "ANGLE_BRACKET_TO_DEPTH_DELTA"
+]
+
+# 在前瞻分析泛型时，尖括号 Token 类型到嵌套层数变化量的映射关系（`>>` 和 `>>>` 分别关闭 2 层和 3 层泛型）
+ANGLE_BRACKET_TO_DEPTH_DELTA = {
+    TokenKind.LT: 1,
+    TokenKind.GT: -1,
+    TokenKind.GT_GT: -2,
+    TokenKind.GT_GT_GT: -3,
+}
@@ -7,6 +7,8 @@ from metasequoia_java.lexical import TokenKind
 
 __all__ = [
     "TOKEN_TO_MODIFIER",
+    "MODIFIER_TO_BIT",
+    "NON_VIRTUAL_MODIFIER_MASK",
 ]
 
 TOKEN_TO_MODIFIER = {
@@ -23,3 +25,9 @@ TOKEN_TO_MODIFIER = {
     TokenKind.STRICTFP: Modifier.STRICTFP,
     TokenKind.DEFAULT: Modifier.DEFAULT
 }
+
+# 修饰符到位掩码的映射关系（每个修饰符占用 1 个二进制位，用于在解析修饰符时检查重复）
+MODIFIER_TO_BIT = {modifier: 1 << i for i, modifier in enumerate(Modifier)}
+
+# 所有非虚拟修饰符的位掩码（用于在解析修饰符后直接判断是否包含实际出现在代码中的修饰符）
+NON_VIRTUAL_MODIFIER_MASK = sum(bit for modifier, bit in MODIFIER_TO_BIT.items() if not modifier.is_virtual())
@@ -0,0 +1,43 @@
+"""
+分析括号中的内容时，Token 类型到执行动作的映射关系
+"""
+
+from metasequoia_java.grammar.grammar_enum.parens_action import ParensAction
+from metasequoia_java.lexical import TokenKind
+
+__all__ = [
+    "TOKEN_TO_PARENS_ACTION"
+]
+
+# 分析括号中的内容时（analyze_parens），Token 类型到执行动作的映射关系（不在其中的 Token 类型对应 DEFAULT）
+TOKEN_TO_PARENS_ACTION = {
+    TokenKind.COMMA: ParensAction.COMMA,
+    TokenKind.EXTENDS: ParensAction.SKIP,
+    TokenKind.SUPER: ParensAction.SKIP,
+    TokenKind.DOT: ParensAction.SKIP,
+    TokenKind.AMP: ParensAction.SKIP,
+    TokenKind.QUES: ParensAction.QUES,
+    TokenKind.BYTE: ParensAction.PRIMITIVE,
+    TokenKind.SHORT: ParensAction.PRIMITIVE,
+    TokenKind.INT: ParensAction.PRIMITIVE,
+    TokenKind.LONG: ParensAction.PRIMITIVE,
+    TokenKind.FLOAT: ParensAction.PRIMITIVE,
+    TokenKind.DOUBLE: ParensAction.PRIMITIVE,
+    TokenKind.BOOLEAN: ParensAction.PRIMITIVE,
+    TokenKind.CHAR: ParensAction.PRIMITIVE,
+    TokenKind.VOID: ParensAction.PRIMITIVE,
+    TokenKind.LPAREN: ParensAction.LPAREN,
+    TokenKind.RPAREN: ParensAction.RPAREN,
+    TokenKind.IDENTIFIER: ParensAction.IDENTIFIER,
+    TokenKind.UNDERSCORE: ParensAction.IDENTIFIER,
+    TokenKind.ASSERT: ParensAction.IDENTIFIER,
+    TokenKind.ENUM: ParensAction.IDENTIFIER,
+    TokenKind.FINAL: ParensAction.EXPLICIT_LAMBDA,
+    TokenKind.ELLIPSIS: ParensAction.EXPLICIT_LAMBDA,
+    TokenKind.MONKEYS_AT: ParensAction.MONKEYS_AT,
+    TokenKind.LBRACKET: ParensAction.LBRACKET,
+    TokenKind.LT: ParensAction.LT,
+    TokenKind.GT_GT_GT: ParensAction.GT,
+    TokenKind.GT_GT: ParensAction.GT,
+    TokenKind.GT: ParensAction.GT,
+}
@@ -2,7 +2,8 @@
 语法解析器
 """
 
-from typing import Any, Dict, List, Optional
+import types
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple, Union
 
 from metasequoia_java import ast
 from metasequoia_java.ast import ReferenceMode
@@ -13,12 +14,63 @@ from metasequoia_java.ast.constants import ModuleKind
 from metasequoia_java.ast.element import Modifier
 from metasequoia_java.grammar import grammar_enum
 from metasequoia_java.grammar import grammar_hash
+from metasequoia_java.grammar.grammar_enum import ParensAction
 from metasequoia_java.grammar.parans_result import ParensResult
-from metasequoia_java.grammar.parser_mode import ParserMode as Mode
+from metasequoia_java.grammar.parser_mode import PARSER_MODE as Mode
+from metasequoia_java.grammar.parser_mode import ParserMode
+from metasequoia_java.grammar.token_set import ABSTRACT_OR_STRICTFP
+from metasequoia_java.grammar.token_set import ARROW_OR_COMMA
+from metasequoia_java.grammar.token_set import ASSIGN_OPERATOR
+from metasequoia_java.grammar.token_set import BANG_OR_TILDE
+from metasequoia_java.grammar.token_set import BLOCK_STATEMENT_END
+from metasequoia_java.grammar.token_set import CASE_OR_DEFAULT
+from metasequoia_java.grammar.token_set import CAST_FOLLOWER
+from metasequoia_java.grammar.token_set import CATCH_OR_FINALLY
+from metasequoia_java.grammar.token_set import CLASS_INTERFACE_OR_ENUM
+from metasequoia_java.grammar.token_set import CLASS_OR_INTERFACE
+from metasequoia_java.grammar.token_set import DEFINITE_STATEMENT_START
+from metasequoia_java.grammar.token_set import ENUMERATOR_FOLLOWER
+from metasequoia_java.grammar.token_set import ENUMERATOR_UNKNOWN_START
+from metasequoia_java.grammar.token_set import FINAL_OR_MONKEYS_AT
+from metasequoia_java.grammar.token_set import GT_COMPOUND
+from metasequoia_java.grammar.token_set import IDENTIFIER_OR_UNDERSCORE
+from metasequoia_java.grammar.token_set import IDENTIFIER_SUFFIX_START
+from metasequoia_java.grammar.token_set import INT_OR_LONG_DEC_LITERAL
 from metasequoia_java.grammar.token_set import LAX_IDENTIFIER
+from metasequoia_java.grammar.token_set import LAX_IDENTIFIER_OR_LPAREN
+from metasequoia_java.grammar.token_set import LBRACKET_OR_ELLIPSIS
+from metasequoia_java.grammar.token_set import LBRACKET_OR_MONKEYS_AT
+from metasequoia_java.grammar.token_set import LOCAL_SEALED_FOLLOWER
+from metasequoia_java.grammar.token_set import MEMBER_REF_TYPE_ELEMENT
+from metasequoia_java.grammar.token_set import MEMBER_REF_TYPE_FOLLOWER
+from metasequoia_java.grammar.token_set import MODIFIERS_OPT_AFFECTING
+from metasequoia_java.grammar.token_set import PATTERN_TYPE_SKIP
+from metasequoia_java.grammar.token_set import PATTERN_TYPE_START
+from metasequoia_java.grammar.token_set import POSTFIX_INC_DEC
+from metasequoia_java.grammar.token_set import PRIMITIVE_TYPE
+from metasequoia_java.grammar.token_set import RBRACE_OR_EOF
+from metasequoia_java.grammar.token_set import RBRACE_SEMI_OR_EOF
+from metasequoia_java.grammar.token_set import RIGHT_ANGLE_BRACKETS
+from metasequoia_java.grammar.token_set import RPAREN_OR_ARROW
+from metasequoia_java.grammar.token_set import RPAREN_OR_COMMA
+from metasequoia_java.grammar.token_set import SEALED_FOLLOWER
+from metasequoia_java.grammar.token_set import SEMI_OR_DOT
+from metasequoia_java.grammar.token_set import STATEMENT_START
+from metasequoia_java.grammar.token_set import WILDCARD_BOUND
+from metasequoia_java.grammar.token_set import YIELD_EXPRESSION_START
 from metasequoia_java.lexical import LexicalFSM
 from metasequoia_java.lexical import Token
 from metasequoia_java.lexical import TokenKind
+from metasequoia_java.lexical.token_kind import TOKEN_KIND as TK
+
+
+# 没有对应源代码的节点的位置信息（只读映射，在构造节点时通过 ** 解包使用，所以可以共享同一个对象）
+_NO_POSITION_INFO = types.MappingProxyType({"source": None, "start_pos": None, "end_pos": None})
+
+# 中缀表达式解析中使用的运算符优先级（在模块加载时读取一次，避免每次解析表达式时读取枚举类属性）
+_OR_PREC = grammar_enum.OperatorPrecedence.OR_PREC
+_NO_PREC = grammar_enum.OperatorPrecedence.NO_PREC
+_TOKEN_TO_OPERATOR_PRECEDENCE = grammar_hash.TOKEN_TO_OPERATOR_PRECEDENCE
 
 
 class JavaSyntaxError(Exception):
@@ -33,17 +85,26 @@ class JavaParser:
     TODO 待整理各个场景下使用的集合
     """
 
+    __slots__ = (
+        "text", "lexer", "last_token", "token", "token_kind", "token_pos", "mode", "last_mode",
+        "permit_type_annotations_push_back", "type_annotations_pushed_back",
+        "allow_this_ident", "receiver_param", "allow_yield_statement", "allow_records", "allow_sealed_types",
+        "allow_string_folding", "od_stack_supply", "op_stack_supply"
+    )
+
     # 中缀操作符的优先级级别的数量
     INFIX_PRECEDENCE_LEVELS = 10
 
-    def __init__(self, lexer: LexicalFSM, mode: Mode = Mode.NULL):
+    def __init__(self, lexer: LexicalFSM, mode: ParserMode = ParserMode.NULL):
         self.text = lexer.text
         self.lexer = lexer
         self.last_token: Optional[Token] = None  # 上一个 Token
         self.token: Optional[Token] = self.lexer.token(0)  # 当前 Token
+        self.token_kind: TokenKind = self.token.kind  # 当前 Token 的类型（在移动 Token 时同步缓存，避免反复读取 self.token.kind）
+        self.token_pos: int = self.token.pos  # 当前 Token 的开始位置（在移动 Token 时同步缓存，避免反复读取 self.token.pos）
 
-        self.mode: Mode = mode  # 当前解析模式
-        self.last_mode: Mode = Mode.NULL  # 上一个解析模式
+        self.mode: int = int(mode)  # 当前解析模式（ParserMode 的原生整数值）
+        self.last_mode: int = Mode.NULL  # 上一个解析模式（ParserMode 的原生整数值）
 
         # 如果 permit_type_annotations_push_back 为假，那么当解析器遇到额外的注解时会直接抛出错误；否则会将额外的注解存入 type_annotations_push_back 变量中
         self.permit_type_annotations_push_back: bool = False
@@ -72,66 +133,154 @@ class JavaParser:
         self.op_stack_supply: List[List[Optional[Token]]] = []
 
     def next_token(self):
-        self.lexer.next_token()
-        self.last_token, self.token = self.token, self.lexer.token(0)
+        token = self.lexer.next_token()
+        self.last_token = self.token
+        self.token = token
+        self.token_kind = token.kind
+        self.token_pos = token.pos
+
+    def advance(self, n: int):
+        """向后移动 n 个 Token（等价于连续调用 n 次 next_token()，但只更新一次当前 Token 的缓存）"""
+        lexer = self.lexer
+        self.last_token = lexer.token(n - 1)
+        lexer.advance(n)
+        token = lexer.token(0)
+        self.token = token
+        self.token_kind = token.kind
+        self.token_pos = token.pos
+
+    def peek_token(self, lookahead: int, *kinds: Union[TokenKind, FrozenSet[TokenKind]]):
+        """检查从当前位置之后的地 lookahead 开始的元素与 kinds 是否匹配
+
+        kinds 中的元素为单个 TokenKind、TokenKind 的按位或组合或 token_set 中的 frozenset：先直接比较对象标识，不相同时再检查是否
+        包含；前瞻的 Token 类型从词法解析器的类型缓存中读取。
 
-    def peek_token(self, lookahead: int, *kinds: TokenKind):
-        """检查从当前位置之后的地 lookahead 开始的元素与 kinds 是否匹配"""
-        for i, kind in enumerate(kinds):
-            if not self.lexer.token(lookahead + i + 1).kind in kind:
+        Examples
+        --------
+        >>> JavaParser(LexicalFSM("a , b")).peek_token(0, TokenKind.ARROW | TokenKind.COMMA)
+        True
+        >>> JavaParser(LexicalFSM("a , b")).peek_token(0, frozenset({TokenKind.ARROW}))
+        False
+        """
+        lexer_kind = self.lexer.kind
+        for i, kind in enumerate(kinds, lookahead + 1):
+            tk = lexer_kind(i)
+            if tk is not kind and tk not in kind:
                 return False
         return True
 
     def accept(self, kind: TokenKind):
-        if self.token.kind == kind:
+        """如果当前 Token 的类型为 kind 则移动到下一个 Token，否则抛出语法错误
+
+        对于最热的调用位置，调用方会先判断 `self.token_kind is kind` 并直接调用 next_token()，仅在不匹配时调用本方法抛出异常
+        """
+        if self.token_kind is kind:
             self.next_token()
         else:
-            self.raise_syntax_error(self.token.pos, f"expect TokenKind {kind.name}({kind.value}), "
-                                                    f"but get {self.token.kind.name}({self.token.kind.value})")
+            self.raise_syntax_error(self.token_pos, f"expect TokenKind {kind.name}({kind.value}), "
+                                                    f"but get {self.token_kind.name}({self.token_kind.value})")
+
+    def _info_include(self, start_pos: Optional[int]) -> Mapping[str, Any]:
+        """根据开始位置 start_pos 和当前 token 的结束位置（即包含当前 token），获取当前节点的源代码和位置信息
 
-    def _info_include(self, start_pos: Optional[int]) -> Dict[str, Any]:
-        """根据开始位置 start_pos 和当前 token 的结束位置（即包含当前 token），获取当前节点的源代码和位置信息"""
+        节点只包含当前 token 时，直接复用 token 的源代码字符串，不再从原始代码中切片复制（结束符没有源代码，仍使用切片）
+        """
         if start_pos is None:
-            return {"source": None, "start_pos": None, "end_pos": None}
-        end_pos = self.token.end_pos
-        return {
-            "source": self.text[start_pos: end_pos],
-            "start_pos": start_pos,
-            "end_pos": end_pos
-        }
+            return _NO_POSITION_INFO
+        token = self.token
+        end_pos = token.end_pos
+        if start_pos == self.token_pos and (source := token.source) is not None:
+            return {"source": source, "start_pos": start_pos, "end_pos": end_pos}
+        return {"source": self.text[start_pos: end_pos], "start_pos": start_pos, "end_pos": end_pos}
 
     def _info_exclude(self, start_pos: Optional[int]) -> Dict[str, Any]:
-        """根据开始位置 start_pos 和当前 token 的开始位置（即不包含当前 token），获取当前节点的源代码和位置信息"""
-        if start_pos is None:
-            return {"source": None, "start_pos": None, "end_pos": None}
-        if self.last_token is None:
-            return {"source": None, "start_pos": None, "end_pos": None}
-        end_pos = self.last_token.end_pos
-        return {
-            "source": self.text[start_pos: end_pos],
-            "start_pos": start_pos,
-            "end_pos": end_pos
-        }
+        """根据开始位置 start_pos 和当前 token 的开始位置（即不包含当前 token），获取当前节点的源代码和位置信息，计算逻辑见 _span_exclude"""
+        start_pos, end_pos, source = self._span_exclude(start_pos)
+        return {"source": source, "start_pos": start_pos, "end_pos": end_pos}
+
+    def _span_exclude(self, start_pos: Optional[int]) -> Tuple[Optional[int], Optional[int], Optional[str]]:
+        """根据开始位置 start_pos 和当前 token 的开始位置（即不包含当前 token），返回 (start_pos, end_pos, source) 元组
+
+        节点只包含上一个 token 时，直接复用 token 的源代码字符串，不再从原始代码中切片复制（结束符没有源代码，仍使用切片）
+        """
+        last_token = self.last_token
+        if start_pos is None or last_token is None:
+            return None, None, None
+        end_pos = last_token.end_pos
+        if start_pos == last_token.pos and (source := last_token.source) is not None:
+            return start_pos, end_pos, source
+        return start_pos, end_pos, self.text[start_pos: end_pos]
+
+    def _keyword_identifier(self, name: str, start_pos: int) -> ast.Identifier:
+        """构造 this、super 等关键字对应的标识符节点，结束位置为当前 token 的结束位置
+
+        AST 节点是可变的，所以每次出现时仍需构造新节点；但位置信息直接从当前 token 中获取，不再构造中间的位置信息字典
+        """
+        end_pos = self.token.end_pos
+        return ast.Identifier.create(
+            name=name,
+            start_pos=start_pos,
+            end_pos=end_pos,
+            source=self.text[start_pos: end_pos]
+        )
+
+    def _select_member(self, expression: ast.Expression, name: str, pos: Optional[int]) -> ast.MemberSelect:
+        """构造 expression . name 的成员选择节点，标识符的位置信息为 _info_exclude(self.token_pos)，成员选择节点的位置信息为 _info_include(pos)"""
+        return ast.MemberSelect.create(
+            expression=expression,
+            identifier=ast.Identifier.create(
+                name=name,
+                **self._info_exclude(self.token_pos)
+            ),
+            **self._info_include(pos)
+        )
+
+    def _comma_separated(self, parse_element: Callable[[], Any]) -> List[Any]:
+        """解析逗号分隔的一个或多个元素：Element {"," Element}，不处理两侧的括号
+
+        Examples
+        --------
+        >>> parser = JavaParser(LexicalFSM("Class1, Class2"))
+        >>> len(parser._comma_separated(parser.parse_type))
+        2
+        """
+        elements = [parse_element()]
+        append = elements.append
+        kind_comma = TK.COMMA
+        while self.token_kind is kind_comma:
+            self.next_token()
+            append(parse_element())
+        return elements
 
     # ------------------------------ 解析模式相关方法 ------------------------------
 
-    def set_mode(self, mode: Mode):
+    def set_mode(self, mode: int):
         self.mode = mode
 
-    def set_last_mode(self, mode: Mode):
+    def set_last_mode(self, mode: int):
         self.last_mode = mode
 
-    def is_mode(self, mode: Mode):
-        return self.mode & mode
+    def is_mode(self, mode: int) -> bool:
+        """当前解析模式是否包含 mode 中的任一标志
 
-    def was_type_mode(self):
-        return self.last_mode & Mode.TYPE
+        Examples
+        --------
+        >>> JavaParser(LexicalFSM("a"), mode=Mode.EXPR).is_mode(Mode.EXPR)
+        True
+        >>> JavaParser(LexicalFSM("a"), mode=Mode.EXPR).is_mode(Mode.TYPE)
+        False
+        """
+        return (self.mode & mode) != 0
+
+    def was_type_mode(self) -> bool:
+        """上一个解析模式是否包含 TYPE 标志"""
+        return (self.last_mode & Mode.TYPE) != 0
 
     def select_expr_mode(self):
-        self.set_mode((self.mode & Mode.NO_LAMBDA) | Mode.EXPR)  # 如果当前 mode 有 NO_LAMBDA 则保留，并添加 EXPR
+        self.mode = (self.mode & Mode.NO_LAMBDA) | Mode.EXPR  # 如果当前 mode 有 NO_LAMBDA 则保留，并添加 EXPR
 
     def select_type_mode(self):
-        self.set_mode((self.mode & Mode.NO_LAMBDA) | Mode.TYPE)  # 如果当前 mode 有 NO_LAMBDA 则保留，并添加 TYPE
+        self.mode = (self.mode & Mode.NO_LAMBDA) | Mode.TYPE  # 如果当前 mode 有 NO_LAMBDA 则保留，并添加 TYPE
 
     # ------------------------------ 报错信息相关方法 ------------------------------
 
@@ -142,8 +291,8 @@ class JavaParser:
     def illegal(self, pos: Optional[int] = None):
         """报告表达式或类型的非法开始 Token"""
         if pos is None:
-            pos = self.token.pos
-        if self.is_mode(Mode.EXPR):
+            pos = self.token_pos
+        if self.mode & Mode.EXPR:
             self.raise_syntax_error(pos, "IllegalStartOfExpr")
         else:
             self.raise_syntax_error(pos, "IllegalStartOfType")
@@ -166,27 +315,27 @@ class JavaParser:
         --------
         >>> JavaParser(LexicalFSM("abc")).ident()
         'abc'
+        >>> JavaParser(LexicalFSM("_")).ident()
+        '_'
         """
-        if self.token.kind == TokenKind.IDENTIFIER:
-            name = self.token.name
+        # 常见情况（IDENTIFIER 或 UNDERSCORE）放在最前面判断，之后的分支除 this 外均为报错路径
+        tk = self.token_kind
+        if tk is TK.IDENTIFIER or tk is TK.UNDERSCORE:
+            name = self.token.source
             self.next_token()
             return name
-        if self.token.kind == TokenKind.ASSERT:
-            self.raise_syntax_error(self.token.pos, f"AssertAsIdentifier")
-        if self.token.kind == TokenKind.ENUM:
-            self.raise_syntax_error(self.token.pos, f"EnumAsIdentifier")
-        if self.token.kind == TokenKind.THIS:
+        if tk is TK.ASSERT:
+            self.raise_syntax_error(self.token_pos, f"AssertAsIdentifier")
+        if tk is TK.ENUM:
+            self.raise_syntax_error(self.token_pos, f"EnumAsIdentifier")
+        if tk is TK.THIS:
             if self.allow_this_ident:
-                name = self.token.name
+                name = self.token.source
                 self.next_token()
                 return name
             else:
-                self.raise_syntax_error(self.token.pos, f"ThisAsIdentifier")
-        if self.token.kind == TokenKind.UNDERSCORE:
-            name = self.token.name
-            self.next_token()
-            return name
-        self.accept(TokenKind.IDENTIFIER)
+                self.raise_syntax_error(self.token_pos, f"ThisAsIdentifier")
+        self.accept(TK.IDENTIFIER)
         raise JavaSyntaxError(f"{self.token.source} 不能作为 Identifier")
 
     def ident_or_underscore(self) -> str:
@@ -225,31 +374,77 @@ class JavaParser:
         <TreeKind.MEMBER_SELECT: 19>
         >>> JavaParser(LexicalFSM("abc.def")).qualident(False).source
         'abc.def'
-
-        TODO 补充单元测试：allow_annotations = True
+        >>> JavaParser(LexicalFSM("java.@Ann util")).qualident(True).kind
+        <TreeKind.ANNOTATION_TYPE: 108>
+        >>> JavaParser(LexicalFSM("java.@Ann util")).qualident(True).source
+        'java.@Ann util'
         """
-        pos = self.token.pos
-        expression: ast.Expression = ast.Identifier.create(
-            name=self.ident(),
-            **self._info_exclude(pos)
+        pos = self.token_pos
+        text = self.text
+        create_identifier = ast.Identifier.create
+        create_member_select = ast.MemberSelect.create
+        name = self.ident()
+        expression: ast.Expression = create_identifier(
+            name=name,
+            start_pos=pos,
+            end_pos=self.last_token.end_pos,
+            source=name  # 标识符节点只包含一个 Token，其源代码即为名称
         )
-        while self.token.kind == TokenKind.DOT:
+
+        # 不允许注解时（绝大多数调用场景）不需要检查类型注解，单独使用更紧凑的循环；位置信息直接传入，不构造中间的位置信息字典
+        if not allow_annotations:
+            kind_dot = TK.DOT
+            next_token = self.next_token
+            ident = self.ident
+            while self.token_kind is kind_dot:
+                next_token()
+                name = ident()
+                end_pos = self.last_token.end_pos
+                identifier: ast.Identifier = create_identifier(
+                    name=name,
+                    start_pos=pos,
+                    end_pos=end_pos,
+                    source=text[pos: end_pos]
+                )
+                end_pos = self.token.end_pos
+                expression = create_member_select(
+                    expression=expression,
+                    identifier=identifier,
+                    start_pos=pos,
+                    end_pos=end_pos,
+                    source=text[pos: end_pos]
+                )
+            return expression
+
+        # 允许注解时同样直接传入位置信息：pos 为限定名称的开始位置，在循环中不会与当前或上一个 token 的开始位置相同，位置信息字典中的
+        # 源代码总是从原始代码中切片得到
+        while self.token_kind is TK.DOT:
             self.next_token()
-            type_annotations = self.type_annotations_opt() if allow_annotations is True else None
-            identifier: ast.Identifier = ast.Identifier.create(
-                name=self.ident(),
-                **self._info_exclude(pos)
+            type_annotations = self.type_annotations_opt()
+            name = self.ident()
+            end_pos = self.last_token.end_pos
+            identifier: ast.Identifier = create_identifier(
+                name=name,
+                start_pos=pos,
+                end_pos=end_pos,
+                source=text[pos: end_pos]
             )
-            expression = ast.MemberSelect.create(
+            end_pos = self.token.end_pos
+            source = text[pos: end_pos]
+            expression = create_member_select(
                 expression=expression,
                 identifier=identifier,
-                **self._info_include(pos)
+                start_pos=pos,
+                end_pos=end_pos,
+                source=source
             )
             if type_annotations:
                 expression = ast.AnnotatedType.create(
                     annotations=type_annotations,
                     underlying_type=expression,
-                    **self._info_include(pos)
+                    start_pos=pos,
+                    end_pos=end_pos,
+                    source=source
                 )
         return expression
 
@@ -278,55 +473,81 @@ class JavaParser:
           | FALSE
           | NULL
         """
-        pos = self.token.pos
-        if self.token.kind in {TokenKind.INT_OCT_LITERAL, TokenKind.INT_DEC_LITERAL, TokenKind.INT_HEX_LITERAL}:
+        # 字面值节点的位置即为当前 Token 的位置，直接传入位置信息，不构造中间的位置信息字典
+        token = self.token
+        tk = self.token_kind
+        pos = self.token_pos
+        end_pos = token.end_pos
+        source = token.source
+        # 整数字面值的类型同时决定了进制样式，使用一次字典查询同时完成类型判断和样式获取
+        if (style := INT_LITERAL_STYLE_HASH.get(tk)) is not None:
             literal = ast.IntLiteral.create(
-                style=INT_LITERAL_STYLE_HASH[self.token.kind],
-                value=self.token.int_value(),
-                **self._info_include(pos)
+                style=style,
+                value=token.int_value(),
+                start_pos=pos,
+                end_pos=end_pos,
+                source=source
             )
-        elif self.token.kind in {TokenKind.LONG_OCT_LITERAL, TokenKind.LONG_DEC_LITERAL, TokenKind.LONG_HEX_LITERAL}:
+        elif (style := LONG_LITERAL_STYLE_HASH.get(tk)) is not None:
             literal = ast.LongLiteral.create(
-                style=LONG_LITERAL_STYLE_HASH[self.token.kind],
-                value=self.token.int_value(),
-                **self._info_include(pos)
+                style=style,
+                value=token.int_value(),
+                start_pos=pos,
+                end_pos=end_pos,
+                source=source
             )
-        elif self.token.kind == TokenKind.FLOAT_LITERAL:
+        elif tk is TK.FLOAT_LITERAL:
             literal = ast.FloatLiteral.create(
-                value=self.token.float_value(),
-                **self._info_include(pos)
+                value=token.float_value(),
+                start_pos=pos,
+                end_pos=end_pos,
+                source=source
             )
-        elif self.token.kind == TokenKind.DOUBLE_LITERAL:
+        elif tk is TK.DOUBLE_LITERAL:
             literal = ast.DoubleLiteral.create(
-                value=self.token.float_value(),
-                **self._info_include(pos)
+                value=token.float_value(),
+                start_pos=pos,
+                end_pos=end_pos,
+                source=source
             )
-        elif self.token.kind == TokenKind.TRUE:
+        elif tk is TK.TRUE:
             literal = ast.TrueLiteral.create(
-                **self._info_include(pos)
+                start_pos=pos,
+                end_pos=end_pos,
+                source=source
             )
-        elif self.token.kind == TokenKind.FALSE:
+        elif tk is TK.FALSE:
             literal = ast.FalseLiteral.create(
-                **self._info_include(pos)
+                start_pos=pos,
+                end_pos=end_pos,
+                source=source
             )
-        elif self.token.kind == TokenKind.CHAR_LITERAL:
+        elif tk is TK.CHAR_LITERAL:
             literal = ast.CharacterLiteral.create(
-                value=self.token.char_value(),
-                **self._info_include(pos)
+                value=token.char_value(),
+                start_pos=pos,
+                end_pos=end_pos,
+                source=source
             )
-        elif self.token.kind == TokenKind.STRING_LITERAL:
+        elif tk is TK.STRING_LITERAL:
             literal = ast.StringLiteral.create_string(
-                value=self.token.string_value(),
-                **self._info_include(pos)
+                value=token.string_value(),
+                start_pos=pos,
+                end_pos=end_pos,
+                source=source
             )
-        elif self.token.kind == TokenKind.TEXT_BLOCK:
+        elif tk is TK.TEXT_BLOCK:
             literal = ast.StringLiteral.create_text_block(
-                value=self.token.string_value(),
-                **self._info_include(pos)
+                value=token.string_value(),
+                start_pos=pos,
+                end_pos=end_pos,
+                source=source
             )
-        elif self.token.kind == TokenKind.NULL:
+        elif tk is TK.NULL:
             literal = ast.NullLiteral.create(
-                **self._info_include(pos)
+                start_pos=pos,
+                end_pos=end_pos,
+                source=source
             )
         else:
             raise JavaSyntaxError(f"{self.token.source} 不是字面值")
@@ -351,8 +572,17 @@ class JavaParser:
           AssignmentExpression
 
         [JDK Code] JavacParser.parseExpression
+
+        等价于 term(Mode.EXPR)：因为每个实参、初始化值都会调用本方法，所以直接展开 term 的逻辑以减少一层调用
         """
-        return self.term(Mode.EXPR)
+        prev_mode = self.mode
+        self.mode = Mode.EXPR
+        expression = self.term1()
+        if self.token_kind in ASSIGN_OPERATOR and self.mode & Mode.EXPR:
+            expression = self.term_rest(expression)
+        self.last_mode = self.mode
+        self.mode = prev_mode
+        return expression
 
     def parse_pattern(self, pos: int, modifiers: Optional[ast.Modifiers],
                       parsed_type: Optional[ast.Expression],
@@ -392,12 +622,12 @@ class JavaParser:
         if modifiers is None:
             modifiers = self.opt_final([])
 
-        if self.token.kind == TokenKind.UNDERSCORE and parsed_type is None:
+        if self.token_kind is TK.UNDERSCORE and parsed_type is None:
             self.next_token()
-            return ast.AnyPattern.create(**self._info_exclude(self.token.pos))
+            return ast.AnyPattern.create(**self._info_exclude(self.token_pos))
 
         if parsed_type is None:
-            var = (self.token.kind == TokenKind.IDENTIFIER and self.token.name == "var")
+            var = (self.token_kind is TK.IDENTIFIER and self.token.name == "var")
             expression = self.unannotated_type(allow_var=allow_var, new_mode=Mode.TYPE | Mode.NO_LAMBDA)
             if var is True:
                 expression = None
@@ -405,17 +635,17 @@ class JavaParser:
             expression = parsed_type
 
         # ReferenceType ( [ComponentPatternList] )
-        if self.token.kind == TokenKind.LPAREN:
+        if self.token_kind is TK.LPAREN:
             nested: List[ast.Pattern] = []
-            if self.peek_token(0, TokenKind.RPAREN):
+            if self.peek_token(0, TK.RPAREN):
                 self.next_token()
             else:
                 while True:
                     self.next_token()
-                    nested.append(self.parse_pattern(self.token.pos, None, None, True, False))
-                    if self.token.kind != TokenKind.COMMA:
+                    nested.append(self.parse_pattern(self.token_pos, None, None, True, False))
+                    if self.token_kind is not TK.COMMA:
                         break
-            self.accept(TokenKind.RPAREN)
+            self.accept(TK.RPAREN)
             # TODO 待补充检查逻辑
             return ast.DeconstructionPattern.create(
                 deconstructor=expression,
@@ -423,7 +653,7 @@ class JavaParser:
                 **self._info_exclude(pos)
             )
 
-        var_pos = self.token.pos
+        var_pos = self.token_pos
         name: str = self.ident_or_underscore()
         # TODO 待考虑补充特性逻辑
         variable = ast.Variable.create_by_name(
@@ -496,7 +726,7 @@ class JavaParser:
             已经解析的注解
         """
         if pos is None:
-            pos = self.token.pos
+            pos = self.token_pos
         if annotations is None:
             annotations = self.type_annotations_opt()
 
@@ -524,18 +754,22 @@ class JavaParser:
         >>> JavaParser(LexicalFSM(" & type2")).parse_intersection_type(0, ast.Expression.mock()).kind.name
         'INTERSECTION_TYPE'
         """
+        kind_amp = TK.AMP
+        if self.token_kind is not kind_amp:
+            return first_type
         bounds = [first_type]
-        while self.token.kind == TokenKind.AMP:
-            self.accept(TokenKind.AMP)
-            bounds.append(self.parse_type())
-        if len(bounds) > 1:
-            return ast.IntersectionType.create(
-                bounds=bounds,
-                **self._info_include(pos)
-            )
-        return first_type
+        append = bounds.append
+        parse_type = self.parse_type
+        next_token = self.next_token
+        while self.token_kind is kind_amp:
+            next_token()
+            append(parse_type())
+        return ast.IntersectionType.create(
+            bounds=bounds,
+            **self._info_include(pos)
+        )
 
-    def unannotated_type(self, allow_var: bool = False, new_mode: Optional[Mode] = Mode.TYPE) -> ast.Expression:
+    def unannotated_type(self, allow_var: bool = False, new_mode: Optional[int] = Mode.TYPE) -> ast.Expression:
         """解析不包含注解的类型
 
         [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
@@ -578,7 +812,7 @@ class JavaParser:
             self.raise_syntax_error(result.start_pos, f"RestrictedTypeNotAllowedHere, but get {result.kind.name}")
         return result
 
-    def term(self, new_mode: Optional[Mode] = None) -> ast.Expression:
+    def term(self, new_mode: Optional[int] = None) -> ast.Expression:
         """解析第 0 层级语法元素
 
         [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
@@ -620,19 +854,15 @@ class JavaParser:
         prev_mode = None
         if new_mode is not None:
             prev_mode = self.mode
-            self.set_mode(new_mode)
+            self.mode = new_mode
 
         expression = self.term1()
-        if (self.is_mode(Mode.EXPR)
-                and self.token.kind in {TokenKind.EQ, TokenKind.PLUS_EQ, TokenKind.SUB_EQ, TokenKind.STAR_EQ,
-                                        TokenKind.SLASH_EQ, TokenKind.AMP_EQ, TokenKind.BAR_EQ, TokenKind.CARET_EQ,
-                                        TokenKind.PERCENT_EQ, TokenKind.LT_LT_EQ, TokenKind.GT_GT_EQ,
-                                        TokenKind.GT_GT_GT_EQ}):
+        if self.mode & Mode.EXPR and self.token_kind in ASSIGN_OPERATOR:
             expression = self.term_rest(expression)
 
         if new_mode is not None:
-            self.set_last_mode(self.mode)
-            self.set_mode(prev_mode)
+            self.last_mode = self.mode
+            self.mode = prev_mode
 
         return expression
 
@@ -641,8 +871,8 @@ class JavaParser:
 
         [JDK Code] JavacParser.termRest(JCExpression)
         """
-        if self.token.kind == TokenKind.EQ:
-            pos = self.token.pos
+        if self.token_kind is TK.EQ:
+            pos = self.token_pos
             self.next_token()
             self.select_expr_mode()
             expression_1 = self.term()
@@ -651,11 +881,9 @@ class JavaParser:
                 expression=expression_1,
                 **self._info_exclude(pos)
             )
-        elif self.token.kind in {TokenKind.PLUS_EQ, TokenKind.SUB_EQ, TokenKind.STAR_EQ, TokenKind.SLASH_EQ,
-                                 TokenKind.AMP_EQ, TokenKind.BAR_EQ, TokenKind.CARET_EQ, TokenKind.PERCENT_EQ,
-                                 TokenKind.LT_LT_EQ, TokenKind.GT_GT_EQ, TokenKind.GT_GT_GT_EQ}:
-            pos = self.token.pos
-            tk = self.token.kind
+        elif self.token_kind in grammar_hash.ASSIGN_OPERATOR_TO_TREE_KIND:
+            pos = self.token_pos
+            tk = self.token_kind
             self.next_token()
             self.select_expr_mode()
             expression_1 = self.term()
@@ -688,7 +916,7 @@ class JavaParser:
         'CONDITIONAL_EXPRESSION'
         """
         expression = self.term2()
-        if self.is_mode(Mode.EXPR) and self.token.kind == TokenKind.QUES:
+        if self.mode & Mode.EXPR and self.token_kind is TK.QUES:
             self.select_expr_mode()
             return self.term1_rest(expression)
         else:
@@ -700,11 +928,11 @@ class JavaParser:
         [JDK Code] JavacParser.term1Rest
         Expression1Rest = ["?" Expression ":" Expression1]
         """
-        if self.token.kind == TokenKind.QUES:
-            pos = self.token.pos
+        if self.token_kind is TK.QUES:
+            pos = self.token_pos
             self.next_token()
             expression_1 = self.term()
-            self.accept(TokenKind.COLON)
+            self.accept(TK.COLON)
             expression_2 = self.term1()
             return ast.ConditionalExpression.create(
                 condition=expression,
@@ -804,9 +1032,9 @@ class JavaParser:
         'INTERSECTION_TYPE'
         """
         expression = self.term3()
-        if self.is_mode(Mode.EXPR) and self.prec(self.token.kind) >= grammar_enum.OperatorPrecedence.OR_PREC:
+        if self.mode & Mode.EXPR and _TOKEN_TO_OPERATOR_PRECEDENCE.get(self.token_kind, _NO_PREC) >= _OR_PREC:
             self.select_expr_mode()
-            return self.term2_rest(expression, grammar_enum.OperatorPrecedence.OR_PREC)
+            return self.term2_rest(expression, _OR_PREC)
         return expression
 
     def term2_rest(self, expression: ast.Expression,
@@ -834,27 +1062,28 @@ class JavaParser:
         top = 0
         od_stack[0] = expression
         top_op = Token.dummy()
-        while self.prec(self.token.kind) >= min_prec:
+        precedence = _TOKEN_TO_OPERATOR_PRECEDENCE.get
+        while precedence(self.token_kind, _NO_PREC) >= min_prec:
             op_stack[top] = top_op
 
             # instanceof
-            if self.token.kind == TokenKind.INSTANCEOF:
-                pos = self.token.pos
+            if self.token_kind is TK.INSTANCEOF:
+                pos = self.token_pos
                 self.next_token()
 
-                if self.token.kind == TokenKind.LPAREN:
-                    pattern = self.parse_pattern(self.token.pos, None, None, False, False)
+                if self.token_kind is TK.LPAREN:
+                    pattern = self.parse_pattern(self.token_pos, None, None, False, False)
                 else:
-                    pattern_pos = self.token.pos
+                    pattern_pos = self.token_pos
                     modifiers = self.opt_final([])
                     instance_type = self.unannotated_type(allow_var=False)
-                    if self.token.kind == TokenKind.IDENTIFIER:
+                    if self.token_kind is TK.IDENTIFIER:
                         # TODO 待增加验证逻辑
                         pattern = self.parse_pattern(pattern_pos, modifiers, instance_type, False, False)
-                    elif self.token.kind == TokenKind.LPAREN:
+                    elif self.token_kind is TK.LPAREN:
                         pattern = self.parse_pattern(pattern_pos, modifiers, instance_type, False, False)
                         # TODO 待增加验证逻辑
-                    elif self.token.kind == TokenKind.UNDERSCORE:
+                    elif self.token_kind is TK.UNDERSCORE:
                         pattern = self.parse_pattern(pattern_pos, modifiers, instance_type, False, False)
                     else:
                         if modifiers.annotations:
@@ -887,12 +1116,16 @@ class JavaParser:
                 top += 1
                 od_stack[top] = self.term3()
 
-            while top > 0 and self.prec(top_op.kind) >= self.prec(self.token.kind):  # 上一个运算符的优先级大于等于下一个运算符的优先级
+            while top > 0 and precedence(top_op.kind, _NO_PREC) >= precedence(self.token_kind, _NO_PREC):  # 上一个运算符的优先级大于等于下一个运算符的优先级
+                left_operand = od_stack[top - 1]
+                start_pos, end_pos, source = self._span_exclude(left_operand.start_pos)
                 od_stack[top - 1] = ast.Binary.create(
                     kind=grammar_hash.BINARY_OPERATOR_TO_TREE_KIND[top_op.kind],
-                    left_operand=od_stack[top - 1],
+                    left_operand=left_operand,
                     right_operand=od_stack[top],
-                    **self._info_exclude(od_stack[top - 1].start_pos)
+                    start_pos=start_pos,
+                    end_pos=end_pos,
+                    source=source
                 )
                 top -= 1
                 top_op = op_stack[top]
@@ -1108,445 +1341,459 @@ class JavaParser:
         >>> JavaParser(LexicalFSM("List<String>"), mode=Mode.EXPR).term3().kind.name
         'PARAMETERIZED_TYPE'
         """
-        pos = self.token.pos
+        pos = self.token_pos
         type_args = self.type_argument_list_opt()
+        handler = _TERM3_DISPATCH.get(self.token_kind)
+        if handler is None:
+            self.raise_syntax_error(self.token_pos, f"无法解析为 term3 的 Token 元素: {self.token_kind.name}")
+        return handler(self, pos, type_args)
+
+    def _term3_ques(self, pos: int, type_args: Optional[List[ast.Expression]]) -> ast.Expression:
+        """类型实参中的通配符"""
+        mode = self.mode
+        if mode & Mode.TYPE and mode & Mode.TYPE_ARG and not mode & Mode.NO_PARAMS:
+            self.select_type_mode()
+            return self.type_argument()
+        self.illegal()
 
-        # 类型实参
-        if self.token.kind == TokenKind.QUES:
-            if self.is_mode(Mode.TYPE) and self.is_mode(Mode.TYPE_ARG) and not self.is_mode(Mode.NO_PARAMS):
-                self.select_type_mode()
-                return self.type_argument()
-            self.illegal()
+    def _term3_unary(self, pos: int, type_args: Optional[List[ast.Expression]]) -> ast.Expression:
+        """一元表达式
 
-        # 一元表达式
-        # [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
-        # UnaryExpression:
-        #   PreIncrementExpression
-        #   PreDecrementExpression
-        #   + UnaryExpression
-        #   - UnaryExpression
-        #   UnaryExpressionNotPlusMinus
-        #
-        # PreIncrementExpression:
-        #   ++ UnaryExpression
-        #
-        # PreDecrementExpression:
-        #   -- UnaryExpression
-        #
-        # UnaryExpressionNotPlusMinus:
-        #   PostfixExpression
-        #   ~ UnaryExpression
-        #   ! UnaryExpression
-        #   CastExpression 【不包含】
-        #   SwitchExpression 【不包含】
-        if self.token.kind in {TokenKind.PLUS_PLUS, TokenKind.SUB_SUB, TokenKind.BANG, TokenKind.TILDE, TokenKind.PLUS,
-                               TokenKind.SUB}:
-            if type_args is not None and self.is_mode(Mode.EXPR):
-                self.raise_syntax_error(pos, "Illegal")  # TODO 待增加说明信息
-            tk = self.token.kind
-            self.next_token()
+        [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
+        UnaryExpression:
+          PreIncrementExpression
+          PreDecrementExpression
+          + UnaryExpression
+          - UnaryExpression
+          UnaryExpressionNotPlusMinus
+
+        PreIncrementExpression:
+          ++ UnaryExpression
+
+        PreDecrementExpression:
+          -- UnaryExpression
+
+        UnaryExpressionNotPlusMinus:
+          PostfixExpression
+          ~ UnaryExpression
+          ! UnaryExpression
+          CastExpression 【不包含】
+          SwitchExpression 【不包含】
+        """
+        if type_args is not None and self.mode & Mode.EXPR:
+            self.raise_syntax_error(pos, "Illegal")  # TODO 待增加说明信息
+        tk = self.token_kind
+        self.next_token()
+        self.select_expr_mode()
+        if tk is TK.SUB and self.token_kind in INT_OR_LONG_DEC_LITERAL:
             self.select_expr_mode()
-            if tk == TokenKind.SUB and self.token.kind in {TokenKind.INT_DEC_LITERAL, TokenKind.LONG_DEC_LITERAL}:
-                self.select_expr_mode()
-                return self.term3_rest(self.literal(), type_args)
+            return self.term3_rest(self.literal(), type_args)
 
-            expression = self.term3()
-            return ast.Unary.create(
-                kind=grammar_hash.UNARY_OPERATOR_TO_TREE_KIND[tk],
-                expression=expression,
-                **self._info_include(pos)
-            )
+        expression = self.term3()
+        return ast.Unary.create(
+            kind=grammar_hash.UNARY_OPERATOR_TO_TREE_KIND[tk],
+            expression=expression,
+            **self._info_include(pos)
+        )
 
-        if self.token.kind == TokenKind.LPAREN:
-            if type_args is not None and self.is_mode(Mode.EXPR):
-                raise JavaSyntaxError("语法不合法")
-            pres: ParensResult = self.analyze_parens()
+    def _term3_parens(self, pos: int, type_args: Optional[List[ast.Expression]]) -> ast.Expression:
+        """括号开头的强制类型转换、lambda 表达式或括号表达式"""
+        if type_args is not None and self.mode & Mode.EXPR:
+            raise JavaSyntaxError("语法不合法")
+        return _PARENS_DISPATCH[self.analyze_parens()](self, pos, type_args)
 
-            # [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
-            # CastExpression:
-            #   ( PrimitiveType ) UnaryExpression
-            #   ( ReferenceType {AdditionalBound} ) UnaryExpressionNotPlusMinus
-            #   ( ReferenceType {AdditionalBound} ) LambdaExpression
-            if pres == ParensResult.CAST:
-                self.accept(TokenKind.LPAREN)
-                self.select_type_mode()
-                cast_type = self.parse_intersection_type(pos, self.parse_type())
-                self.accept(TokenKind.RPAREN)
-                self.select_expr_mode()
-                expression = self.term3()
-                return ast.TypeCast.create(
-                    cast_type=cast_type,
-                    expression=expression,
-                    **self._info_include(pos)
-                )
+    def _parens_cast(self, pos: int, type_args: Optional[List[ast.Expression]]) -> ast.Expression:
+        """强制类型转换
 
-            # lambda 表达式
-            if pres == ParensResult.IMPLICIT_LAMBDA:
-                expression = self.lambda_expression_or_statement(True, False, pos)
-            elif pres == ParensResult.EXPLICIT_LAMBDA:
-                expression = self.lambda_expression_or_statement(True, True, pos)
+        [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
+        CastExpression:
+          ( PrimitiveType ) UnaryExpression
+          ( ReferenceType {AdditionalBound} ) UnaryExpressionNotPlusMinus
+          ( ReferenceType {AdditionalBound} ) LambdaExpression
+        """
+        self.accept(TK.LPAREN)
+        self.select_type_mode()
+        cast_type = self.parse_intersection_type(pos, self.parse_type())
+        self.accept(TK.RPAREN)
+        self.select_expr_mode()
+        expression = self.term3()
+        return ast.TypeCast.create(
+            cast_type=cast_type,
+            expression=expression,
+            **self._info_include(pos)
+        )
 
-            # 括号表达式
-            else:  # ParensResult.PARENS
-                self.accept(TokenKind.LPAREN)
-                self.select_expr_mode()
-                expression = self.term_rest(self.term1_rest(self.term2_rest(self.term3(),
-                                                                            grammar_enum.OperatorPrecedence.OR_PREC)))
-                self.accept(TokenKind.RPAREN)
-                expression = ast.Parenthesized.create(
-                    expression=expression,
-                    **self._info_exclude(pos)
-                )
-            return self.term3_rest(expression, type_args)
+    def _parens_implicit_lambda(self, pos: int, type_args: Optional[List[ast.Expression]]) -> ast.Expression:
+        """隐式参数的 lambda 表达式"""
+        expression = self.lambda_implicit_expression_or_statement(True, pos)
+        return self.term3_rest(expression, type_args)
 
-        # PrimaryNoNewArray:
-        #   this
-        if self.token.kind == TokenKind.THIS:
-            if not self.is_mode(Mode.EXPR):
-                self.raise_syntax_error(self.token.pos, "illegal")
-            self.select_expr_mode()
-            expression = ast.Identifier.create(
-                name="this",
-                **self._info_include(pos)
-            )
-            self.next_token()
-            if type_args is None:
-                expression = self.arguments_opt(None, expression)
-            else:
-                expression = self.arguments(type_args, expression)
-            return self.term3_rest(expression, None)
+    def _parens_explicit_lambda(self, pos: int, type_args: Optional[List[ast.Expression]]) -> ast.Expression:
+        """显式参数的 lambda 表达式"""
+        expression = self.lambda_explicit_expression_or_statement(pos)
+        return self.term3_rest(expression, type_args)
 
-        # MethodReference:
-        #   super :: [TypeArguments] Identifier
-        if self.token.kind == TokenKind.SUPER:
-            if not self.is_mode(Mode.EXPR):
-                self.raise_syntax_error(self.token.pos, "illegal")
-            self.select_expr_mode()
-            expression = ast.Identifier.create(
-                name="super",
-                **self._info_include(pos)
-            )
-            expression = self.super_suffix(type_args, expression)
-            return self.term3_rest(expression, None)
+    def _parens_plain(self, pos: int, type_args: Optional[List[ast.Expression]]) -> ast.Expression:
+        """括号表达式"""
+        self.accept(TK.LPAREN)
+        self.select_expr_mode()
+        expression = self.term_rest(self.term1_rest(self.term2_rest(self.term3(), _OR_PREC)))
+        self.accept(TK.RPAREN)
+        expression = ast.Parenthesized.create(
+            expression=expression,
+            **self._info_exclude(pos)
+        )
+        return self.term3_rest(expression, type_args)
 
-        # PrimaryNoNewArray:
-        #   Literal
-        if self.token.kind in {TokenKind.INT_OCT_LITERAL, TokenKind.INT_DEC_LITERAL, TokenKind.INT_HEX_LITERAL,
-                               TokenKind.LONG_OCT_LITERAL, TokenKind.LONG_DEC_LITERAL, TokenKind.LONG_HEX_LITERAL,
-                               TokenKind.FLOAT_LITERAL, TokenKind.DOUBLE_LITERAL, TokenKind.CHAR_LITERAL,
-                               TokenKind.STRING_LITERAL, TokenKind.TRUE, TokenKind.FALSE, TokenKind.NULL}:
-            if type_args is not None or not self.is_mode(Mode.EXPR):
-                self.illegal(self.token.pos)
-            expression = self.literal()
-            return self.term3_rest(expression, None)
+    def _term3_this(self, pos: int, type_args: Optional[List[ast.Expression]]) -> ast.Expression:
+        """this 及显式构造器调用
 
-        if self.token.kind == TokenKind.NEW:
-            # [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
-            # UnqualifiedClassInstanceCreationExpression:
-            #   new [TypeArguments] ClassOrInterfaceTypeToInstantiate ( [ArgumentList] ) [ClassBody]
-            #
-            # ArrayCreationExpression:
-            #   ArrayCreationExpressionWithoutInitializer
-            #   ArrayCreationExpressionWithInitializer
-            #
-            # ArrayCreationExpressionWithoutInitializer:
-            #   new PrimitiveType DimExprs [Dims]
-            #   new ClassOrInterfaceType DimExprs [Dims]
-            #
-            # ArrayCreationExpressionWithInitializer:
-            #   new PrimitiveType Dims ArrayInitializer
-            #   new ClassOrInterfaceType Dims ArrayInitializer
-            if type_args is not None or not self.is_mode(Mode.EXPR):
-                self.illegal(self.token.pos)
-            self.select_expr_mode()
-            self.next_token()
-            if self.token.kind == TokenKind.LT:
-                type_args = self.type_argument_list(False)
-            expression = self.creator(pos, type_args)
-            return self.term3_rest(expression, None)
+        PrimaryNoNewArray:
+          this
+        """
+        if not self.mode & Mode.EXPR:
+            self.raise_syntax_error(self.token_pos, "illegal")
+        self.select_expr_mode()
+        expression = self._keyword_identifier("this", pos)
+        self.next_token()
+        if type_args is None:
+            expression = self.arguments_opt(None, expression)
+        else:
+            expression = self.arguments(type_args, expression)
+        return self.term3_rest(expression, None)
 
-        # 可能是有注解的强制类型转换（annotated cast types），或方法引用（method references）
-        if self.token.kind == TokenKind.MONKEYS_AT:
-            type_annotations = self.type_annotations_opt()
-            if not type_annotations:
-                self.raise_syntax_error(self.token.pos, "expected type annotations, but found none!")
-
-            expression = self.term3()
-            if not self.is_mode(Mode.TYPE):
-                if expression.kind == TreeKind.MEMBER_REFERENCE:
-                    assert isinstance(expression, ast.MemberReference)
-                    expression.expression = ast.AnnotatedType.create(
-                        annotations=type_annotations,
-                        underlying_type=expression.expression,
-                        **self._info_exclude(self.token.pos)
-                    )
-                    return self.term3_rest(expression, type_args)
-                elif expression.kind == TreeKind.MEMBER_SELECT:
-                    # TODO 待增加日志中的失败信息：NoAnnotationsOnDotClass
-                    return expression
-                else:
-                    self.illegal(type_annotations[0].start_pos)
-            else:
-                # TODO 考虑是否需要增加 insertAnnotationsToMostInner 的逻辑
-                expression = ast.AnnotatedType.create(
+    def _term3_super(self, pos: int, type_args: Optional[List[ast.Expression]]) -> ast.Expression:
+        """super 开头的字段访问、方法调用或方法引用
+
+        MethodReference:
+          super :: [TypeArguments] Identifier
+        """
+        if not self.mode & Mode.EXPR:
+            self.raise_syntax_error(self.token_pos, "illegal")
+        self.select_expr_mode()
+        expression = self._keyword_identifier("super", pos)
+        expression = self.super_suffix(type_args, expression)
+        return self.term3_rest(expression, None)
+
+    def _term3_literal(self, pos: int, type_args: Optional[List[ast.Expression]]) -> ast.Expression:
+        """字面值
+
+        PrimaryNoNewArray:
+          Literal
+        """
+        if type_args is not None or not self.mode & Mode.EXPR:
+            self.illegal(self.token_pos)
+        expression = self.literal()
+        return self.term3_rest(expression, None)
+
+    def _term3_new(self, pos: int, type_args: Optional[List[ast.Expression]]) -> ast.Expression:
+        """类实例创建表达式或数组创建表达式"""
+        # [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
+        # UnqualifiedClassInstanceCreationExpression:
+        #   new [TypeArguments] ClassOrInterfaceTypeToInstantiate ( [ArgumentList] ) [ClassBody]
+        #
+        # ArrayCreationExpression:
+        #   ArrayCreationExpressionWithoutInitializer
+        #   ArrayCreationExpressionWithInitializer
+        #
+        # ArrayCreationExpressionWithoutInitializer:
+        #   new PrimitiveType DimExprs [Dims]
+        #   new ClassOrInterfaceType DimExprs [Dims]
+        #
+        # ArrayCreationExpressionWithInitializer:
+        #   new PrimitiveType Dims ArrayInitializer
+        #   new ClassOrInterfaceType Dims ArrayInitializer
+        if type_args is not None or not self.mode & Mode.EXPR:
+            self.illegal(self.token_pos)
+        self.select_expr_mode()
+        self.next_token()
+        if self.token_kind is TK.LT:
+            type_args = self.type_argument_list(False)
+        expression = self.creator(pos, type_args)
+        return self.term3_rest(expression, None)
+
+    def _term3_annotated(self, pos: int, type_args: Optional[List[ast.Expression]]) -> ast.Expression:
+        """可能是有注解的强制类型转换（annotated cast types），或方法引用（method references）"""
+        type_annotations = self.type_annotations_opt()
+        if not type_annotations:
+            self.raise_syntax_error(self.token_pos, "expected type annotations, but found none!")
+
+        expression = self.term3()
+        if not self.mode & Mode.TYPE:
+            if expression.kind == TreeKind.MEMBER_REFERENCE:
+                assert isinstance(expression, ast.MemberReference)
+                expression.expression = ast.AnnotatedType.create(
                     annotations=type_annotations,
-                    underlying_type=expression,
-                    **self._info_include(None)
+                    underlying_type=expression.expression,
+                    **self._info_exclude(self.token_pos)
                 )
                 return self.term3_rest(expression, type_args)
+            elif expression.kind == TreeKind.MEMBER_SELECT:
+                # TODO 待增加日志中的失败信息：NoAnnotationsOnDotClass
+                return expression
+            else:
+                self.illegal(type_annotations[0].start_pos)
+        else:
+            # TODO 考虑是否需要增加 insertAnnotationsToMostInner 的逻辑
+            expression = ast.AnnotatedType.create(
+                annotations=type_annotations,
+                underlying_type=expression,
+                **self._info_include(None)
+            )
+            return self.term3_rest(expression, type_args)
 
-        if self.token.kind in {TokenKind.UNDERSCORE, TokenKind.IDENTIFIER, TokenKind.ASSERT, TokenKind.ENUM}:
-            if type_args is not None:
-                self.illegal()
+    def _term3_identifier(self, pos: int, type_args: Optional[List[ast.Expression]]) -> ast.Expression:
+        """标识符开头的表达式或类型"""
+        if type_args is not None:
+            self.illegal()
+
+        # 没有括号的、且只有 1 个参数的 lambda 表达式；模式只在之后的 select_*_mode 调用中改变，所以在此处读取一次即可
+        mode = self.mode
+        if mode & Mode.EXPR and not mode & Mode.NO_LAMBDA and self.peek_token(0, TK.ARROW):
+            expression = self.lambda_implicit_expression_or_statement(False, pos)
+            expression = self.type_arguments_opt(expression)
+            return self.term3_rest(expression, None)
 
-            # 没有括号的、且只有 1 个参数的 lambda 表达式
-            if self.is_mode(Mode.EXPR) and not self.is_mode(Mode.NO_LAMBDA) and self.peek_token(0, TokenKind.ARROW):
-                expression = self.lambda_expression_or_statement(has_parens=False, explicit_params=False, pos=pos)
-                expression = self.type_arguments_opt(expression)
-                return self.term3_rest(expression, None)
+        # 将当前元素当作标识符处理
+        name = self.ident()
+        expression = ast.Identifier.create(
+            name=name,
+            start_pos=pos,
+            end_pos=self.last_token.end_pos,
+            source=name  # 标识符节点只包含一个 Token，其源代码即为名称
+        )
+        while True:
+            pos = self.token_pos
+            annotations = self.type_annotations_opt()
+            tk = self.token_kind  # 在下一次移动 Token 之前，各分支的判断均使用局部变量
+            if annotations and tk not in LBRACKET_OR_ELLIPSIS:
+                self.illegal(annotations[0].start_pos)
 
-            # 将当前元素当作标识符处理
-            expression = ast.Identifier.create(
-                name=self.ident(),
-                **self._info_exclude(pos)
-            )
-            while True:
-                pos = self.token.pos
-                annotations = self.type_annotations_opt()
-                if annotations and self.token.kind not in {TokenKind.LBRACKET, TokenKind.ELLIPSIS}:
-                    self.illegal(annotations[0].start_pos)
+            # 绝大多数标识符之后是分号、括号或运算符，不进入以下任何分支，通过一次集合查询直接结束循环
+            if tk not in IDENTIFIER_SUFFIX_START:
+                break
 
-                if self.token.kind == TokenKind.LBRACKET:
+            if tk is TK.LBRACKET:
+                self.next_token()
+                if self.token_kind is TK.RBRACKET:
+                    # TypeName [ ] . class
                     self.next_token()
-                    if self.token.kind == TokenKind.RBRACKET:
-                        # TypeName [ ] . class
-                        self.next_token()
-                        expression = self.brackets_opt(expression)
-                        expression = ast.ArrayType.create(
+                    expression = self.brackets_opt(expression)
+                    # 数组类型与外层的注解类型节点的位置信息相同，只计算一次
+                    info = self._info_exclude(pos)
+                    expression = ast.ArrayType.create(
+                        expression=expression,
+                        **info
+                    )
+                    if annotations:
+                        expression = ast.AnnotatedType.create(
+                            annotations=annotations,
+                            underlying_type=expression,
+                            **info
+                        )
+                    expression = self.brackets_suffix(expression)
+                else:
+                    # ExpressionName [ Expression ]
+                    if self.mode & Mode.EXPR:
+                        self.select_expr_mode()
+                        index = self.term()
+                        if annotations:
+                            self.illegal()
+                        expression = ast.ArrayAccess.create(
                             expression=expression,
+                            index=index,
                             **self._info_exclude(pos)
                         )
-                        if annotations:
-                            expression = ast.AnnotatedType.create(
-                                annotations=annotations,
-                                underlying_type=expression,
-                                **self._info_exclude(pos)
-                            )
-                        expression = self.brackets_suffix(expression)
-                    else:
-                        # ExpressionName [ Expression ]
-                        if self.is_mode(Mode.EXPR):
-                            self.select_expr_mode()
-                            index = self.term()
-                            if annotations:
-                                self.illegal()
-                            expression = ast.ArrayAccess.create(
-                                expression=expression,
-                                index=index,
-                                **self._info_exclude(pos)
-                            )
-                        self.accept(TokenKind.RBRACKET)
-                    break
+                    self.accept(TK.RBRACKET)
+                break
 
-                # MethodName ( [ArgumentList] )
-                if self.token.kind == TokenKind.LPAREN:
-                    if self.is_mode(Mode.EXPR):
+            # MethodName ( [ArgumentList] )
+            if tk is TK.LPAREN:
+                if self.mode & Mode.EXPR:
+                    self.select_expr_mode()
+                    expression = self.arguments(type_args, expression)
+                    if annotations:
+                        self.illegal(annotations[0].start_pos)
+                    type_args = None
+                break
+
+            if tk is TK.DOT:
+                self.next_token()
+                if self.token_kind is TK.IDENTIFIER and type_args:
+                    self.illegal()
+
+                # 之后的各分支在改变模式后均结束循环，所以直到第二轮循环前都可以使用 prev_mode 判断模式
+                prev_mode = self.mode
+                self.mode = prev_mode & ~Mode.NO_PARAMS
+                type_args = self.type_argument_list_opt(Mode.EXPR)
+                self.mode = prev_mode
+                tk = self.token_kind
+
+                if prev_mode & Mode.EXPR:
+                    # TypeName . class
+                    # NumericType . class
+                    # boolean . class
+                    # void . class
+                    if tk is TK.CLASS:
+                        if type_args:
+                            self.illegal()
                         self.select_expr_mode()
-                        expression = self.arguments(type_args, expression)
-                        if annotations:
-                            self.illegal(annotations[0].start_pos)
-                        type_args = None
-                    break
+                        expression = self._select_member(expression, "class", pos)
+                        self.next_token()
+                        break
 
-                if self.token.kind == TokenKind.DOT:
-                    self.next_token()
-                    if self.token.kind == TokenKind.IDENTIFIER and type_args:
-                        self.illegal()
+                    # TypeName . this
+                    if tk is TK.THIS:
+                        if type_args:
+                            self.illegal()
+                        self.select_expr_mode()
+                        expression = self._select_member(expression, "this", pos)
+                        self.next_token()
+                        break
 
-                    prev_mode = self.mode
-                    self.set_mode(self.mode & ~Mode.NO_PARAMS)
-                    type_args = self.type_argument_list_opt(Mode.EXPR)
-                    self.set_mode(prev_mode)
-
-                    if self.is_mode(Mode.EXPR):
-                        # TypeName . class
-                        # NumericType . class
-                        # boolean . class
-                        # void . class
-                        if self.token.kind == TokenKind.CLASS:
-                            if type_args:
-                                self.illegal()
-                            self.select_expr_mode()
-                            expression = ast.MemberSelect.create(
-                                expression=expression,
-                                identifier=ast.Identifier.create(name="class",
-                                                                 **self._info_exclude(self.token.pos)),
-                                **self._info_include(pos)
-                            )
-                            self.next_token()
-                            break
+                    # TypeName . super :: [TypeArguments] Identifier
+                    if tk is TK.SUPER:
+                        self.select_expr_mode()
+                        expression = self._select_member(expression, "super", pos)
+                        expression = self.super_suffix(type_args, expression)
+                        break
 
-                        # TypeName . this
-                        if self.token.kind == TokenKind.THIS:
-                            if type_args:
-                                self.illegal()
-                            self.select_expr_mode()
-                            expression = ast.MemberSelect.create(
-                                expression=expression,
-                                identifier=ast.Identifier.create(name="this",
-                                                                 **self._info_exclude(self.token.pos)),
-                                **self._info_include(pos)
-                            )
-                            self.next_token()
-                            break
+                    # [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
+                    # ClassInstanceCreationExpression:
+                    #   UnqualifiedClassInstanceCreationExpression
+                    #   ExpressionName . UnqualifiedClassInstanceCreationExpression
+                    #   Primary . UnqualifiedClassInstanceCreationExpression
+                    if tk is TK.NEW:
+                        self.select_expr_mode()
+                        pos1 = self.token_pos
+                        self.next_token()
+                        if self.token_kind is TK.LT:
+                            type_args = self.type_argument_list(False)
+                        expression = self.inner_creator(pos1, type_args, expression)
+                        break
 
-                        # TypeName . super :: [TypeArguments] Identifier
-                        if self.token.kind == TokenKind.SUPER:
-                            self.select_expr_mode()
-                            expression = ast.MemberSelect.create(
-                                expression=expression,
-                                identifier=ast.Identifier.create(name="super",
-                                                                 **self._info_exclude(self.token.pos)),
-                                **self._info_include(pos)
-                            )
-                            expression = self.super_suffix(type_args, expression)
-                            break
+                # 继续第二轮循环
+                type_annotations: Optional[List[ast.Annotation]] = None
+                if tk is TK.MONKEYS_AT and prev_mode & Mode.TYPE:
+                    type_annotations = self.type_annotations_opt()
 
-                        # [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
-                        # ClassInstanceCreationExpression:
-                        #   UnqualifiedClassInstanceCreationExpression
-                        #   ExpressionName . UnqualifiedClassInstanceCreationExpression
-                        #   Primary . UnqualifiedClassInstanceCreationExpression
-                        if self.token.kind == TokenKind.NEW:
-                            self.select_expr_mode()
-                            pos1 = self.token.pos
-                            self.next_token()
-                            if self.token.kind == TokenKind.LT:
-                                type_args = self.type_argument_list(False)
-                            expression = self.inner_creator(pos1, type_args, expression)
-                            break
+                expression = self._select_member(expression, self.ident(), pos)
+                # TODO 待增加失败恢复的机制
+                if type_annotations:
+                    expression = ast.AnnotatedType.create(
+                        annotations=type_annotations,
+                        underlying_type=expression,
+                        **self._info_exclude(type_annotations[0].start_pos)
+                    )
+                continue
 
-                    # 继续第二轮循环
-                    type_annotations: Optional[List[ast.Annotation]] = None
-                    if self.is_mode(Mode.TYPE) and self.token.kind == TokenKind.MONKEYS_AT:
-                        type_annotations = self.type_annotations_opt()
+            if tk is TK.ELLIPSIS:
+                if not self.permit_type_annotations_push_back:
+                    self.illegal()
+                self.type_annotations_pushed_back = annotations
+                break
 
-                    expression = ast.MemberSelect.create(
-                        expression=expression,
-                        identifier=ast.Identifier.create(name=self.ident(), **self._info_exclude(self.token.pos)),
-                        **self._info_include(pos)
+            # Primary :: [TypeArguments] Identifier【前缀部分】
+            if tk is TK.LT:
+                if not self.mode & Mode.TYPE and self.is_unbound_member_ref():
+                    pos_1 = self.token_pos
+                    self.accept(TK.LT)
+                    type_arguments = self._comma_separated(self.type_argument)
+                    self.accept(TK.GT)
+
+                    expression = ast.ParameterizedType.create(
+                        type_name=expression,
+                        type_arguments=type_arguments,
+                        **self._info_exclude(pos_1)
                     )
-                    # TODO 待增加失败恢复的机制
-                    if type_annotations:
-                        expression = ast.AnnotatedType.create(
-                            annotations=type_annotations,
-                            underlying_type=expression,
-                            **self._info_exclude(type_annotations[0].start_pos)
+
+                    while self.token_kind is TK.DOT:
+                        self.next_token()
+                        self.select_type_mode()
+                        # 标识符与成员选择节点的位置信息相同，只计算一次
+                        name = self.ident()
+                        info = self._info_include(self.token_pos)
+                        expression = ast.MemberSelect.create(
+                            expression=expression,
+                            identifier=ast.Identifier.create(name=name, **info),
+                            **info
                         )
-                    continue
+                        expression = self.type_arguments_opt(expression)
+
+                    expression = self.brackets_opt(expression)
 
-                if self.token.kind == TokenKind.ELLIPSIS:
-                    if self.permit_type_annotations_push_back is False:
+                    if self.token_kind is not TK.COL_COL:
                         self.illegal()
-                    self.type_annotations_pushed_back = annotations
-                    break
 
-                # Primary :: [TypeArguments] Identifier【前缀部分】
-                if self.token.kind == TokenKind.LT:
-                    if not self.is_mode(Mode.TYPE) and self.is_unbound_member_ref():
-                        pos_1 = self.token.pos
-                        self.accept(TokenKind.LT)
-                        type_arguments = [self.type_argument()]
-                        while self.token.kind == TokenKind.COMMA:
-                            self.next_token()
-                            type_arguments.append(self.type_argument())
-                        self.accept(TokenKind.GT)
-
-                        expression = ast.ParameterizedType.create(
-                            type_name=expression,
-                            type_arguments=type_arguments,
-                            **self._info_exclude(pos_1)
-                        )
+                    self.select_expr_mode()
+                break
 
-                        while self.token.kind == TokenKind.DOT:
-                            self.next_token()
-                            self.select_type_mode()
-                            expression = ast.MemberSelect.create(
-                                expression=expression,
-                                identifier=ast.Identifier.create(name=self.ident(),
-                                                                 **self._info_include(self.token.pos)),
-                                **self._info_include(self.token.pos)
-                            )
-                            expression = self.type_arguments_opt(expression)
+            break
+        if type_args is not None:
+            self.illegal()
+        expression = self.type_arguments_opt(expression)
+        return self.term3_rest(expression, None)
 
-                        expression = self.brackets_opt(expression)
+    def _term3_primitive(self, pos: int, type_args: Optional[List[ast.Expression]]) -> ast.Expression:
+        """基本类型开头的类字面值
 
-                        if self.token.kind != TokenKind.COL_COL:
-                            self.illegal()
+        NumericType {[ ]} . class
+        boolean {[ ]} . class
+        """
+        if type_args is not None:
+            self.illegal()
+        expression = self.brackets_suffix(self.brackets_opt(self.basic_type()))
+        return self.term3_rest(expression, None)
 
-                        self.select_expr_mode()
-                    break
+    def _term3_void(self, pos: int, type_args: Optional[List[ast.Expression]]) -> ast.Expression:
+        """void 开头的类字面值
 
-                break
-            if type_args is not None:
-                self.illegal()
-            expression = self.type_arguments_opt(expression)
+        void . class
+        """
+        if type_args is not None:
+            self.illegal()
+        if self.mode & Mode.EXPR:
+            self.next_token()
+            if self.token_kind is not TK.DOT:
+                self.illegal(pos)
+            expression = ast.PrimitiveType.create_void(**self._info_include(pos))
+            expression = self.brackets_suffix(expression)
             return self.term3_rest(expression, None)
+        else:
+            # 通过向下一个阶段传递一个 void 类型来支持 myMethodHandle.<void>invoke() 的特殊情况
+            expression = ast.PrimitiveType.create_void(**self._info_include(pos))
+            self.next_token()
+            return expression
 
-        # NumericType {[ ]} . class
-        # boolean {[ ]} . class
-        if self.token.kind in {TokenKind.BYTE, TokenKind.SHORT, TokenKind.CHAR, TokenKind.INT, TokenKind.LONG,
-                               TokenKind.FLOAT, TokenKind.DOUBLE, TokenKind.BOOLEAN}:
-            if type_args is not None:
-                self.illegal()
-            expression = self.brackets_suffix(self.brackets_opt(self.basic_type()))
-            return self.term3_rest(expression, None)
+    def _term3_switch(self, pos: int, type_args: Optional[List[ast.Expression]]) -> ast.Expression:
+        """switch 表达式
 
-        # void . class
-        if self.token.kind == TokenKind.VOID:
-            if type_args is not None:
-                self.illegal()
-            if self.is_mode(Mode.EXPR):
-                self.next_token()
-                if self.token.kind != TokenKind.DOT:
-                    self.illegal(pos)
-                expression = ast.PrimitiveType.create_void(**self._info_include(pos))
-                expression = self.brackets_suffix(expression)
-                return self.term3_rest(expression, None)
+        [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
+        SwitchExpression:
+          switch ( Expression ) SwitchBlock
+        """
+        self.allow_yield_statement = True
+        switch_pos = self.token_pos
+        self.next_token()
+        expression = self.par_expression()
+        self.accept(TK.LBRACE)
+        cases: List[ast.Case] = []
+        while True:
+            pos = self.token_pos
+            if self.token_kind in CASE_OR_DEFAULT:
+                cases.extend(self.switch_expression_statement_group())
+            elif self.token_kind in RBRACE_OR_EOF:
+                switch_expression = ast.SwitchExpression.create(
+                    expression=expression,
+                    cases=cases,
+                    **self._info_exclude(switch_pos)
+                )
+                switch_expression.end_pos = self.token_pos  # TODO 待考虑 source 的逻辑
+                self.accept(TK.RBRACE)
+                return switch_expression
             else:
-                # 通过向下一个阶段传递一个 void 类型来支持 myMethodHandle.<void>invoke() 的特殊情况
-                expression = ast.PrimitiveType.create_void(**self._info_include(pos))
-                self.next_token()
-                return expression
-
-        # [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
-        # SwitchExpression:
-        #   switch ( Expression ) SwitchBlock
-        if self.token.kind == TokenKind.SWITCH:
-            self.allow_yield_statement = True
-            switch_pos = self.token.pos
-            self.next_token()
-            expression = self.par_expression()
-            self.accept(TokenKind.LBRACE)
-            cases: List[ast.Case] = []
-            while True:
-                pos = self.token.pos
-                if self.token.kind in {TokenKind.CASE, TokenKind.DEFAULT}:
-                    cases.extend(self.switch_expression_statement_group())
-                elif self.token.kind in {TokenKind.RBRACE, TokenKind.EOF}:
-                    switch_expression = ast.SwitchExpression.create(
-                        expression=expression,
-                        cases=cases,
-                        **self._info_exclude(switch_pos)
-                    )
-                    switch_expression.end_pos = self.token.pos  # TODO 待考虑 source 的逻辑
-                    self.accept(TokenKind.RBRACE)
-                    return switch_expression
-                else:
-                    self.raise_syntax_error(self.token.pos, f"expect CASE, DEFAULT or RBRACE, "
-                                                            f"but get {self.token.kind.name}")
-
-        self.raise_syntax_error(self.token.pos, f"无法解析为 term3 的 Token 元素: {self.token.kind.name}")
+                self.raise_syntax_error(self.token_pos, f"expect CASE, DEFAULT or RBRACE, "
+                                                        f"but get {self.token_kind.name}")
 
     def switch_expression_statement_group(self) -> List[ast.Case]:
         """解析 Switch 表达式中的一组 Case 语句
@@ -1568,20 +1815,19 @@ class JavaParser:
 
         TODO 补充单元测试（等待 parse_expression、parse_statement 和 block_statements）
         """
-        case_pos = self.token.pos
-        case_expression_list: List[ast.Case] = []
+        case_pos = self.token_pos
         labels: List[ast.CaseLabel] = []
 
-        if self.token.kind == TokenKind.DEFAULT:
+        if self.token_kind is TK.DEFAULT:
             self.next_token()
             labels.append(ast.DefaultCaseLabel.create(**self._info_exclude(case_pos)))
         else:
-            self.accept(TokenKind.CASE)
+            self.accept(TK.CASE)
             allow_default = False
             while True:
                 label: ast.CaseLabel = self.parse_case_label(allow_default=allow_default)
                 labels.append(label)
-                if self.token.kind != TokenKind.COMMA:
+                if self.token_kind is not TK.COMMA:
                     break
                 self.next_token()  # 跳过 COMMA
                 # TODO 待确定 isNone 的逻辑是否正确
@@ -1589,39 +1835,40 @@ class JavaParser:
                                  and isinstance(label, ast.ConstantCaseLabel)
                                  and label.expression.kind == TreeKind.NULL_LITERAL)
             guard = self.parse_guard(labels[-1])
-            if self.token.kind == TokenKind.ARROW:
+            if self.token_kind is TK.ARROW:
                 self.next_token()
-                if self.token.kind == TokenKind.THROW or self.token.kind == TokenKind.LBRACE:
+                if self.token_kind is TK.THROW or self.token_kind is TK.LBRACE:
                     statements = [self.parse_statement()]
-                    case_expression_list.append(ast.Case.create_rule(
+                    case = ast.Case.create_rule(
                         labels=labels,
                         guard=guard,
                         statements=statements,
                         body=statements[0],
                         **self._info_exclude(case_pos)
-                    ))
+                    )
                 else:
                     value = self.parse_expression()
                     statements = [ast.Yield.create(value=value, **self._info_exclude(value.start_pos))]
-                    case_expression_list.append(ast.Case.create_statement(
+                    case = ast.Case.create_statement(
                         labels=labels,
                         guard=guard,
                         statements=statements,
                         body=value,
                         **self._info_exclude(case_pos)
-                    ))
-                    self.accept(TokenKind.SEMI)
+                    )
+                    self.accept(TK.SEMI)
             else:
-                self.accept(TokenKind.COLON)
+                self.accept(TK.COLON)
                 statements = self.block_statements()
-                case_expression_list.append(ast.Case.create_statement(
+                case = ast.Case.create_statement(
                     labels=labels,
                     guard=guard,
                     statements=statements,
                     body=None,
                     **self._info_exclude(case_pos)
-                ))
-            return case_expression_list
+                )
+            # 每个语句组只包含一个 Case 节点，返回的列表由调用方持有，所以在构造节点后再创建列表
+            return [case]
 
     def term3_rest(self, expression: ast.Expression,
                    type_args: Optional[List[ast.Expression]]) -> ast.Expression:
@@ -1656,37 +1903,39 @@ class JavaParser:
         if type_args is not None:
             self.illegal()
         while True:
-            pos_1 = self.token.pos
+            pos_1 = self.token_pos
             annotations: List[ast.Annotation] = self.type_annotations_opt()
-            if self.token.kind == TokenKind.LBRACKET:
+            if self.token_kind is TK.LBRACKET:
                 self.next_token()  # 跳过 LBRACKET
-                if self.is_mode(Mode.TYPE):
+                if self.mode & Mode.TYPE:
                     prev_mode = self.mode
                     self.select_type_mode()
-                    if self.token.kind == TokenKind.RBRACKET:
+                    if self.token_kind is TK.RBRACKET:
                         # term3 [ ]
                         self.next_token()  # 跳过 RBRACKET
                         expression = self.brackets_opt(expression)
+                        # 数组类型与外层的注解类型节点的位置信息相同，只计算一次
+                        info = self._info_exclude(pos_1)
                         expression = ast.ArrayType.create(
                             expression=expression,
-                            **self._info_exclude(pos_1)
+                            **info
                         )
 
                         # term3 [ ] ::
-                        if self.token.kind == TokenKind.COL_COL:
+                        if self.token_kind is TK.COL_COL:
                             self.select_expr_mode()
                             continue
                         if annotations:
                             expression = ast.AnnotatedType.create(
                                 annotations=annotations,
                                 underlying_type=expression,
-                                **self._info_exclude(pos_1)
+                                **info
                             )
                         return expression
-                    self.set_mode(prev_mode)
+                    self.mode = prev_mode
 
                 # term3 [ index ]
-                if self.is_mode(Mode.EXPR):
+                if self.mode & Mode.EXPR:
                     self.select_expr_mode()
                     index = self.term()
                     expression = ast.ArrayAccess.create(
@@ -1694,31 +1943,31 @@ class JavaParser:
                         index=index,
                         **self._info_exclude(pos_1)
                     )
-                self.accept(TokenKind.RBRACKET)
-            elif self.token.kind == TokenKind.DOT:
+                self.accept(TK.RBRACKET)
+            elif self.token_kind is TK.DOT:
                 self.next_token()  # 跳过 DOT
                 type_args = self.type_argument_list_opt(Mode.EXPR)
 
                 # term3 . super ( expression , ... )
-                if self.token.kind == TokenKind.SUPER and self.is_mode(Mode.EXPR):
+                if self.token_kind is TK.SUPER and self.mode & Mode.EXPR:
                     self.select_expr_mode()
                     expression = ast.MemberSelect.create(
                         expression=expression,
-                        identifier=ast.Identifier.create(name="super", **self._info_include(self.token.pos)),
-                        **self._info_include(self.token.pos)
+                        identifier=self._keyword_identifier("super", self.token_pos),
+                        **self._info_include(self.token_pos)
                     )
                     self.next_token()  # 跳过 SUPER
                     expression = self.arguments(type_args, expression)
                     type_args = None
 
                 # term3 . new < type_argument, ... >
-                elif self.token.kind == TokenKind.NEW and self.is_mode(Mode.EXPR):
+                elif self.token_kind is TK.NEW and self.mode & Mode.EXPR:
                     if type_args is not None:
                         self.illegal()
                     self.select_expr_mode()
-                    pos_2 = self.token.pos
+                    pos_2 = self.token_pos
                     self.next_token()  # 跳过 NEW
-                    if self.token.kind == TokenKind.LT:
+                    if self.token_kind is TK.LT:
                         type_args = self.type_argument_list(diamond_allowed=False)
                     expression = self.inner_creator(pos_2, type_args, expression)
                     type_args = None
@@ -1726,12 +1975,12 @@ class JavaParser:
                 # term . identifier {type_annotations} {(argument, ...)}
                 else:
                     type_annotations: Optional[List[ast.Annotation]] = None
-                    if self.is_mode(Mode.TYPE) and self.token.kind == TokenKind.MONKEYS_AT:
+                    if self.mode & Mode.TYPE and self.token_kind is TK.MONKEYS_AT:
                         type_annotations = self.type_annotations_opt()
                     expression = ast.MemberSelect.create(
                         expression=expression,
-                        identifier=ast.Identifier.create(name=self.ident(), **self._info_exclude(self.token.pos)),
-                        **self._info_include(self.token.pos)
+                        identifier=ast.Identifier.create(name=self.ident(), **self._info_exclude(self.token_pos)),
+                        **self._info_include(self.token_pos)
                     )
                     # TODO 待补充错误恢复逻辑
                     if type_annotations:
@@ -1752,11 +2001,11 @@ class JavaParser:
             #   TypeName . super :: [TypeArguments] Identifier
             #   ClassType :: [TypeArguments] new
             #   ArrayType :: new
-            elif self.token.kind == TokenKind.COL_COL and self.is_mode(Mode.EXPR):
+            elif self.token_kind is TK.COL_COL and self.mode & Mode.EXPR:
                 self.select_expr_mode()
                 if type_args is not None:
                     self.illegal()
-                self.accept(TokenKind.COL_COL)
+                self.accept(TK.COL_COL)
                 expression = self.member_reference_suffix(expression, pos=pos_1)
 
             else:
@@ -1767,12 +2016,12 @@ class JavaParser:
                         self.illegal()
                 break
 
-        while self.token.kind in {TokenKind.PLUS_PLUS, TokenKind.SUB_SUB} and self.is_mode(Mode.EXPR):
+        while self.token_kind in POSTFIX_INC_DEC and self.mode & Mode.EXPR:
             self.select_expr_mode()
             expression = ast.Unary.create(
-                kind=grammar_hash.UNARY_OPERATOR_TO_TREE_KIND[self.token.kind],
+                kind=grammar_hash.UNARY_OPERATOR_TO_TREE_KIND[self.token_kind],
                 expression=expression,
-                **self._info_include(self.token.pos)
+                **self._info_include(self.token_pos)
             )
             self.next_token()  # 跳过 ++ 或 --
 
@@ -1787,48 +2036,47 @@ class JavaParser:
         True
         >>> JavaParser(LexicalFSM("<name(xx,xx,xx)>::"), mode=Mode.EXPR).is_unbound_member_ref()
         True
+        >>> JavaParser(LexicalFSM("<name((xx),(xx))>::"), mode=Mode.EXPR).is_unbound_member_ref()
+        True
+        >>> JavaParser(LexicalFSM("<name((xx)"), mode=Mode.EXPR).is_unbound_member_ref()
+        False
         >>> JavaParser(LexicalFSM("<name> value"), mode=Mode.EXPR).is_unbound_member_ref()
         False
         """
+        lexer_kind = self.lexer.kind
         pos = 0
         depth = 0
-        while self.lexer.token(pos).kind != TokenKind.EOF:
-            token = self.lexer.token(pos)
-            if token.kind in {TokenKind.IDENTIFIER, TokenKind.UNDERSCORE, TokenKind.QUES, TokenKind.EXTENDS,
-                              TokenKind.SUPER, TokenKind.DOT, TokenKind.RBRACKET, TokenKind.LBRACKET, TokenKind.COMMA,
-                              TokenKind.BYTE, TokenKind.SHORT, TokenKind.INT, TokenKind.LONG, TokenKind.FLOAT,
-                              TokenKind.DOUBLE, TokenKind.BOOLEAN, TokenKind.CHAR, TokenKind.MONKEYS_AT}:
+        while True:
+            tk = lexer_kind(pos)
+            if tk is TK.EOF:
+                return False
+            if tk in MEMBER_REF_TYPE_ELEMENT:
                 pos += 1
 
-            elif token.kind == TokenKind.LPAREN:
-                nesting = 0
+            elif tk is TK.LPAREN:
+                # 当前的左括号已计入嵌套层数，从其后的终结符开始扫描
+                pos += 1
+                nesting = 1
                 while True:
-                    tk2 = self.lexer.token(pos).kind
-                    if tk2 == TokenKind.EOF:
+                    tk2 = lexer_kind(pos)
+                    pos += 1
+                    if tk2 is TK.EOF:
                         return False
-                    if tk2 == TokenKind.LPAREN:
+                    if tk2 is TK.LPAREN:
                         nesting += 1
-                    elif tk2 == TokenKind.RPAREN:
+                    elif tk2 is TK.RPAREN:
                         nesting -= 1
                         if nesting == 0:
-                            pos += 1
                             break
-                    pos += 1
 
-            elif token.kind == TokenKind.LT:
+            elif tk is TK.LT:
                 depth += 1
                 pos += 1
 
-            elif token.kind in {TokenKind.GT_GT_GT, TokenKind.GT_GT, TokenKind.GT}:
-                if token.kind == TokenKind.GT_GT_GT:
-                    depth -= 3
-                elif token.kind == TokenKind.GT_GT:
-                    depth -= 2
-                else:
-                    depth -= 1
-
+            elif tk in RIGHT_ANGLE_BRACKETS:
+                depth += grammar_hash.ANGLE_BRACKET_TO_DEPTH_DELTA[tk]
                 if depth == 0:
-                    return self.lexer.token(pos + 1).kind in {TokenKind.DOT, TokenKind.LBRACKET, TokenKind.COL_COL}
+                    return lexer_kind(pos + 1) in MEMBER_REF_TYPE_FOLLOWER
 
                 pos += 1
 
@@ -1839,103 +2087,116 @@ class JavaParser:
         """分析括号中的内容
 
         [JDK Code] JavacParser.analyzeParens
+
+        Examples
+        --------
+        >>> JavaParser(LexicalFSM("(String) x"), mode=Mode.EXPR).analyze_parens() == ParensResult.CAST
+        True
+        >>> JavaParser(LexicalFSM("(a, b) -> a"), mode=Mode.EXPR).analyze_parens() == ParensResult.IMPLICIT_LAMBDA
+        True
+        >>> JavaParser(LexicalFSM("(a + b)"), mode=Mode.EXPR).analyze_parens() == ParensResult.PARENS
+        True
+        >>> JavaParser(LexicalFSM("(List<String>) x"), mode=Mode.EXPR).analyze_parens() == ParensResult.CAST
+        True
+        >>> JavaParser(LexicalFSM("(Map<K, V> a) -> a"), mode=Mode.EXPR).analyze_parens() == ParensResult.EXPLICIT_LAMBDA
+        True
+        >>> JavaParser(LexicalFSM("(int[] a) -> a"), mode=Mode.EXPR).analyze_parens() == ParensResult.EXPLICIT_LAMBDA
+        True
+        >>> JavaParser(LexicalFSM("(a[0])"), mode=Mode.EXPR).analyze_parens() == ParensResult.PARENS
+        True
+        >>> JavaParser(LexicalFSM("(a) (b)"), mode=Mode.EXPR).analyze_parens() == ParensResult.CAST
+        True
+        >>> JavaParser(LexicalFSM("(a) + b"), mode=Mode.EXPR).analyze_parens() == ParensResult.PARENS
+        True
         """
         depth = 0
         is_type = False
         lookahead = 0
         default_result = ParensResult.PARENS
+        token_to_action = grammar_hash.TOKEN_TO_PARENS_ACTION
+        default_action = ParensAction.DEFAULT
+        lexer_kind = self.lexer.kind
         while True:
-            tk = self.lexer.token(lookahead).kind
-            if tk == TokenKind.COMMA:
-                is_type = True
-            elif tk in {TokenKind.EXTENDS, TokenKind.SUPER, TokenKind.DOT, TokenKind.AMP}:
-                pass  # 跳过
-            elif tk == TokenKind.QUES:
-                if self.lexer.token(lookahead + 1).kind in {TokenKind.EXTENDS, TokenKind.SUPER}:
-                    is_type = True  # wildcards
-            elif tk in {TokenKind.BYTE, TokenKind.SHORT, TokenKind.INT, TokenKind.LONG, TokenKind.FLOAT,
-                        TokenKind.FLOAT, TokenKind.DOUBLE, TokenKind.BOOLEAN, TokenKind.CHAR, TokenKind.VOID}:
-                if self.lexer.token(lookahead + 1).kind == TokenKind.RPAREN:
-                    # Type, ')' -> cast
-                    return ParensResult.CAST
-                if self.lexer.token(lookahead + 1).kind in LAX_IDENTIFIER:
-                    # Type, Identifier/'_'/'assert'/'enum' -> explicit lambda
-                    return ParensResult.EXPLICIT_LAMBDA
-            elif tk == TokenKind.LPAREN:
+            tk = lexer_kind(lookahead)
+            action = token_to_action.get(tk, default_action)
+            # 按出现频率排列分支：每次分析都从左括号开始，括号中最常见的是标识符
+            if action is ParensAction.LPAREN:
                 if lookahead != 0:
                     # // '(' in a non-starting position -> parens
                     return ParensResult.PARENS
-                if self.lexer.token(lookahead + 1).kind == TokenKind.RPAREN:
+                if lexer_kind(lookahead + 1) is TK.RPAREN:
                     # // '(', ')' -> explicit lambda
                     return ParensResult.EXPLICIT_LAMBDA
-            elif tk == TokenKind.RPAREN:
-                if is_type is True:
-                    return ParensResult.CAST
-                if self.lexer.token(lookahead + 1).kind in {
-                    TokenKind.CASE, TokenKind.TILDE, TokenKind.LPAREN, TokenKind.THIS, TokenKind.SUPER,
-                    TokenKind.INT_OCT_LITERAL, TokenKind.INT_DEC_LITERAL, TokenKind.INT_HEX_LITERAL,
-                    TokenKind.LONG_OCT_LITERAL, TokenKind.LONG_DEC_LITERAL, TokenKind.LONG_HEX_LITERAL,
-                    TokenKind.FLOAT_LITERAL, TokenKind.DOUBLE_LITERAL, TokenKind.CHAR_LITERAL, TokenKind.STRING_LITERAL,
-                    TokenKind.STRING_FRAGMENT, TokenKind.TRUE, TokenKind.FALSE, TokenKind.NULL, TokenKind.NEW,
-                    TokenKind.IDENTIFIER, TokenKind.ASSERT, TokenKind.ENUM, TokenKind.UNDERSCORE, TokenKind.SWITCH,
-                    TokenKind.BYTE, TokenKind.SHORT, TokenKind.CHAR, TokenKind.INT, TokenKind.LONG, TokenKind.FLOAT,
-                    TokenKind.DOUBLE, TokenKind.BOOLEAN, TokenKind.VOID
-                }:
-                    return ParensResult.CAST
-                return default_result
-            elif tk in LAX_IDENTIFIER:
-                if self.lexer.token(lookahead + 1).kind in LAX_IDENTIFIER:
+            elif action is ParensAction.IDENTIFIER:
+                next_kind = lexer_kind(lookahead + 1)
+                if next_kind in LAX_IDENTIFIER:
                     # Identifier, Identifier/'_'/'assert'/'enum' -> explicit lambda
                     return ParensResult.EXPLICIT_LAMBDA
-                if (self.lexer.token(lookahead + 1).kind == TokenKind.RPAREN
-                        and self.lexer.token(lookahead + 2).kind == TokenKind.ARROW):
+                if next_kind is TK.RPAREN and lexer_kind(lookahead + 2) is TK.ARROW:
                     # // Identifier, ')' '->' -> implicit lambda
                     # TODO 待增加 isMode 的逻辑
                     return ParensResult.IMPLICIT_LAMBDA
-                if depth == 0 and self.lexer.token(lookahead + 1).kind == TokenKind.COMMA:
+                if depth == 0 and next_kind is TK.COMMA:
                     default_result = ParensResult.IMPLICIT_LAMBDA
                 is_type = False
-            elif tk in {TokenKind.FINAL, TokenKind.ELLIPSIS}:
+            elif action is ParensAction.RPAREN:
+                if is_type:
+                    return ParensResult.CAST
+                if lexer_kind(lookahead + 1) in CAST_FOLLOWER:
+                    return ParensResult.CAST
+                return default_result
+            elif action is ParensAction.COMMA:
+                is_type = True
+            elif action is ParensAction.SKIP:
+                pass  # 跳过
+            elif action is ParensAction.QUES:
+                if lexer_kind(lookahead + 1) in WILDCARD_BOUND:
+                    is_type = True  # wildcards
+            elif action is ParensAction.PRIMITIVE:
+                next_kind = lexer_kind(lookahead + 1)
+                if next_kind is TK.RPAREN:
+                    # Type, ')' -> cast
+                    return ParensResult.CAST
+                if next_kind in LAX_IDENTIFIER:
+                    # Type, Identifier/'_'/'assert'/'enum' -> explicit lambda
+                    return ParensResult.EXPLICIT_LAMBDA
+            elif action is ParensAction.EXPLICIT_LAMBDA:
                 return ParensResult.EXPLICIT_LAMBDA
-            elif tk == TokenKind.MONKEYS_AT:
+            elif action is ParensAction.MONKEYS_AT:
                 is_type = True
                 lookahead = self.skip_annotation(lookahead)
-            elif tk == TokenKind.LBRACKET:
-                if self.peek_token(lookahead, TokenKind.RBRACKET, LAX_IDENTIFIER):
+            elif action is ParensAction.LBRACKET:
+                if lexer_kind(lookahead + 1) is not TK.RBRACKET:
+                    return ParensResult.PARENS
+                next_kind = lexer_kind(lookahead + 2)
+                if next_kind in LAX_IDENTIFIER:
                     # '[', ']', Identifier/'_'/'assert'/'enum' -> explicit lambda
                     return ParensResult.EXPLICIT_LAMBDA
-                if self.peek_token(lookahead, TokenKind.RBRACKET, TokenKind.RPAREN):
+                if next_kind is TK.RPAREN or next_kind is TK.AMP:
                     # '[', ']', ')' -> cast
-                    return ParensResult.CAST
-                if self.peek_token(lookahead, TokenKind.RBRACKET, TokenKind.AMP):
                     # '[', ']', '&' -> cast (intersection type)
                     return ParensResult.CAST
-                if self.peek_token(lookahead, TokenKind.RBRACKET):
-                    is_type = True
-                    lookahead += 1
-                else:
-                    return ParensResult.PARENS
-            elif tk == TokenKind.LT:
+                is_type = True
+                lookahead += 1
+            elif action is ParensAction.LT:
                 depth += 1
-            elif tk in {TokenKind.GT_GT_GT, TokenKind.GT_GT, TokenKind.GT}:
-                if tk == TokenKind.GT_GT_GT:
-                    depth -= 3
-                elif tk == TokenKind.GT_GT:
-                    depth -= 2
-                elif tk == TokenKind.GT:
-                    depth -= 1
+            elif action is ParensAction.GT:
+                depth += grammar_hash.ANGLE_BRACKET_TO_DEPTH_DELTA[tk]
                 if depth == 0:
-                    if self.peek_token(lookahead, TokenKind.RPAREN) or self.peek_token(lookahead, TokenKind.AMP):
+                    next_kind = lexer_kind(lookahead + 1)
+                    if next_kind is TK.RPAREN or next_kind is TK.AMP:
                         # '>', ')' -> cast
                         # '>', '&' -> cast
                         return ParensResult.CAST
-                    if self.peek_token(lookahead, LAX_IDENTIFIER, TokenKind.COMMA):
-                        # '>', Identifier/'_'/'assert'/'enum', ',' -> explicit lambda
-                        return ParensResult.EXPLICIT_LAMBDA
-                    if self.peek_token(lookahead, LAX_IDENTIFIER, TokenKind.RPAREN, TokenKind.ARROW):
-                        # '>', Identifier/'_'/'assert'/'enum', ')', '->' -> explicit lambda
-                        return ParensResult.EXPLICIT_LAMBDA
-                    if self.peek_token(lookahead, TokenKind.ELLIPSIS):
+                    if next_kind in LAX_IDENTIFIER:
+                        next_kind = lexer_kind(lookahead + 2)
+                        if next_kind is TK.COMMA:
+                            # '>', Identifier/'_'/'assert'/'enum', ',' -> explicit lambda
+                            return ParensResult.EXPLICIT_LAMBDA
+                        if next_kind is TK.RPAREN and lexer_kind(lookahead + 3) is TK.ARROW:
+                            # '>', Identifier/'_'/'assert'/'enum', ')', '->' -> explicit lambda
+                            return ParensResult.EXPLICIT_LAMBDA
+                    elif next_kind is TK.ELLIPSIS:
                         # '>', '...' -> explicit lambda
                         return ParensResult.EXPLICIT_LAMBDA
                     is_type = True
@@ -1953,23 +2214,38 @@ class JavaParser:
         样例："@ interface xxx"，参数的 lookahead 指向 "@"，返回的 lookahead 指向 "interface"
 
         [JDK Code] JavacParser.skipAnnotation
+
+        Examples
+        --------
+        >>> JavaParser(LexicalFSM("@a.b.Ann int")).skip_annotation(0)
+        5
+        >>> JavaParser(LexicalFSM("@Ann(x = (1), y = f(2)) int")).skip_annotation(0)
+        15
         """
+        lexer_kind = self.lexer.kind
+        kind_dot = TK.DOT
+        kind_lparen = TK.LPAREN
+        kind_rparen = TK.RPAREN
+        kind_eof = TK.EOF
+
         lookahead += 1  # 跳过 @
-        while self.peek_token(lookahead, TokenKind.DOT):
+        tk = lexer_kind(lookahead + 1)  # 标识符之后的终结符：退出点号循环时的终结符即为判断左括号时的终结符，不再重复读取
+        while tk is kind_dot:
             lookahead += 2
+            tk = lexer_kind(lookahead + 1)
 
-        if not self.peek_token(lookahead, TokenKind.LPAREN):
+        if tk is not kind_lparen:
             return lookahead
-        lookahead += 1  # 跳过标识符
+        lookahead += 2  # 跳过标识符和左括号
 
-        nesting = 0  # 嵌套的括号层数（左括号比右括号多的数量）
+        nesting = 1  # 嵌套的括号层数（左括号比右括号多的数量），注解参数的左括号已计入
         while True:
-            tk = self.lexer.token(lookahead).kind
-            if tk == TokenKind.EOF:
+            tk = lexer_kind(lookahead)
+            if tk is kind_eof:
                 return lookahead
-            if tk == TokenKind.LPAREN:
+            if tk is kind_lparen:
                 nesting += 1
-            if tk == TokenKind.RPAREN:
+            elif tk is kind_rparen:
                 nesting -= 1
                 if nesting == 0:
                     return lookahead
@@ -1999,9 +2275,29 @@ class JavaParser:
         'LAMBDA_EXPRESSION'
         """
         if explicit_params is True:
-            parameters = self.formal_parameters(True, False)
-        else:
-            parameters = self.implicit_parameters(has_parens)
+            return self.lambda_explicit_expression_or_statement(pos)
+        return self.lambda_implicit_expression_or_statement(has_parens, pos)
+
+    def lambda_explicit_expression_or_statement(self, pos: int) -> ast.Expression:
+        """显式声明参数类型的 lambda 表达式或 lambda 语句（调用方已确定参数为显式参数时直接调用）
+
+        Examples
+        --------
+        >>> JavaParser(LexicalFSM("(int x)->x + 3")).lambda_explicit_expression_or_statement(0).kind.name
+        'LAMBDA_EXPRESSION'
+        """
+        parameters = self.formal_parameters(True, False)
+        return self.lambda_expression_or_statement_rest(parameters, pos)
+
+    def lambda_implicit_expression_or_statement(self, has_parens: bool, pos: int) -> ast.Expression:
+        """隐式声明参数类型的 lambda 表达式或 lambda 语句（调用方已确定参数为隐式参数时直接调用）
+
+        Examples
+        --------
+        >>> JavaParser(LexicalFSM("x->x + 3")).lambda_implicit_expression_or_statement(False, 0).kind.name
+        'LAMBDA_EXPRESSION'
+        """
+        parameters = self.implicit_parameters(has_parens)
         return self.lambda_expression_or_statement_rest(parameters, pos)
 
     def lambda_expression_or_statement_rest(self, parameters: List[ast.Variable], pos: int) -> ast.Expression:
@@ -2014,9 +2310,12 @@ class JavaParser:
 
         [JDK Code] JavacParser.lambdaExpressionOrStatementRest
         """
-        self.accept(TokenKind.ARROW)
-        if self.token.kind == TokenKind.LBRACE:
-            return self.lambda_statement(parameters, pos, self.token.pos)
+        if self.token_kind is TK.ARROW:
+            self.next_token()
+        else:
+            self.accept(TK.ARROW)
+        if self.token_kind is TK.LBRACE:
+            return self.lambda_statement(parameters, pos, self.token_pos)
         return self.lambda_expression(parameters, pos)
 
     def lambda_statement(self, parameters: List[ast.Variable], pos: int, pos2: int) -> ast.Expression:
@@ -2074,17 +2373,17 @@ class JavaParser:
         """
         self.next_token()
         # 【异于 JDK 源码逻辑】不再检查 type_args 是否为空，以兼容 super() 的方法
-        if self.token.kind == TokenKind.LPAREN:
+        if self.token_kind is TK.LPAREN:
             return self.arguments(type_args, expression)
-        elif self.token.kind == TokenKind.COL_COL:
+        elif self.token_kind is TK.COL_COL:
             if type_args is not None:
-                self.raise_syntax_error(self.token.pos, "illegal")
+                self.raise_syntax_error(self.token_pos, "illegal")
             return self.member_reference_suffix(expression)
         else:
-            pos = self.token.pos
-            self.accept(TokenKind.DOT)
+            pos = self.token_pos
+            self.accept(TK.DOT)
             type_args: Optional[List[ast.Expression]] = None
-            if self.token.kind == TokenKind.LT:
+            if self.token_kind is TK.LT:
                 type_args = self.type_argument_list(False)
             name = self.ident()
             ident = ast.Identifier.create(
@@ -2126,10 +2425,13 @@ class JavaParser:
         >>> result.type_kind.name
         'BYTE'
         """
-        type_kind = grammar_hash.TOKEN_TO_TYPE_KIND[self.token.kind]
+        # 原生类型节点只包含当前 Token，位置信息和源代码直接从 Token 中读取
+        token = self.token
         primitive_type = ast.PrimitiveType.create(
-            type_kind=type_kind,
-            **self._info_include(self.token.pos)
+            type_kind=grammar_hash.TOKEN_TO_TYPE_KIND[token.kind],
+            start_pos=token.pos,
+            end_pos=token.end_pos,
+            source=token.source
         )
         self.next_token()
         return primitive_type
@@ -2161,7 +2463,7 @@ class JavaParser:
         ...     len(res1.arguments)
         2
         """
-        if (self.is_mode(Mode.EXPR) and self.token.kind == TokenKind.LPAREN) or type_args is not None:
+        if (self.mode & Mode.EXPR and self.token_kind is TK.LPAREN) or type_args is not None:
             self.select_expr_mode()
             return self.arguments(type_args, expression)
         else:
@@ -2177,16 +2479,25 @@ class JavaParser:
         [JDK Code] JavacParser.arguments()
         Arguments = "(" [Expression { COMMA Expression }] ")"
         """
-        args = []
-        if self.token.kind != TokenKind.LPAREN:
-            self.raise_syntax_error(self.token.pos, f"expect LPAREN, gut get {self.token.kind.name}")
+        if self.token_kind is not TK.LPAREN:
+            self.raise_syntax_error(self.token_pos, f"expect LPAREN, gut get {self.token_kind.name}")
         self.next_token()
-        if self.token.kind != TokenKind.RPAREN:
-            args.append(self.parse_expression())
-            while self.token.kind == TokenKind.COMMA:
+        if self.token_kind is TK.RPAREN:
+            self.next_token()
+            return []
+
+        parse_expression = self.parse_expression
+        kind_comma = TK.COMMA
+        args = [parse_expression()]  # 大多数调用只有 1 个实参，直接用首个实参构造列表
+        if self.token_kind is kind_comma:
+            append = args.append
+            while self.token_kind is kind_comma:
                 self.next_token()
-                args.append(self.parse_expression())
-        self.accept(TokenKind.RPAREN)
+                append(parse_expression())
+        if self.token_kind is TK.RPAREN:
+            self.next_token()
+        else:
+            self.accept(TK.RPAREN)  # 不匹配时由 accept 抛出语法错误
         return args
 
     def arguments(self, type_arguments: List[ast.Expression], expression: ast.Expression) -> ast.Expression:
@@ -2194,7 +2505,7 @@ class JavaParser:
 
         [JDK Code] JavacParser.arguments(List<JCExpression>, JCExpression)
         """
-        pos = self.token.pos
+        pos = self.token_pos
         arguments = self.argument_list()
         return ast.MethodInvocation.create(
             type_arguments=type_arguments,
@@ -2216,12 +2527,12 @@ class JavaParser:
         >>> parser.type_arguments_opt(ast.Expression.mock()).kind.name
         'PARAMETERIZED_TYPE'
         """
-        if self.token.kind == TokenKind.LT and self.is_mode(Mode.TYPE) and not self.is_mode(Mode.NO_PARAMS):
+        if self.token_kind is TK.LT and self.mode & Mode.TYPE and not self.mode & Mode.NO_PARAMS:
             self.select_type_mode()
             return self.type_arguments(expression, False)
         return expression
 
-    def type_argument_list_opt(self, use_mode: Mode = Mode.TYPE) -> Optional[List[ast.Expression]]:
+    def type_argument_list_opt(self, use_mode: int = Mode.TYPE) -> Optional[List[ast.Expression]]:
         """可选的多个类型实参的列表
 
         [JDK Code 1] JavacParser.typeArgumentsOpt()
@@ -2237,11 +2548,11 @@ class JavaParser:
         >>> JavaParser(LexicalFSM("")).type_argument_list_opt() is None
         True
         """
-        if self.token.kind != TokenKind.LT:
+        if self.token_kind is not TK.LT:
             return None
-        if not self.is_mode(use_mode) or self.is_mode(Mode.NO_PARAMS):
+        if not self.mode & use_mode or self.mode & Mode.NO_PARAMS:
             self.illegal()
-        self.set_mode(use_mode)
+        self.mode = use_mode
         return self.type_argument_list(False)
 
     def type_argument_list(self, diamond_allowed: bool) -> List[ast.Expression]:
@@ -2273,29 +2584,32 @@ class JavaParser:
         >>> len(JavaParser(LexicalFSM("<String, List<Tuple2<String, String>>>")).type_argument_list(True))
         2
         """
-        if self.token.kind != TokenKind.LT:
-            raise JavaSyntaxError(f"expect TokenKind.LT in type_arguments, but find {self.token.kind}")
+        if self.token_kind is not TK.LT:
+            raise JavaSyntaxError(f"expect TK.LT in type_arguments, but find {self.token_kind}")
 
         self.next_token()
-        if self.token.kind == TokenKind.GT and diamond_allowed:
-            self.set_mode(self.mode | Mode.DIAMOND)
+        if self.token_kind is TK.GT and diamond_allowed:
+            self.mode = self.mode | Mode.DIAMOND
             self.next_token()
             return []
 
-        args = [self.type_argument() if not self.is_mode(Mode.EXPR) else self.parse_type()]
-        while self.token.kind == TokenKind.COMMA:
+        kind_comma = TK.COMMA
+        args = [self.type_argument() if not self.mode & Mode.EXPR else self.parse_type()]
+        while self.token_kind is kind_comma:
             self.next_token()
-            args.append(self.type_argument() if not self.is_mode(Mode.EXPR) else self.parse_type())
+            args.append(self.type_argument() if not self.mode & Mode.EXPR else self.parse_type())
 
-        if self.token.kind in {TokenKind.GT_GT, TokenKind.GT_EQ, TokenKind.GT_GT_GT, TokenKind.GT_GT_EQ,
-                               TokenKind.GT_GT_GT_EQ}:
+        tk = self.token_kind
+        if tk in GT_COMPOUND:
             self.token = self.lexer.split()
-        elif self.token.kind == TokenKind.GT:
+            self.token_kind = self.token.kind
+            self.token_pos = self.token.pos
+        elif tk is TK.GT:
             self.next_token()
         else:
-            self.raise_syntax_error(self.token.pos,
+            self.raise_syntax_error(self.token_pos,
                                     f"expect GT or COMMA in type_arguments, "
-                                    f"but find {self.token.kind.name}({self.token.kind.value})")
+                                    f"but find {tk.name}({tk.value})")
 
         return args
 
@@ -2333,29 +2647,29 @@ class JavaParser:
         >>> JavaParser(LexicalFSM("? super Number & Comparable<?>>")).type_argument().kind.name
         'SUPER_WILDCARD'
         """
-        pos_1 = self.token.pos
+        pos_1 = self.token_pos
         annotations: List[ast.Annotation] = self.type_annotations_opt()
-        if self.token.kind != TokenKind.QUES:
+        if self.token_kind is not TK.QUES:
             return self.parse_type(False, annotations)
-        pos_2 = self.token.pos
+        pos_2 = self.token_pos
         self.next_token()
 
         wildcard: Optional[ast.Wildcard] = None
-        if self.token.kind == TokenKind.EXTENDS:
+        if self.token_kind is TK.EXTENDS:
             self.next_token()
             wildcard = ast.Wildcard.create_extends_wildcard(
                 bound=self.parse_type(),
                 **self._info_include(pos_2)
             )
-        elif self.token.kind == TokenKind.SUPER:
+        elif self.token_kind is TK.SUPER:
             self.next_token()
             wildcard = ast.Wildcard.create_super_wildcard(
                 bound=self.parse_type(),
                 **self._info_include(pos_2)
             )
-        elif self.token.kind in LAX_IDENTIFIER:
-            self.raise_syntax_error(self.token.pos, f"Expected GT, EXTENDS, SUPER, but get {self.token.kind.name}")
-        else:  # self.token.kind in {TokenKind.GT, TokenKind.GT_GT, TokenKind.GT_GT_GT, 。。。}
+        elif self.token_kind in LAX_IDENTIFIER:
+            self.raise_syntax_error(self.token_pos, f"Expected GT, EXTENDS, SUPER, but get {self.token_kind.name}")
+        else:  # self.token_kind in {TK.GT, TK.GT_GT, TK.GT_GT_GT, 。。。}
             wildcard = ast.Wildcard.create_unbounded_wildcard(
                 **self._info_include(pos_2)
             )
@@ -2385,7 +2699,7 @@ class JavaParser:
         >>> JavaParser(LexicalFSM("<String>")).type_arguments(ast.Expression.mock(), False).kind.name
         'PARAMETERIZED_TYPE'
         """
-        pos = self.token.pos
+        pos = self.token_pos
         type_arguments = self.type_argument_list(diamond_allowed=diamond_allowed)
         return ast.ParameterizedType.create(
             type_name=expression,
@@ -2412,41 +2726,67 @@ class JavaParser:
         >>> JavaParser(LexicalFSM("[][] = 5")).brackets_opt(ast.Identifier.mock(name="ident")).source
         '[][]'
         """
-        if annotations is None:
-            annotations = []
-
         next_level_annotations: List[ast.Annotation] = self.type_annotations_opt()
-        if self.token.kind == TokenKind.LBRACKET:
-            pos = self.token.pos
-            self.next_token()
-            expression = self.brackets_opt_cont(expression, pos, next_level_annotations)
-        elif len(next_level_annotations) > 0:
-            if self.permit_type_annotations_push_back is True:
+
+        # 循环读取每一层空方括号，记录每层的开始位置及其之前的注解（不再递归调用 brackets_opt_cont）
+        levels: Optional[List[Tuple[int, List[ast.Annotation]]]] = None
+        if self.token_kind is TK.LBRACKET:
+            levels = []
+            while self.token_kind is TK.LBRACKET:
+                levels.append((self.token_pos, next_level_annotations))
+                self.next_token()
+                if self.token_kind is TK.RBRACKET:
+                    self.next_token()
+                else:
+                    self.accept(TK.RBRACKET)
+                next_level_annotations = self.type_annotations_opt()
+
+        if next_level_annotations:
+            if self.permit_type_annotations_push_back:
                 self.type_annotations_pushed_back = next_level_annotations
             else:
                 return self.illegal(next_level_annotations[0].start_pos)
 
-        if len(annotations) > 0:
+        # 从最内层开始构造数组类型；所有层级均在读取完全部方括号后构造，所以结束位置相同
+        if levels is not None:
+            for pos, level_annotations in reversed(levels):
+                info = self._info_exclude(pos)
+                expression = ast.ArrayType.create(
+                    expression=expression,
+                    **info
+                )
+                if level_annotations:
+                    expression = ast.AnnotatedType.create(
+                        annotations=level_annotations,
+                        underlying_type=expression,
+                        **info
+                    )
+
+        if annotations:  # 只有存在注解时才构造 AnnotatedType 节点，None 和空列表均直接返回
             return ast.AnnotatedType.create(
                 annotations=annotations,
                 underlying_type=expression,
-                **self._info_include(self.token.pos)
+                **self._info_include(self.token_pos)
             )
         return expression
 
     def brackets_opt_cont(self, expression: ast.Expression, pos: int, annotations: List[ast.Annotation]):
         """构造数组类型对象"""
-        self.accept(TokenKind.RBRACKET)
+        if self.token_kind is TK.RBRACKET:
+            self.next_token()
+        else:
+            self.accept(TK.RBRACKET)
         expression = self.brackets_opt(expression)
+        info = self._info_exclude(pos)
         expression = ast.ArrayType.create(
             expression=expression,
-            **self._info_exclude(pos)
+            **info
         )
-        if len(annotations):
+        if annotations:
             expression = ast.AnnotatedType.create(
                 annotations=annotations,
                 underlying_type=expression,
-                **self._info_exclude(pos)
+                **info
             )
         return expression
 
@@ -2469,23 +2809,23 @@ class JavaParser:
         >>> JavaParser(LexicalFSM(".class"), mode=Mode.EXPR).brackets_suffix(ast.Expression.mock()).kind.name
         'MEMBER_SELECT'
         """
-        if self.is_mode(Mode.EXPR) and self.token.kind == TokenKind.DOT:
+        if self.mode & Mode.EXPR and self.token_kind is TK.DOT:
             self.select_expr_mode()
-            pos1 = self.token.pos
+            pos1 = self.token_pos
             self.next_token()  # 跳过 DOT
-            pos2 = self.token.pos
-            self.accept(TokenKind.CLASS)
+            pos2 = self.token_pos
+            self.accept(TK.CLASS)
             # TODO 待增加语法检查和错误语法处理逻辑
             return ast.MemberSelect.create(
                 expression=expression,
                 identifier=ast.Identifier.create(name="class", **self._info_exclude(pos2)),
                 **self._info_include(pos1)
             )
-        elif self.is_mode(Mode.TYPE):
-            if self.token.kind != TokenKind.COL_COL:
+        elif self.mode & Mode.TYPE:
+            if self.token_kind is not TK.COL_COL:
                 self.select_type_mode()
-        elif self.token.kind != TokenKind.COL_COL:
-            self.raise_syntax_error(self.token.pos, "DotClassExpected")
+        elif self.token_kind is not TK.COL_COL:
+            self.raise_syntax_error(self.token_pos, "DotClassExpected")
         return expression
 
     def member_reference_suffix(self, expression: ast.Expression, pos: Optional[int] = None) -> ast.Expression:
@@ -2511,14 +2851,17 @@ class JavaParser:
         'MEMBER_REFERENCE'
         """
         if pos is None:
-            pos = self.token.pos
-            self.accept(TokenKind.COL_COL)
+            pos = self.token_pos
+            if self.token_kind is TK.COL_COL:
+                self.next_token()
+            else:
+                self.accept(TK.COL_COL)
 
         self.select_expr_mode()
         type_arguments: Optional[List[ast.Expression]] = None
-        if self.token.kind == TokenKind.LT:
+        if self.token_kind is TK.LT:
             type_arguments = self.type_argument_list(False)
-        if self.token.kind == TokenKind.NEW:
+        if self.token_kind is TK.NEW:
             ref_mode = ReferenceMode.NEW
             ref_name = "init"
             self.next_token()
@@ -2563,10 +2906,8 @@ class JavaParser:
         new_annotations = self.type_annotations_opt()
 
         # 解析原生类型数组的场景
-        if (self.token.kind in {TokenKind.BYTE, TokenKind.SHORT, TokenKind.CHAR, TokenKind.INT, TokenKind.LONG,
-                                TokenKind.FLOAT, TokenKind.DOUBLE, TokenKind.BOOLEAN}
-                and type_args is None):
-            if len(new_annotations) == 0:
+        if self.token_kind in PRIMITIVE_TYPE and type_args is None:
+            if not new_annotations:
                 return self.array_creator_rest(new_pos, self.basic_type())
             else:
                 annotated_type = ast.AnnotatedType.create(
@@ -2584,33 +2925,35 @@ class JavaParser:
         diamond_found = False
         last_type_args_pos = -1
 
-        if self.token.kind == TokenKind.LT:
-            last_type_args_pos = self.token.pos
+        if self.token_kind is TK.LT:
+            last_type_args_pos = self.token_pos
             expression = self.type_arguments(expression, True)
-            diamond_found = self.is_mode(Mode.DIAMOND)
+            diamond_found = self.mode & Mode.DIAMOND
 
-        while self.token.kind == TokenKind.DOT:
+        while self.token_kind is TK.DOT:
             if diamond_found is True:
-                self.illegal(self.token.pos)
-            pos = self.token.pos
+                self.illegal(self.token_pos)
+            pos = self.token_pos
             self.next_token()
             type_annotations = self.type_annotations_opt()
             expression = ast.Identifier.create(
                 name=self.ident(),
                 **self._info_exclude(pos)
             )
-            if type_annotations is not None and len(type_annotations) > 0:
+            if type_annotations:
                 expression = ast.AnnotatedType.create(
                     annotations=type_annotations,
                     underlying_type=expression,
                     **self._info_exclude(pos)
                 )
-                if self.token.kind == TokenKind.LT:
-                    last_type_args_pos = self.token.pos
+                if self.token_kind is TK.LT:
+                    last_type_args_pos = self.token_pos
                     expression = self.type_arguments(expression, True)
-                    diamond_found = self.is_mode(Mode.DIAMOND)
-        self.set_mode(prev_mode)
-        if self.token.kind in {TokenKind.LBRACKET, TokenKind.MONKEYS_AT}:
+                    diamond_found = self.mode & Mode.DIAMOND
+        self.mode = prev_mode
+        # 类实例创建表达式远多于数组创建表达式，所以先判断左括号
+        tk = self.token_kind
+        if tk is TK.LPAREN:
             if new_annotations:
                 # TODO 考虑是否需要增加 insertAnnotationsToMostInner 的逻辑
                 expression = ast.AnnotatedType.create(
@@ -2618,14 +2961,8 @@ class JavaParser:
                     underlying_type=expression,
                     **self._info_include(None)
                 )
-
-            expression_2 = self.array_creator_rest(new_pos, expression)
-            if diamond_found:
-                self.raise_syntax_error(last_type_args_pos, "CannotCreateArrayWithDiamond")
-            if type_args:
-                self.raise_syntax_error(new_pos, "CannotCreateArrayWithTypeArguments")
-            return expression_2
-        elif self.token.kind == TokenKind.LPAREN:
+            return self.class_creator_rest(new_pos, None, type_args, expression)
+        elif tk in LBRACKET_OR_MONKEYS_AT:
             if new_annotations:
                 # TODO 考虑是否需要增加 insertAnnotationsToMostInner 的逻辑
                 expression = ast.AnnotatedType.create(
@@ -2633,9 +2970,15 @@ class JavaParser:
                     underlying_type=expression,
                     **self._info_include(None)
                 )
-            return self.class_creator_rest(new_pos, None, type_args, expression)
+
+            expression_2 = self.array_creator_rest(new_pos, expression)
+            if diamond_found:
+                self.raise_syntax_error(last_type_args_pos, "CannotCreateArrayWithDiamond")
+            if type_args:
+                self.raise_syntax_error(new_pos, "CannotCreateArrayWithTypeArguments")
+            return expression_2
         else:
-            self.raise_syntax_error(new_pos, f"expect LPAREN or LBRACKET, but get {self.token.kind.name}")
+            self.raise_syntax_error(new_pos, f"expect LPAREN or LBRACKET, but get {self.token_kind.name}")
 
     def inner_creator(self, new_pos: int,
                       type_args: List[ast.Expression],
@@ -2648,7 +2991,7 @@ class JavaParser:
         new_annotations = self.type_annotations_opt()
         expression = ast.Identifier.create(
             name=self.ident(),
-            **self._info_exclude(self.token.pos)
+            **self._info_exclude(self.token_pos)
         )
 
         if new_annotations:
@@ -2658,10 +3001,10 @@ class JavaParser:
                 **self._info_exclude(new_annotations[0].start_pos)
             )
 
-        if self.token.kind == TokenKind.LT:
+        if self.token_kind is TK.LT:
             prev_mode = self.mode
             expression = self.type_arguments(expression, True)
-            self.set_mode(prev_mode)
+            self.mode = prev_mode
 
         return self.class_creator_rest(new_pos, encl, type_args, expression)
 
@@ -2693,14 +3036,14 @@ class JavaParser:
         3
         """
         annotations = self.type_annotations_opt()
-        self.accept(TokenKind.LBRACKET)
-        if self.token.kind == TokenKind.RBRACKET:
-            self.accept(TokenKind.RBRACKET)
+        self.accept(TK.LBRACKET)
+        if self.token_kind is TK.RBRACKET:
+            self.accept(TK.RBRACKET)
             elem_type = self.brackets_opt(elem_type, annotations)
-            if self.token.kind != TokenKind.LBRACE:
-                self.raise_syntax_error(self.token.pos, "ArrayDimensionMissing")
+            if self.token_kind is not TK.LBRACE:
+                self.raise_syntax_error(self.token_pos, "ArrayDimensionMissing")
             array = self.array_initializer(new_pos, elem_type)
-            if len(annotations) > 0:
+            if annotations:
                 # 如果将注解没有写在 [ ] 之中，则需要修正它
                 assert isinstance(elem_type, ast.AnnotatedType)
                 assert elem_type.annotations == annotations
@@ -2711,21 +3054,21 @@ class JavaParser:
             dims: List[ast.Expression] = []
             dim_annotations: List[List[ast.Annotation]] = [annotations]
             dims.append(self.parse_expression())
-            self.accept(TokenKind.RBRACKET)
-            while self.token.kind in {TokenKind.LBRACKET, TokenKind.MONKEYS_AT}:
+            self.accept(TK.RBRACKET)
+            while self.token_kind in LBRACKET_OR_MONKEYS_AT:
                 maybe_dim_annotations = self.type_annotations_opt()
-                pos = self.token.pos
+                pos = self.token_pos
                 self.next_token()
-                if self.token.kind == TokenKind.RBRACKET:
+                if self.token_kind is TK.RBRACKET:
                     elem_type = self.brackets_opt_cont(elem_type, pos, maybe_dim_annotations)
                 else:
                     dim_annotations.append(maybe_dim_annotations)
                     dims.append(self.parse_expression())
-                    self.accept(TokenKind.RBRACKET)
+                    self.accept(TK.RBRACKET)
 
-            err_pos = self.token.pos
+            err_pos = self.token_pos
             initializers: Optional[List[ast.Expression]] = None
-            if self.token.kind == TokenKind.LBRACE:
+            if self.token_kind is TK.LBRACE:
                 initializers = self.array_initializer_elements()
 
             if initializers is not None:
@@ -2761,16 +3104,25 @@ class JavaParser:
         2
         """
         arguments = self.argument_list()
-        class_body: Optional[ast.NewClass] = None
-        if self.token.kind == TokenKind.LBRACE:
-            pos = self.token.pos
-            members: List[ast.Tree] = self.class_interface_or_record_body(None, False, False)
-            modifiers = ast.Modifiers.create_empty()
-            class_body = ast.Class.create_anonymous_class(
-                modifiers=modifiers,
-                members=members,
-                **self._info_exclude(pos)
+        if self.token_kind is not TK.LBRACE:
+            # 没有匿名类的类体（最常见的情况）
+            return ast.NewClass.create(
+                enclosing=enclosing,
+                type_arguments=type_arguments,
+                identifier=expression,
+                arguments=arguments,
+                class_body=None,
+                **self._info_exclude(new_pos)
             )
+
+        pos = self.token_pos
+        members: List[ast.Tree] = self.class_interface_or_record_body(None, False, False)
+        modifiers = ast.Modifiers.create_empty()
+        class_body = ast.Class.create_anonymous_class(
+            modifiers=modifiers,
+            members=members,
+            **self._info_exclude(pos)
+        )
         return ast.NewClass.create(
             enclosing=enclosing,
             type_arguments=type_arguments,
@@ -2831,19 +3183,33 @@ class JavaParser:
           VariableInitializer {, VariableInitializer}
 
         [JDK Code] JavacParser.arrayInitializerElements
+
+        Examples
+        --------
+        >>> len(JavaParser(LexicalFSM("{1, 2, 3,}")).array_initializer_elements())
+        3
+        >>> len(JavaParser(LexicalFSM("{,}")).array_initializer_elements())
+        0
         """
-        self.accept(TokenKind.LBRACE)
-        initializers = []
-        if self.token.kind == TokenKind.COMMA:
+        self.accept(TK.LBRACE)
+        if self.token_kind is TK.COMMA:
             self.next_token()
-        elif self.token.kind != TokenKind.RBRACE:
-            initializers.append(self.variable_initializer())
-            while self.token.kind == TokenKind.COMMA:
+            initializers = []
+        elif self.token_kind is not TK.RBRACE:
+            # 直接使用第一个元素构造列表，并在循环中使用绑定后的 append 方法
+            variable_initializer = self.variable_initializer
+            kind_comma = TK.COMMA
+            kind_rbrace = TK.RBRACE
+            initializers = [variable_initializer()]
+            append = initializers.append
+            while self.token_kind is kind_comma:
                 self.next_token()
-                if self.token.kind == TokenKind.RBRACE:
+                if self.token_kind is kind_rbrace:
                     break
-                initializers.append(self.variable_initializer())
-        self.accept(TokenKind.RBRACE)
+                append(variable_initializer())
+        else:
+            initializers = []
+        self.accept(TK.RBRACE)
         return initializers
 
     def variable_initializer(self) -> ast.Expression:
@@ -2862,8 +3228,8 @@ class JavaParser:
         >>> JavaParser(LexicalFSM("1")).variable_initializer().kind.name
         'INT_LITERAL'
         """
-        if self.token.kind == TokenKind.LBRACE:
-            return self.array_initializer(self.token.pos, None)
+        if self.token_kind is TK.LBRACE:
+            return self.array_initializer(self.token_pos, None)
         return self.parse_expression()
 
     def par_expression(self) -> ast.Parenthesized:
@@ -2877,10 +3243,10 @@ class JavaParser:
         >>> JavaParser(LexicalFSM("(expr)")).par_expression().kind.name
         'PARENTHESIZED'
         """
-        pos = self.token.pos
-        self.accept(TokenKind.LPAREN)
+        pos = self.token_pos
+        self.accept(TK.LPAREN)
         expression = self.parse_expression()
-        self.accept(TokenKind.RPAREN)
+        self.accept(TK.RPAREN)
         return ast.Parenthesized.create(
             expression=expression,
             **self._info_exclude(pos)
@@ -2906,9 +3272,9 @@ class JavaParser:
         2
         """
         if pos is None:
-            pos = self.token.pos
+            pos = self.token_pos
 
-        self.accept(TokenKind.LBRACE)
+        self.accept(TK.LBRACE)
         # TODO 待补充注释处理逻辑
         statements = self.block_statements()
         expression = ast.Block.create(
@@ -2917,9 +3283,9 @@ class JavaParser:
             **self._info_exclude(pos)
         )
         # TODO 待增加异常恢复机制
-        expression.end_pos = self.token.pos
+        expression.end_pos = self.token_pos
         expression.source += "}"
-        self.accept(TokenKind.RBRACE)
+        self.accept(TK.RBRACE)
         return expression
 
     def block_statements(self) -> List[ast.Statement]:
@@ -2963,7 +3329,7 @@ class JavaParser:
 
         [JDK Code] JavacParser.parseStatementAsBlock()
         """
-        pos = self.token.pos
+        pos = self.token_pos
         statements = self.block_statement()
         if not statements:
             self.raise_syntax_error(pos, "IllegalStartOfStmt")
@@ -3044,18 +3410,15 @@ class JavaParser:
         >>> JavaParser(LexicalFSM(demo7), mode=Mode.EXPR).block_statement()[0].kind.name
         'EXPRESSION_STATEMENT'
         """
-        pos = self.token.pos
+        pos = self.token_pos
 
-        if self.token.kind in {TokenKind.RBRACE, TokenKind.CASE, TokenKind.DEFAULT, TokenKind.EOF}:
+        if self.token_kind in BLOCK_STATEMENT_END:
             return []
 
-        if self.token.kind in {TokenKind.LBRACE, TokenKind.IF, TokenKind.FOR, TokenKind.WHILE, TokenKind.DO,
-                               TokenKind.TRY, TokenKind.SWITCH, TokenKind.SYNCHRONIZED, TokenKind.RETURN,
-                               TokenKind.THROW, TokenKind.BREAK, TokenKind.CONTINUE, TokenKind.SEMI, TokenKind.ELSE,
-                               TokenKind.FINALLY, TokenKind.CATCH, TokenKind.ASSERT}:
+        if self.token_kind in STATEMENT_START:
             return [self.parse_simple_statement()]
 
-        if self.token.kind in {TokenKind.MONKEYS_AT, TokenKind.FINAL}:
+        if self.token_kind in FINAL_OR_MONKEYS_AT:
             # TODO 待补充注释处理逻辑
             modifiers = self.modifiers_opt()
             if self.is_declaration():
@@ -3064,69 +3427,61 @@ class JavaParser:
                 expression = self.parse_type(allow_var=True)
                 return self.local_variable_declarations(modifiers, expression)
 
-        if self.token.kind in {TokenKind.ABSTRACT, TokenKind.STRICTFP}:
+        if self.token_kind in ABSTRACT_OR_STRICTFP:
             # TODO 待补充注释处理逻辑
             modifiers = self.modifiers_opt()
             return [self.class_or_record_or_interface_or_enum_declaration(modifiers)]
 
-        if self.token.kind in {TokenKind.INTERFACE, TokenKind.CLASS}:
+        if self.token_kind in CLASS_OR_INTERFACE:
             # TODO 待补充注释处理逻辑
             modifiers = self.modifiers_opt()
             return [self.class_or_record_or_interface_or_enum_declaration(modifiers)]
 
-        if self.token.kind == TokenKind.ENUM:
+        if self.token_kind is TK.ENUM:
             if not self.allow_records:
-                self.raise_syntax_error(self.token.pos, "localEnum")
+                self.raise_syntax_error(self.token_pos, "localEnum")
             # TODO 待补充注释处理逻辑
             modifiers = self.modifiers_opt()
             return [self.class_or_record_or_interface_or_enum_declaration(modifiers)]
 
-        if self.token.kind == TokenKind.IDENTIFIER:
+        if self.token_kind is TK.IDENTIFIER:
             # [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
             # YieldStatement:
             #   yield Expression ;
             if self.token.name == "yield" and self.allow_yield_statement:
                 next_token = self.lexer.token(1)
-                if next_token.kind in {TokenKind.PLUS, TokenKind.SUB, TokenKind.STRING_LITERAL, TokenKind.CHAR_LITERAL,
-                                       TokenKind.STRING_FRAGMENT, TokenKind.INT_OCT_LITERAL, TokenKind.INT_DEC_LITERAL,
-                                       TokenKind.INT_HEX_LITERAL, TokenKind.LONG_OCT_LITERAL,
-                                       TokenKind.LONG_DEC_LITERAL, TokenKind.LONG_HEX_LITERAL, TokenKind.FLOAT_LITERAL,
-                                       TokenKind.DOUBLE_LITERAL, TokenKind.NULL, TokenKind.IDENTIFIER,
-                                       TokenKind.UNDERSCORE, TokenKind.TRUE, TokenKind.FALSE, TokenKind.NEW,
-                                       TokenKind.SWITCH, TokenKind.THIS, TokenKind.SUPER, TokenKind.BYTE,
-                                       TokenKind.CHAR, TokenKind.SHORT, TokenKind.INT, TokenKind.LONG,
-                                       TokenKind.FLOAT, TokenKind.DOUBLE, TokenKind.VOID, TokenKind.BOOLEAN}:
+                if next_token.kind in YIELD_EXPRESSION_START:
                     is_yield_statement = True
-                elif next_token.kind in {TokenKind.PLUS_PLUS, TokenKind.SUB_SUB}:
-                    is_yield_statement = self.lexer.token(2).kind != TokenKind.SEMI
-                elif next_token.kind in {TokenKind.BANG, TokenKind.TILDE}:
+                elif next_token.kind in POSTFIX_INC_DEC:
+                    is_yield_statement = self.lexer.kind(2) is not TK.SEMI
+                elif next_token.kind in BANG_OR_TILDE:
                     # TODO 这里看起来 JDK 的逻辑有点问题
-                    is_yield_statement = self.lexer.token(1).kind != TokenKind.SEMI
-                elif next_token.kind == TokenKind.LPAREN:
+                    is_yield_statement = self.lexer.kind(1) is not TK.SEMI
+                elif next_token.kind is TK.LPAREN:
                     lookahead = 2
                     balance = 1
                     has_comma = False
                     in_type_args = False
                     while True:
-                        lookahead_token = self.lexer.token(lookahead)
-                        if not (lookahead_token.kind != TokenKind.EOF and balance != 0):
+                        lookahead_kind = self.lexer.kind(lookahead)
+                        if not (lookahead_kind is not TK.EOF and balance != 0):
                             break
-                        if lookahead_token.kind == TokenKind.LPAREN:
+                        if lookahead_kind is TK.LPAREN:
                             balance += 1
-                        elif lookahead_token.kind == TokenKind.RPAREN:
+                        elif lookahead_kind is TK.RPAREN:
                             balance -= 1
-                        elif lookahead_token.kind == TokenKind.COMMA:
+                        elif lookahead_kind is TK.COMMA:
                             if balance == 1 and not in_type_args:
                                 has_comma = True
                             else:
                                 break
-                        elif lookahead_token.kind == TokenKind.LT:
+                        elif lookahead_kind is TK.LT:
                             in_type_args = True
-                        elif lookahead_token.kind == TokenKind.GT:
+                        elif lookahead_kind is TK.GT:
                             in_type_args = False
                         lookahead += 1
-                    is_yield_statement = (not has_comma and lookahead != 3) or lookahead_token.kind == TokenKind.ARROW
-                elif next_token.kind == TokenKind.SEMI:
+                    is_yield_statement = (not has_comma and lookahead != 3) or lookahead_kind is TK.ARROW
+                elif next_token.kind is TK.SEMI:
                     is_yield_statement = True
                 else:
                     is_yield_statement = False
@@ -3134,7 +3489,7 @@ class JavaParser:
                 if is_yield_statement:
                     self.next_token()
                     expression = self.term(Mode.EXPR)
-                    self.accept(TokenKind.SEMI)
+                    self.accept(TK.SEMI)
                     return [ast.Yield.create(
                         value=expression,
                         **self._info_exclude(pos)
@@ -3142,10 +3497,10 @@ class JavaParser:
 
             else:
                 if self.is_non_sealed_class_start(local=True):
-                    self.raise_syntax_error(self.token.pos, "SealedOrNonSealedLocalClassesNotAllowed")
+                    self.raise_syntax_error(self.token_pos, "SealedOrNonSealedLocalClassesNotAllowed")
                     # TODO 待补充错误恢复机制
                 if self.is_sealed_class_start(local=True):
-                    self.raise_syntax_error(self.token.pos, "SealedOrNonSealedLocalClassesNotAllowed")
+                    self.raise_syntax_error(self.token_pos, "SealedOrNonSealedLocalClassesNotAllowed")
 
         if self.is_record_start() and self.allow_records:
             return [self.record_declaration(modifiers=ast.Modifiers.create_empty())]
@@ -3153,7 +3508,7 @@ class JavaParser:
         prev_token = self.token
         expression = self.term(Mode.EXPR | Mode.TYPE)
 
-        if self.token.kind == TokenKind.COLON and expression.kind == TreeKind.IDENTIFIER:
+        if self.token_kind is TK.COLON and expression.kind == TreeKind.IDENTIFIER:
             self.next_token()
             statement = self.parse_statement_as_block()
             return [ast.LabeledStatement.create(
@@ -3162,7 +3517,7 @@ class JavaParser:
                 **self._info_exclude(pos)
             )]
 
-        if self.was_type_mode() and self.token.kind in LAX_IDENTIFIER:
+        if self.last_mode & Mode.TYPE and self.token_kind in LAX_IDENTIFIER:
             modifiers = ast.Modifiers.create_empty()
             return self.local_variable_declarations(
                 modifiers=modifiers,
@@ -3174,7 +3529,7 @@ class JavaParser:
         # [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
         # ExpressionStatement:
         #   StatementExpression ;
-        self.accept(TokenKind.SEMI)
+        self.accept(TK.SEMI)
         return [ast.ExpressionStatement.create(
             expression=expression,
             **self._info_exclude(pos)
@@ -3207,7 +3562,7 @@ class JavaParser:
             v_defs=[],
             local_decl=True,
         )
-        self.accept(TokenKind.SEMI)
+        self.accept(TK.SEMI)
         # TODO 待补充代码位置处理逻辑
         return statements
 
@@ -3281,8 +3636,8 @@ class JavaParser:
         >>> JavaParser(LexicalFSM("assert name = 1 : \\"wrong\\"; ")).parse_simple_statement().kind.name
         'ASSERT'
         """
-        pos = self.token.pos
-        if self.token.kind == TokenKind.LBRACE:
+        pos = self.token_pos
+        if self.token_kind is TK.LBRACE:
             return self.block()
 
         # [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
@@ -3294,13 +3649,13 @@ class JavaParser:
         #
         # IfThenElseStatementNoShortIf:
         #   if ( Expression ) StatementNoShortIf else StatementNoShortIf
-        if self.token.kind == TokenKind.IF:
+        if self.token_kind is TK.IF:
             self.next_token()  # 跳过 IF
             condition = self.parse_expression()
             then_statement = self.parse_statement()
 
             else_statement: Optional[ast.Statement] = None
-            if self.token.kind == TokenKind.ELSE:
+            if self.token_kind is TK.ELSE:
                 self.next_token()  # 跳过 ELSE
                 else_statement = self.parse_statement_as_block()
 
@@ -3311,10 +3666,10 @@ class JavaParser:
                 **self._info_exclude(pos)
             )
 
-        if self.token.kind == TokenKind.FOR:
+        if self.token_kind is TK.FOR:
             self.next_token()
-            self.accept(TokenKind.LPAREN)
-            if self.token.kind == TokenKind.SEMI:
+            self.accept(TK.LPAREN)
+            if self.token_kind is TK.SEMI:
                 initializer = []
             else:
                 initializer = self.for_init()
@@ -3327,12 +3682,12 @@ class JavaParser:
             #   for ( LocalVariableDeclaration : Expression ) StatementNoShortIf
             variable = initializer[0] if len(initializer) >= 1 else None
             if (len(initializer) == 1
-                    and self.token.kind == TokenKind.COLON
+                    and self.token_kind is TK.COLON
                     and isinstance(variable, ast.Variable)
                     and variable.initializer is None):
-                self.accept(TokenKind.COLON)
+                self.accept(TK.COLON)
                 expression = self.parse_expression()
-                self.accept(TokenKind.RPAREN)
+                self.accept(TK.RPAREN)
                 statement = self.parse_statement_as_block()
                 return ast.EnhancedForLoop.create(
                     variable=variable,
@@ -3356,11 +3711,11 @@ class JavaParser:
             # BasicForStatementNoShortIf:
             #   for ( [ForInit] ; [Expression] ; [ForUpdate] ) StatementNoShortIf
             else:
-                self.accept(TokenKind.SEMI)
-                condition = None if self.token.kind == TokenKind.SEMI else self.parse_expression()
-                self.accept(TokenKind.SEMI)
-                update = [] if self.token.kind == TokenKind.RPAREN else self.for_update()
-                self.accept(TokenKind.RPAREN)
+                self.accept(TK.SEMI)
+                condition = None if self.token_kind is TK.SEMI else self.parse_expression()
+                self.accept(TK.SEMI)
+                update = [] if self.token_kind is TK.RPAREN else self.for_update()
+                self.accept(TK.RPAREN)
                 statement = self.parse_statement_as_block()
                 return ast.ForLoop.create(
                     initializer=initializer,
@@ -3376,7 +3731,7 @@ class JavaParser:
         #
         # WhileStatementNoShortIf:
         #   while ( Expression ) StatementNoShortIf
-        if self.token.kind == TokenKind.WHILE:
+        if self.token_kind is TK.WHILE:
             self.next_token()
             condition = self.par_expression()
             statement = self.parse_statement_as_block()
@@ -3389,12 +3744,12 @@ class JavaParser:
         # [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
         # DoStatement:
         #   do Statement while ( Expression ) ;
-        if self.token.kind == TokenKind.DO:
+        if self.token_kind is TK.DO:
             self.next_token()
             statement = self.parse_statement_as_block()
-            self.accept(TokenKind.WHILE)
+            self.accept(TK.WHILE)
             condition = self.par_expression()
-            self.accept(TokenKind.SEMI)
+            self.accept(TK.SEMI)
             return ast.DoWhileLoop.create(
                 condition=condition,
                 statement=statement,
@@ -3418,14 +3773,14 @@ class JavaParser:
         #
         # ResourceSpecification:
         #   ( ResourceList [;] )
-        if self.token.kind == TokenKind.TRY:
+        if self.token_kind is TK.TRY:
             self.next_token()
 
             # 解析资源部分
-            if self.token.kind == TokenKind.LPAREN:
+            if self.token_kind is TK.LPAREN:
                 self.next_token()
                 resources = self.resources()
-                self.accept(TokenKind.RPAREN)
+                self.accept(TK.RPAREN)
             else:
                 resources = []
 
@@ -3433,14 +3788,14 @@ class JavaParser:
 
             catches: List[ast.Catch] = []
             finally_block: Optional[ast.Block] = None
-            if self.token.kind in {TokenKind.CATCH, TokenKind.FINALLY}:
-                while self.token.kind == TokenKind.CATCH:
+            if self.token_kind in CATCH_OR_FINALLY:
+                while self.token_kind is TK.CATCH:
                     catches.append(self.catch_clause())
-                if self.token.kind == TokenKind.FINALLY:
+                if self.token_kind is TK.FINALLY:
                     self.next_token()
                     finally_block = self.block()
             elif not resources:
-                self.raise_syntax_error(self.token.pos, "TryWithoutCatchFinallyOrResourceDecls")
+                self.raise_syntax_error(self.token_pos, "TryWithoutCatchFinallyOrResourceDecls")
 
             return ast.Try.create(
                 block=block,
@@ -3453,10 +3808,10 @@ class JavaParser:
         # [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
         # SwitchStatement:
         #    ( Expression ) SwitchBlock
-        if self.token.kind == TokenKind.SWITCH:
+        if self.token_kind is TK.SWITCH:
             self.next_token()
             selector = self.par_expression()
-            self.accept(TokenKind.LBRACE)
+            self.accept(TK.LBRACE)
             cases = self.switch_block_statement_groups()
             expression = ast.Switch.create(
                 expression=selector,
@@ -3465,13 +3820,13 @@ class JavaParser:
             )
             expression.end_pos = self.token.end_pos
             expression.source += "}"
-            self.accept(TokenKind.RBRACE)
+            self.accept(TK.RBRACE)
             return expression
 
         # [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
         # SynchronizedStatement:
         #   synchronized ( Expression ) Block
-        if self.token.kind == TokenKind.SYNCHRONIZED:
+        if self.token_kind is TK.SYNCHRONIZED:
             self.next_token()
             expression = self.par_expression()
             block = self.block()
@@ -3484,13 +3839,13 @@ class JavaParser:
         # [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
         # ReturnStatement:
         #   return [Expression] ;
-        if self.token.kind == TokenKind.RETURN:
+        if self.token_kind is TK.RETURN:
             self.next_token()
-            if self.token.kind != TokenKind.SEMI:
+            if self.token_kind is not TK.SEMI:
                 expression = self.parse_expression()
             else:
                 expression = None
-            self.accept(TokenKind.SEMI)
+            self.accept(TK.SEMI)
             return ast.Return.create(
                 expression=expression,
                 **self._info_exclude(pos)
@@ -3499,10 +3854,10 @@ class JavaParser:
         # [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
         # ThrowStatement:
         #   throw Expression ;
-        if self.token.kind == TokenKind.THROW:
+        if self.token_kind is TK.THROW:
             self.next_token()
             expression = self.parse_expression()
-            self.accept(TokenKind.SEMI)
+            self.accept(TK.SEMI)
             return ast.Throw.create(
                 expression=expression,
                 **self._info_exclude(pos)
@@ -3511,13 +3866,13 @@ class JavaParser:
         # [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
         # BreakStatement:
         #   break [Identifier] ;
-        if self.token.kind == TokenKind.BREAK:
+        if self.token_kind is TK.BREAK:
             self.next_token()
-            if self.token.kind in LAX_IDENTIFIER:
+            if self.token_kind in LAX_IDENTIFIER:
                 label = self.ident()
             else:
                 label = None
-            self.accept(TokenKind.SEMI)
+            self.accept(TK.SEMI)
             return ast.Break.create(
                 label=label,
                 **self._info_exclude(pos)
@@ -3526,13 +3881,13 @@ class JavaParser:
         # [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
         # ContinueStatement:
         #   continue [Identifier] ;
-        if self.token.kind == TokenKind.CONTINUE:
+        if self.token_kind is TK.CONTINUE:
             self.next_token()
-            if self.token.kind in LAX_IDENTIFIER:
+            if self.token_kind in LAX_IDENTIFIER:
                 label = self.ident()
             else:
                 label = None
-            self.accept(TokenKind.SEMI)
+            self.accept(TK.SEMI)
             return ast.Continue.create(
                 label=label,
                 **self._info_exclude(pos)
@@ -3541,32 +3896,32 @@ class JavaParser:
         # [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
         # EmptyStatement:
         #   ;
-        if self.token.kind == TokenKind.SEMI:
+        if self.token_kind is TK.SEMI:
             self.next_token()
             return ast.EmptyStatement.create(**self._info_exclude(pos))
 
-        if self.token.kind == TokenKind.ELSE:
-            self.raise_syntax_error(self.token.pos, "ElseWithoutIf")
+        if self.token_kind is TK.ELSE:
+            self.raise_syntax_error(self.token_pos, "ElseWithoutIf")
 
-        if self.token.kind == TokenKind.FINALLY:
-            self.raise_syntax_error(self.token.pos, "FinallyWithoutTry")
+        if self.token_kind is TK.FINALLY:
+            self.raise_syntax_error(self.token_pos, "FinallyWithoutTry")
 
-        if self.token.kind == TokenKind.CATCH:
-            self.raise_syntax_error(self.token.pos, "CatchWithoutTry")
+        if self.token_kind is TK.CATCH:
+            self.raise_syntax_error(self.token_pos, "CatchWithoutTry")
 
         # [JDK Document] https://docs.oracle.com/javase/specs/jls/se22/html/jls-19.html
         # AssertStatement:
         #   assert Expression ;
         #   assert Expression : Expression ;
-        if self.token.kind == TokenKind.ASSERT:
+        if self.token_kind is TK.ASSERT:
             self.next_token()
             assertion = self.parse_expression()
-            if self.token.kind == TokenKind.COLON:
+            if self.token_kind is TK.COLON:
                 self.next_token()
                 message = self.parse_expression()
             else:
                 message = None
-            self.accept(TokenKind.SEMI)
+            self.accept(TK.SEMI)
             return ast.Assert.create(
                 assertion=assertion,
                 message=message,
@@ -3598,9 +3953,9 @@ class JavaParser:
         >>> res.parameter.variable_type.kind.name
         'UNION_TYPE'
         """
-        pos = self.token.pos
-        self.accept(TokenKind.CATCH)
-        self.accept(TokenKind.LPAREN)
+        pos = self.token_pos
+        self.accept(TK.CATCH)
+        self.accept(TK.LPAREN)
         modifiers = self.opt_final([Modifier.PARAMETER])
         catch_types = self.catch_types()
         if len(catch_types) > 1:
@@ -3611,7 +3966,7 @@ class JavaParser:
         else:
             param_type = catch_types[0]
         parameter = self.variable_declarator_id(modifiers, param_type, True, False)
-        self.accept(TokenKind.RPAREN)
+        self.accept(TK.RPAREN)
         block = self.block()
         return ast.Catch.create(
             parameter=parameter,
@@ -3629,7 +3984,7 @@ class JavaParser:
         [JDK Code] JavacParser.catchTypes()
         """
         catch_types = [self.parse_type()]
-        while self.token.kind == TokenKind.BAR:
+        while self.token_kind is TK.BAR:
             self.next_token()
             catch_types.append(self.parse_type())
             # TODO 考虑 JDK 源码注释中的问题
@@ -3647,13 +4002,13 @@ class JavaParser:
         """
         cases: List[ast.Case] = []
         while True:
-            pos = self.token.pos
-            if self.token.kind in {TokenKind.CASE, TokenKind.DEFAULT}:
+            pos = self.token_pos
+            if self.token_kind in CASE_OR_DEFAULT:
                 cases.extend(self.switch_block_statement_group())
-            elif self.token.kind in {TokenKind.RBRACE, TokenKind.EOF}:
+            elif self.token_kind in RBRACE_OR_EOF:
                 return cases
             else:
-                self.raise_syntax_error(pos, f"Expect CASE, DEFAULT, RBRACE, but get {self.token.kind.name}")
+                self.raise_syntax_error(pos, f"Expect CASE, DEFAULT, RBRACE, but get {self.token_kind.name}")
 
     def switch_block_statement_group(self) -> List[ast.Case]:
         """解析 switch 语句中的单个 case 语句子句
@@ -3662,16 +4017,16 @@ class JavaParser:
 
         TODO 待补充单元测试（block_statement 完成后）
         """
-        pos = self.token.pos
+        pos = self.token_pos
         statements: List[ast.Statement]
-        if self.token.kind == TokenKind.CASE:
+        if self.token_kind is TK.CASE:
             self.next_token()
             labels: List[ast.CaseLabel] = []
             allow_default = False
             while True:
                 label = self.parse_case_label(allow_default)
                 labels.append(label)
-                if self.token.kind != TokenKind.COMMA:
+                if self.token_kind is not TK.COMMA:
                     break
                 self.next_token()
                 # TODO 待确定 isNone 的逻辑是否正确
@@ -3680,8 +4035,8 @@ class JavaParser:
                                  and label.expression.kind == TreeKind.NULL_LITERAL)
 
             guard = self.parse_guard(labels[-1])
-            if self.token.kind == TokenKind.ARROW:
-                self.accept(TokenKind.ARROW)
+            if self.token_kind is TK.ARROW:
+                self.accept(TK.ARROW)
                 statements = [self.parse_statement_as_block()]
                 # TODO 补充检查逻辑
                 case_expression = ast.Case.create_rule(
@@ -3692,7 +4047,7 @@ class JavaParser:
                     **self._info_exclude(pos)
                 )
             else:
-                self.accept(TokenKind.COLON)
+                self.accept(TK.COLON)
                 statements = self.block_statements()
                 case_expression = ast.Case.create_statement(
                     labels=labels,
@@ -3704,12 +4059,12 @@ class JavaParser:
             # TODO 补充代码位置逻辑
             return [case_expression]
 
-        if self.token.kind == TokenKind.DEFAULT:
+        if self.token_kind is TK.DEFAULT:
             self.next_token()
             default_pattern = ast.DefaultCaseLabel.create(**self._info_exclude(pos))
             guard = self.parse_guard(default_pattern)
-            if self.token.kind == TokenKind.ARROW:
-                self.accept(TokenKind.ARROW)
+            if self.token_kind is TK.ARROW:
+                self.accept(TK.ARROW)
                 statements = [self.parse_statement_as_block()]
                 # TODO 补充检查逻辑
                 case_expression = ast.Case.create_rule(
@@ -3720,7 +4075,7 @@ class JavaParser:
                     **self._info_exclude(pos)
                 )
             else:
-                self.accept(TokenKind.COLON)
+                self.accept(TK.COLON)
                 statements = self.block_statements()
                 case_expression = ast.Case.create_statement(
                     labels=[default_pattern],
@@ -3768,10 +4123,10 @@ class JavaParser:
         >>> JavaParser(LexicalFSM("_ xxx")).parse_case_label(True).kind.name
         'PATTERN_CASE_LABEL'
         """
-        pattern_pos = self.token.pos
+        pattern_pos = self.token_pos
 
         # default
-        if self.token.kind == TokenKind.DEFAULT:
+        if self.token_kind is TK.DEFAULT:
             if not allow_default:
                 self.raise_syntax_error(pattern_pos, "DefaultLabelNotAllowed")
             self.next_token()
@@ -3810,9 +4165,9 @@ class JavaParser:
         >>> JavaParser(LexicalFSM("when expr")).parse_guard(ast.PatternCaseLabel.mock()) is not None
         True
         """
-        if not (self.token.kind == TokenKind.IDENTIFIER and self.token.name == "when"):
+        if not (self.token_kind is TK.IDENTIFIER and self.token.name == "when"):
             return None
-        pos = self.token.pos
+        pos = self.token_pos
         self.next_token()
         if label.kind != TreeKind.PATTERN_CASE_LABEL:
             self.raise_syntax_error(pos, "GuardNotAllowed")
@@ -3843,77 +4198,78 @@ class JavaParser:
         'EXPRESSION'
         >>> JavaParser(LexicalFSM("() -> xxx")).analyze_pattern(0).name
         'PATTERN'
+        >>> JavaParser(LexicalFSM("int[][] a")).analyze_pattern(0).name
+        'PATTERN'
+        >>> JavaParser(LexicalFSM("a[0] ->")).analyze_pattern(0).name
+        'EXPRESSION'
+        >>> JavaParser(LexicalFSM("Map.Entry<K, V> e")).analyze_pattern(0).name
+        'PATTERN'
         """
         type_depth = 0
         paren_depth = 0
         pending_result = grammar_enum.PatternResult.EXPRESSION
+        lexer_kind = self.lexer.kind
         while True:
-            token = self.lexer.token(lookahead)
-            if token.kind in {TokenKind.BYTE, TokenKind.SHORT, TokenKind.INT, TokenKind.LONG, TokenKind.FLOAT,
-                              TokenKind.DOUBLE, TokenKind.BOOLEAN, TokenKind.CHAR, TokenKind.VOID, TokenKind.ASSERT,
-                              TokenKind.ENUM, TokenKind.IDENTIFIER}:
-                if paren_depth == 0 and self.peek_token(lookahead, LAX_IDENTIFIER):
+            tk = lexer_kind(lookahead)
+            if tk in PATTERN_TYPE_START:
+                if paren_depth == 0 and lexer_kind(lookahead + 1) in LAX_IDENTIFIER:
                     if paren_depth == 0:
                         return grammar_enum.PatternResult.PATTERN
                     else:
                         pending_result = grammar_enum.PatternResult.EXPRESSION
                 elif (type_depth == 0 and paren_depth == 0
-                      and self.peek_token(lookahead, TokenKind.ARROW | TokenKind.COMMA)):
+                      and lexer_kind(lookahead + 1) in ARROW_OR_COMMA):
                     return grammar_enum.PatternResult.EXPRESSION
-            elif token.kind == TokenKind.UNDERSCORE:
-                if type_depth == 0 and self.peek_token(lookahead, TokenKind.RPAREN | TokenKind.COMMA):
+            elif tk is TK.UNDERSCORE:
+                next_kind = lexer_kind(lookahead + 1)
+                if type_depth == 0 and next_kind in RPAREN_OR_COMMA:
                     return grammar_enum.PatternResult.PATTERN
-                elif type_depth == 0 and self.peek_token(lookahead, LAX_IDENTIFIER):
+                elif type_depth == 0 and next_kind in LAX_IDENTIFIER:
                     if paren_depth == 0:
                         return grammar_enum.PatternResult.PATTERN
                     else:
                         pending_result = grammar_enum.PatternResult.PATTERN
-            elif token.kind in {TokenKind.DOT, TokenKind.QUES, TokenKind.EXTENDS, TokenKind.SUPER, TokenKind.COMMA}:
+            elif tk in PATTERN_TYPE_SKIP:
                 pass
-            elif token.kind == TokenKind.LT:
+            elif tk is TK.LT:
                 type_depth += 1
-            elif token.kind in {TokenKind.GT_GT_GT, TokenKind.GT_GT, TokenKind.GT}:
-                if token.kind == TokenKind.GT_GT_GT:
-                    type_depth -= 3
-                elif token.kind == TokenKind.GT_GT:
-                    type_depth -= 2
-                else:
-                    type_depth -= 1
-                if type_depth == 0 and not self.peek_token(lookahead, TokenKind.DOT):
-                    if self.peek_token(lookahead, LAX_IDENTIFIER | TokenKind.LPAREN):
+            elif tk in RIGHT_ANGLE_BRACKETS:
+                type_depth += grammar_hash.ANGLE_BRACKET_TO_DEPTH_DELTA[tk]
+                next_kind = lexer_kind(lookahead + 1)
+                if type_depth == 0 and next_kind is not TK.DOT:
+                    if next_kind in LAX_IDENTIFIER_OR_LPAREN:
                         return grammar_enum.PatternResult.PATTERN
                     else:
                         return grammar_enum.PatternResult.EXPRESSION
                 elif type_depth < 0:
                     return grammar_enum.PatternResult.EXPRESSION
-            elif token.kind == TokenKind.MONKEYS_AT:
+            elif tk is TK.MONKEYS_AT:
                 lookahead = self.skip_annotation(lookahead)
-            elif token.kind == TokenKind.LBRACKET:
-                if self.peek_token(lookahead, TokenKind.RBRACKET, LAX_IDENTIFIER):
-                    return grammar_enum.PatternResult.PATTERN
-                elif self.peek_token(lookahead, TokenKind.RBRACKET):
-                    lookahead += 1
-                else:
+            elif tk is TK.LBRACKET:
+                if lexer_kind(lookahead + 1) is not TK.RBRACKET:
                     return pending_result
-            elif token.kind == TokenKind.LPAREN:
-                if self.lexer.token(lookahead + 1).kind == TokenKind.RPAREN:
-                    if paren_depth != 0 and self.lexer.token(lookahead + 2).kind == TokenKind.ARROW:
+                if lexer_kind(lookahead + 2) in LAX_IDENTIFIER:
+                    return grammar_enum.PatternResult.PATTERN
+                lookahead += 1
+            elif tk is TK.LPAREN:
+                if lexer_kind(lookahead + 1) is TK.RPAREN:
+                    if paren_depth != 0 and lexer_kind(lookahead + 2) is TK.ARROW:
                         return grammar_enum.PatternResult.EXPRESSION
                     else:
                         return grammar_enum.PatternResult.PATTERN
                 paren_depth += 1
-            elif token.kind == TokenKind.RPAREN:
+            elif tk is TK.RPAREN:
                 paren_depth -= 1
                 if (paren_depth == 0 and type_depth == 0
-                        and self.peek_token(lookahead, TokenKind.IDENTIFIER)
+                        and lexer_kind(lookahead + 1) is TK.IDENTIFIER
                         and self.lexer.token(lookahead + 1).name == "when"):
                     return grammar_enum.PatternResult.PATTERN
-            elif token.kind == TokenKind.ARROW:
+            elif tk is TK.ARROW:
                 if paren_depth > 0:
                     return grammar_enum.PatternResult.EXPRESSION
                 else:
                     return pending_result
-            elif token.kind == TokenKind.FINAL:
+            elif tk is TK.FINAL:
                 if paren_depth > 0:
                     return grammar_enum.PatternResult.PATTERN
             else:
@@ -3938,9 +4294,9 @@ class JavaParser:
             expression=first,
             **self._info_exclude(pos)
         ))
-        while self.token.kind == TokenKind.COMMA:
+        while self.token_kind is TK.COMMA:
             self.next_token()
-            pos = self.token.pos
+            pos = self.token_pos
             expression = self.parse_expression()
             statements.append(ast.ExpressionStatement.create(
                 expression=expression,
@@ -3967,8 +4323,8 @@ class JavaParser:
         >>> len(JavaParser(LexicalFSM("int i = 0, j = 2"), mode=Mode.EXPR).for_init())
         2
         """
-        pos = self.token.pos
-        if self.token.kind in {TokenKind.FINAL, TokenKind.MONKEYS_AT}:
+        pos = self.token_pos
+        if self.token_kind in FINAL_OR_MONKEYS_AT:
             modifiers = self.opt_final([])
             variable_type = self.parse_type()
             return self.variable_declarators(
@@ -3979,7 +4335,7 @@ class JavaParser:
             )
 
         expression = self.term(Mode.EXPR | Mode.TYPE)
-        if self.was_type_mode() and self.token.kind in LAX_IDENTIFIER:
+        if self.last_mode & Mode.TYPE and self.token_kind in LAX_IDENTIFIER:
             modifiers = self.modifiers_opt()
             return self.variable_declarators(
                 modifiers=modifiers,
@@ -3988,7 +4344,7 @@ class JavaParser:
                 local_decl=True,
             )
 
-        if self.was_type_mode() and self.token.kind == TokenKind.COLON:
+        if self.last_mode & Mode.TYPE and self.token_kind is TK.COLON:
             self.raise_syntax_error(pos, "bad for-loop")
 
         return self.more_statement_expressions(pos, expression, [])
@@ -4010,7 +4366,7 @@ class JavaParser:
         >>> len(JavaParser(LexicalFSM("i++, j++"), mode=Mode.EXPR).for_update())
         2
         """
-        pos = self.token.pos
+        pos = self.token_pos
         first = self.parse_expression()
         return self.more_statement_expressions(pos, first, [])
 
@@ -4033,16 +4389,16 @@ class JavaParser:
         >>> JavaParser(LexicalFSM("@Select({1, 2, 3})")).annotations_opt(TreeKind.ANNOTATION)[0].arguments[0].kind.name
         'NEW_ARRAY'
         """
-        if self.token.kind != TokenKind.MONKEYS_AT:
+        if self.token_kind is not TK.MONKEYS_AT:
             return []
         annotations: List[ast.Annotation] = []
         prev_mode = self.mode
-        while self.token.kind == TokenKind.MONKEYS_AT:
-            pos = self.token.pos
+        while self.token_kind is TK.MONKEYS_AT:
+            pos = self.token_pos
             self.next_token()  # 跳过 MONKEYS_AT
             annotations.append(self.annotation(pos, kind))
-        self.set_last_mode(self.mode)
-        self.set_mode(prev_mode)
+        self.last_mode = self.mode
+        self.mode = prev_mode
         return annotations
 
     def type_annotations_opt(self) -> List[ast.Annotation]:
@@ -4050,6 +4406,8 @@ class JavaParser:
 
         [JDK Code] JavacParser.typeAnnotationsOpt()
         """
+        if self.token_kind is not TK.MONKEYS_AT:
+            return []  # 绝大多数位置没有类型注解，直接返回以省去 annotations_opt 的调用
         return self.annotations_opt(TreeKind.TYPE_ANNOTATION)
 
     def modifiers_opt(self, partial: Optional[ast.Modifiers] = None) -> ast.Modifiers:
@@ -4117,63 +4475,80 @@ class JavaParser:
         [<Modifier.PUBLIC: 'public'>, <Modifier.STATIC: 'static'>, <Modifier.FINAL: 'final'>]
         >>> JavaParser(LexicalFSM("private static final NUMBER")).modifiers_opt(None).flags
         [<Modifier.PUBLIC: 'private'>, <Modifier.STATIC: 'static'>, <Modifier.FINAL: 'final'>]
+        >>> JavaParser(LexicalFSM("final int")).modifiers_opt(None).start_pos
+        0
+        >>> JavaParser(LexicalFSM("int")).modifiers_opt(None).start_pos is None
+        True
         """
         if partial is not None:
             flags = partial.flags
             annotations = partial.annotations
             pos = partial.start_pos
         else:
+            # 大多数调用位置的当前 Token 不是修饰符（例如语句、代码块或类型的开始），此时直接返回空的修饰符节点
+            if self.token_kind not in MODIFIERS_OPT_AFFECTING and not self.token.deprecated_flag():
+                return ast.Modifiers.create_empty()
             flags = []
             annotations = []
-            pos = self.token.pos
+            pos = self.token_pos
 
         if self.token.deprecated_flag():
             flags.append(Modifier.DEPRECATED)
 
+        token_to_modifier = grammar_hash.TOKEN_TO_MODIFIER
+        next_token = self.next_token
         while True:
-            tk = self.token.kind
-            if flag := grammar_hash.TOKEN_TO_MODIFIER.get(tk):
+            tk = self.token_kind
+            if flag := token_to_modifier.get(tk):
                 flags.append(flag)
-                self.next_token()
-            elif tk == TokenKind.MONKEYS_AT:
-                last_pos = self.token.pos
-                self.next_token()
-                if self.token.kind != TokenKind.INTERFACE:
+                next_token()
+            elif tk is TK.MONKEYS_AT:
+                last_pos = self.token_pos
+                next_token()
+                if self.token_kind is not TK.INTERFACE:
                     annotation = self.annotation(last_pos, TreeKind.ANNOTATION)
                     # if first modifier is an annotation, set pos to annotation's
                     if len(flags) == 0 and len(annotations) == 0:
                         pos = annotation.start_pos
                     annotations.append(annotation)
                     flags = []
-            elif tk == TokenKind.IDENTIFIER:
+            elif tk is TK.IDENTIFIER:
                 if self.is_non_sealed_class_start(False):
                     flags.append(Modifier.NON_SEALED)
-                    self.next_token()
-                    self.next_token()
-                    self.next_token()
+                    self.advance(3)  # 跳过 non、-、sealed
                 if self.is_sealed_class_start(False):
                     flags.append(Modifier.SEALED)
-                    self.next_token()
+                    next_token()
                 break
             else:
                 break
 
-        if len(flags) > len(set(flags)):
-            self.raise_syntax_error(pos, "RepeatedModifier(存在重复的修饰符)")
-
-        tk = self.token.kind
-        if tk == TokenKind.ENUM:
+        # 使用位掩码 seen_mask 检查重复的修饰符，避免将 flags 转换为集合
+        modifier_to_bit = grammar_hash.MODIFIER_TO_BIT
+        seen_mask = 0
+        for flag in flags:
+            bit = modifier_to_bit[flag]
+            if seen_mask & bit:
+                self.raise_syntax_error(pos, "RepeatedModifier(存在重复的修饰符)")
+            seen_mask |= bit
+
+        tk = self.token_kind
+        if tk is TK.ENUM:
             flags.append(Modifier.ENUM)
-        elif tk == TokenKind.INTERFACE:
+        elif tk is TK.INTERFACE:
             flags.append(Modifier.INTERFACE)
 
-        if len([flag for flag in flags if not flag.is_virtual()]) == 0 and len(annotations) == 0:
+        # seen_mask 不包含 ENUM、INTERFACE 两个虚拟修饰符，可直接判断是否包含非虚拟修饰符
+        if not seen_mask & grammar_hash.NON_VIRTUAL_MODIFIER_MASK and not annotations:
             pos = None
 
+        start_pos, end_pos, source = self._span_exclude(pos)
         return ast.Modifiers.create(
             flags=flags,
             annotations=annotations,
-            **self._info_exclude(pos)
+            start_pos=start_pos,
+            end_pos=end_pos,
+            source=source
         )
 
     def annotation(self, pos: int, kind: TreeKind) -> ast.Annotation:
@@ -4218,7 +4593,7 @@ class JavaParser:
 
         [Java Code] JavacParser.annotationFieldValuesOpt()
         """
-        if self.token.kind == TokenKind.LPAREN:
+        if self.token_kind is TK.LPAREN:
             return self.annotation_field_values()
         else:
             return []
@@ -4233,14 +4608,11 @@ class JavaParser:
         [Java Code] JavacParser.annotationFieldValues()
         AnnotationFieldValues   = "(" [ AnnotationFieldValue { "," AnnotationFieldValue } ] ")"
         """
-        self.accept(TokenKind.LPAREN)
+        self.accept(TK.LPAREN)
         buf = []
-        if self.token.kind != TokenKind.RPAREN:
-            buf.append(self.annotation_field_value())
-            while self.token.kind == TokenKind.COMMA:
-                self.next_token()
-                buf.append(self.annotation_field_value())
-        self.accept(TokenKind.RPAREN)
+        if self.token_kind is not TK.RPAREN:
+            buf = self._comma_separated(self.annotation_field_value)
+        self.accept(TK.RPAREN)
         return buf
 
     def annotation_field_value(self) -> ast.Expression:
@@ -4250,12 +4622,12 @@ class JavaParser:
         AnnotationFieldValue    = AnnotationValue
                                 | Identifier "=" AnnotationValue
         """
-        if self.token.kind in LAX_IDENTIFIER:
+        if self.token_kind in LAX_IDENTIFIER:
             self.select_expr_mode()
             variable = self.term1()
-            if variable.kind == TreeKind.IDENTIFIER and self.token.kind == TokenKind.EQ:
-                pos = self.token.pos
-                self.accept(TokenKind.EQ)
+            if variable.kind == TreeKind.IDENTIFIER and self.token_kind is TK.EQ:
+                pos = self.token_pos
+                self.accept(TK.EQ)
                 expression = self.annotation_value()
                 return ast.Assignment.create(
                     variable=variable,
@@ -4291,26 +4663,26 @@ class JavaParser:
                                 | "{" [ AnnotationValue { "," AnnotationValue } ] [","] "}"
         """
         # Annotation
-        if self.token.kind == TokenKind.MONKEYS_AT:
-            pos = self.token.pos
+        if self.token_kind is TK.MONKEYS_AT:
+            pos = self.token_pos
             self.next_token()
             return self.annotation(pos, TreeKind.ANNOTATION)
 
         # "{" [ AnnotationValue { "," AnnotationValue } ] [","] "}"
-        if self.token.kind == TokenKind.LBRACE:
-            pos = self.token.pos
-            self.accept(TokenKind.LBRACE)
+        if self.token_kind is TK.LBRACE:
+            pos = self.token_pos
+            self.accept(TK.LBRACE)
             initializers = []
-            if self.token.kind == TokenKind.COMMA:
+            if self.token_kind is TK.COMMA:
                 self.next_token()
-            elif self.token.kind != TokenKind.RBRACE:
+            elif self.token_kind is not TK.RBRACE:
                 initializers.append(self.annotation_value())
-                while self.token.kind == TokenKind.COMMA:
+                while self.token_kind is TK.COMMA:
                     self.next_token()
-                    if self.token.kind == TokenKind.RBRACE:
+                    if self.token_kind is TK.RBRACE:
                         break
                     initializers.append(self.annotation_value())
-            self.accept(TokenKind.RBRACE)
+            self.accept(TK.RBRACE)
             return ast.NewArray.create(
                 array_type=None,
                 dimensions=[],
@@ -4360,7 +4732,7 @@ class JavaParser:
         >>> res[1].source
         'j = 2'
         """
-        return self.variable_declarators_rest(self.token.pos, modifiers, variable_type, self.ident_or_underscore(),
+        return self.variable_declarators_rest(self.token_pos, modifiers, variable_type, self.ident_or_underscore(),
                                               False, v_defs, local_decl)
 
     def variable_declarators_rest(self,
@@ -4383,7 +4755,7 @@ class JavaParser:
         """
         head = self.variable_declarator_rest(pos, modifiers, variable_type, name, req_init, local_decl, compound=False)
         v_defs.append(head)
-        while self.token.kind == TokenKind.COMMA:
+        while self.token_kind is TK.COMMA:
             # TODO 待增加代码位置逻辑
             self.next_token()
             v_defs.append(self.variable_declarator(modifiers, variable_type, req_init, local_decl))
@@ -4407,7 +4779,7 @@ class JavaParser:
 
         TODO 待补充注释处理逻辑
         """
-        return self.variable_declarator_rest(self.token.pos, modifiers, variable_type, self.ident_or_underscore(),
+        return self.variable_declarator_rest(self.token_pos, modifiers, variable_type, self.ident_or_underscore(),
                                              req_init, local_decl, True)
 
     def variable_declarator_rest(self,
@@ -4439,11 +4811,11 @@ class JavaParser:
         # TODO 待增加注释处理逻辑
 
         initializer = None
-        if self.token.kind == TokenKind.EQ:
+        if self.token_kind is TK.EQ:
             self.next_token()
             initializer = self.variable_initializer()
         elif req_init is True:
-            self.raise_syntax_error(self.token.pos, f"expect EQ, but get {self.token.kind.name}")
+            self.raise_syntax_error(self.token_pos, f"expect EQ, but get {self.token_kind.name}")
 
         elem_type: ast.Tree = ast.info.inner_most_type(variable_type, skip_annotations=True)
         if isinstance(elem_type, ast.Identifier):
@@ -4459,12 +4831,15 @@ class JavaParser:
                     # TODO 待补充代码位置逻辑
                     variable_type = None
 
+        start_pos, end_pos, source = self._span_exclude(pos)
         result = ast.Variable.create_by_name(
             modifiers=modifiers,
             name=name,
             variable_type=variable_type,
             initializer=initializer,
-            **self._info_exclude(pos)
+            start_pos=start_pos,
+            end_pos=end_pos,
+            source=source
         )
         # TODO 待处理代码位置
         return result
@@ -4477,16 +4852,28 @@ class JavaParser:
           Identifier but not permits, record, sealed, var, or yield
 
         [JDK Code] JavacParser.restrictedTypeName(JCExpression, boolean)
+
+        Examples
+        --------
+        >>> parser = JavaParser(LexicalFSM("var"))
+        >>> parser.restricted_type_name(parser.term(Mode.TYPE))
+        'var'
+        >>> parser = JavaParser(LexicalFSM("record[][]"))
+        >>> parser.restricted_type_name(parser.term(Mode.TYPE))
+        'record'
+        >>> parser = JavaParser(LexicalFSM("String[]"))
+        >>> parser.restricted_type_name(parser.term(Mode.TYPE)) is None
+        True
         """
-        if expression.kind == TreeKind.IDENTIFIER:
+        kind = expression.kind
+        while kind is TreeKind.ARRAY_TYPE:
+            assert isinstance(expression, ast.ArrayType)
+            expression = expression.expression
+            kind = expression.kind
+        if kind is TreeKind.IDENTIFIER:
             assert isinstance(expression, ast.Identifier)
             if expression.name is not None:
                 return self.restricted_type_name_starting_at_source(expression.name)
-            else:
-                return None
-        if expression.kind == TreeKind.ARRAY_TYPE:
-            assert isinstance(expression, ast.ArrayType)
-            return self.restricted_type_name(expression.expression)
         return None
 
     def restricted_type_name_starting_at_source(self, name: str) -> Optional[str]:
@@ -4531,16 +4918,30 @@ class JavaParser:
         elif variable_type is not None:
             pos = variable_type.start_pos
         else:
-            pos = self.token.pos
+            pos = self.token_pos
         if (self.allow_this_ident is False
                 and lambda_parameter is True
-                and self.token.kind not in LAX_IDENTIFIER
+                and self.token_kind not in LAX_IDENTIFIER
                 and modifiers.flags == Modifier.PARAMETER
                 and len(modifiers.annotations) == 0):
             self.raise_syntax_error(pos, "这是一个 lambda 表达式的参数，且 Token 类型不是标识符，且没有任何修饰符或注解，则意味着编译"
                                          "器本应假设该 lambda 表达式为显式形式，但它可能包含隐式参数或显式参数的混合")
 
-        if self.token.kind == TokenKind.UNDERSCORE and (catch_parameter or lambda_parameter):
+        tk = self.token_kind
+
+        # 最常见的情况：单个标识符作为变量名，此时不需要构造随后即被丢弃的 Identifier 节点
+        if tk is TK.IDENTIFIER and self.lexer.kind(1) is not TK.DOT:
+            name = self.ident()
+            variable_type = self.brackets_opt(variable_type)
+            return ast.Variable.create_by_name(
+                modifiers=modifiers,
+                name=name,
+                variable_type=variable_type,
+                initializer=None,
+                **self._info_exclude(pos)
+            )
+
+        if tk is TK.UNDERSCORE and (catch_parameter or lambda_parameter):
             expression = ast.Identifier.create(
                 name=self.ident_or_underscore(),
                 **self._info_exclude(pos)
@@ -4548,7 +4949,7 @@ class JavaParser:
         else:
             expression = self.qualident(False)
 
-        if expression.kind == TreeKind.IDENTIFIER and expression.name != "this":
+        if expression.kind is TreeKind.IDENTIFIER and expression.name != "this":
             variable_type = self.brackets_opt(variable_type)
             return ast.Variable.create_by_name(
                 modifiers=modifiers,
@@ -4585,10 +4986,10 @@ class JavaParser:
         2
         """
         defs: List[ast.Tree] = [self.resource()]
-        while self.token.kind == TokenKind.SEMI:
+        while self.token_kind is TK.SEMI:
             # TODO 待增加代码位置逻辑
             self.next_token()
-            if self.token.kind == TokenKind.RPAREN:
+            if self.token_kind is TK.RPAREN:
                 break
             defs.append(self.resource())
         return defs
@@ -4610,17 +5011,17 @@ class JavaParser:
         >>> JavaParser(LexicalFSM("ResourceType resource = new ResourceType()"), mode=Mode.EXPR).resource().kind.name
         'VARIABLE'
         """
-        if self.token.kind in {TokenKind.FINAL, TokenKind.MONKEYS_AT}:
+        if self.token_kind in FINAL_OR_MONKEYS_AT:
             modifiers = self.opt_final([])
             expression = self.parse_type(allow_var=True)
-            pos = self.token.pos
+            pos = self.token_pos
             name = self.ident_or_underscore()
             return self.variable_declarator_rest(pos, modifiers, expression, name, True, True, False)
 
         expression = self.term(Mode.EXPR | Mode.TYPE)
-        if self.was_type_mode() and self.token.kind in LAX_IDENTIFIER:
+        if self.last_mode & Mode.TYPE and self.token_kind in LAX_IDENTIFIER:
             modifiers = self.modifiers_opt()
-            pos = self.token.pos
+            pos = self.token_pos
             name = self.ident_or_underscore()
             return self.variable_declarator_rest(pos, modifiers, expression, name, True, True, False)
 
@@ -4640,7 +5041,7 @@ class JavaParser:
         seen_package = False
         members: List[ast.Tree] = []
 
-        if self.token.kind == TokenKind.MONKEYS_AT:
+        if self.token_kind is TK.MONKEYS_AT:
             modifiers = self.modifiers_opt()
 
         package: Optional[ast.Package] = None
@@ -4648,8 +5049,8 @@ class JavaParser:
         imports: List[ast.Import] = []
         type_declarations: List[ast.Tree] = []
 
-        if self.token.kind == TokenKind.PACKAGE:
-            package_pos = self.token.pos
+        if self.token_kind is TK.PACKAGE:
+            package_pos = self.token_pos
             annotations: List[ast.Annotation] = []
             seen_package = True
             if modifiers is not None:
@@ -4658,7 +5059,7 @@ class JavaParser:
                 modifiers = None
             self.next_token()
             package_name = self.qualident(allow_annotations=False)
-            self.accept(TokenKind.SEMI)
+            self.accept(TK.SEMI)
             package = ast.Package.create(
                 annotations=annotations,
                 package_name=package_name,
@@ -4670,17 +5071,17 @@ class JavaParser:
         first_type_decl = True
         is_implicit_class = False
 
-        while self.token.kind != TokenKind.EOF:
+        while self.token_kind is not TK.EOF:
             # TODO 增加错误恢复机制
             semi_list = []
-            while first_type_decl and modifiers is None and self.token.kind == TokenKind.SEMI:
-                pos = self.token.pos
+            while first_type_decl and modifiers is None and self.token_kind is TK.SEMI:
+                pos = self.token_pos
                 self.next_token()
                 semi_list.append(ast.EmptyStatement.create(**self._info_exclude(pos)))
-                if self.token.kind == TokenKind.EOF:
+                if self.token_kind is TK.EOF:
                     break
 
-            if first_type_decl and modifiers is None and self.token.kind == TokenKind.IMPORT:
+            if first_type_decl and modifiers is None and self.token_kind is TK.IMPORT:
                 # TODO 待补充检查逻辑
                 seen_import = True
                 imports.append(self.import_declaration())
@@ -4688,27 +5089,27 @@ class JavaParser:
                 # TODO 待补充注释逻辑
                 if first_type_decl and not seen_import and not seen_package:
                     consumed_top_level_doc = True
-                if modifiers is not None and self.token.kind != TokenKind.SEMI:
+                if modifiers is not None and self.token_kind is not TK.SEMI:
                     modifiers = self.modifiers_opt(modifiers)
-                if first_type_decl and self.token.kind == TokenKind.IDENTIFIER:
+                if first_type_decl and self.token_kind is TK.IDENTIFIER:
                     # TODO 待补充检查逻辑
                     module_kind = ModuleKind.STRONG
                     if self.token.name == "open":
                         module_kind = ModuleKind.OPEN
                         self.next_token()
-                    if self.token.kind == TokenKind.IDENTIFIER and self.token.name == "module":
+                    if self.token_kind is TK.IDENTIFIER and self.token.name == "module":
                         # TODO 待补充检查逻辑
                         module = self.module_decl(modifiers, module_kind)
                         consumed_top_level_doc = True
                         break
                     elif module_kind != ModuleKind.STRONG:
-                        self.raise_syntax_error(self.token.pos, "ExpectedModule")
+                        self.raise_syntax_error(self.token_pos, "ExpectedModule")
 
                 members.extend(semi_list)
 
                 # TODO 待增加推断地测试以查看顶级方法或字段是否可以被解析；如果方法或字段可以被解析，那么它将会被解析；否则将继续进行，就像隐式声明的类不存在一样
                 if self.is_definite_statement_start_token():
-                    self.raise_syntax_error(self.token.pos, "StatementNotExpected")
+                    self.raise_syntax_error(self.token_pos, "StatementNotExpected")
                 else:
                     type_declaration = self.type_declaration(modifiers)
                     if isinstance(type_declaration, ast.ExpressionStatement):
@@ -4744,16 +5145,16 @@ class JavaParser:
         >>> JavaParser(LexicalFSM(demo1)).module_decl(ast.Modifiers.mock(), ModuleKind.STRONG).kind.name
         'MODULE'
         """
-        pos = self.token.pos
+        pos = self.token_pos
         # TODO 待补充检查逻辑
 
         self.next_token()
         name = self.qualident(allow_annotations=False)
 
-        self.accept(TokenKind.LBRACE)
+        self.accept(TK.LBRACE)
         directives: List[ast.Directive] = self.module_directive_list()
-        self.accept(TokenKind.RBRACE)
-        self.accept(TokenKind.EOF)
+        self.accept(TK.RBRACE)
+        self.accept(TK.EOF)
 
         # TODO 待考虑是否需要增加子类
         result = ast.Module.create(
@@ -4809,33 +5210,33 @@ class JavaParser:
         'PROVIDES'
         """
         defs: List[ast.Directive] = []
-        while self.token.kind == TokenKind.IDENTIFIER:
-            pos = self.token.pos
+        while self.token_kind is TK.IDENTIFIER:
+            pos = self.token_pos
             if self.token.name == "requires":
                 self.next_token()
                 is_transitive = False
                 is_static = False
                 while True:
-                    if self.token.kind == TokenKind.IDENTIFIER:
+                    if self.token_kind is TK.IDENTIFIER:
                         if self.token.name == "transitive":
                             t1 = self.lexer.token(1)
-                            if t1.kind in {TokenKind.SEMI, TokenKind.DOT}:
+                            if t1.kind in SEMI_OR_DOT:
                                 break
                             if is_transitive:
-                                self.raise_syntax_error(self.token.pos, "RepeatedModifier")
+                                self.raise_syntax_error(self.token_pos, "RepeatedModifier")
                             is_transitive = True
                         else:
                             break
-                    elif self.token.kind == TokenKind.STATIC:
+                    elif self.token_kind is TK.STATIC:
                         if is_static:
-                            self.raise_syntax_error(self.token.pos, "RepeatedModifier")
+                            self.raise_syntax_error(self.token_pos, "RepeatedModifier")
                         is_static = True
                     else:
                         break
                     self.next_token()
 
                 module_name = self.qualident(allow_annotations=False)
-                self.accept(TokenKind.SEMI)
+                self.accept(TK.SEMI)
                 defs.append(ast.Requires.create(
                     is_static=is_static,
                     is_transitive=is_transitive,
@@ -4848,10 +5249,10 @@ class JavaParser:
                 self.next_token()
                 package_name = self.qualident(allow_annotations=False)
                 module_names: Optional[List[ast.Expression]] = None
-                if self.token.kind == TokenKind.IDENTIFIER and self.token.name == "to":
+                if self.token_kind is TK.IDENTIFIER and self.token.name == "to":
                     self.next_token()
                     module_names = self.qualident_list(allow_annotation=False)
-                self.accept(TokenKind.SEMI)
+                self.accept(TK.SEMI)
                 if exports:
                     defs.append(ast.Exports.create(
                         package_name=package_name,
@@ -4869,12 +5270,12 @@ class JavaParser:
                 self.next_token()
                 service_name = self.qualident(allow_annotations=False)
                 implementation_names: List[ast.Expression] = []
-                if self.token.kind == TokenKind.IDENTIFIER and self.token.name == "with":
+                if self.token_kind is TK.IDENTIFIER and self.token.name == "with":
                     self.next_token()
                     implementation_names = self.qualident_list(allow_annotation=False)
                 else:
-                    self.raise_syntax_error(self.token.pos, f"expect with, but get {self.token.kind.name}")
-                self.accept(TokenKind.SEMI)
+                    self.raise_syntax_error(self.token_pos, f"expect with, but get {self.token_kind.name}")
+                self.accept(TK.SEMI)
                 defs.append(ast.Provides.create(
                     service_name=service_name,
                     implementation_names=implementation_names,
@@ -4884,7 +5285,7 @@ class JavaParser:
             elif self.token.name == "uses":
                 self.next_token()
                 service_name = self.qualident(allow_annotations=False)
-                self.accept(TokenKind.SEMI)
+                self.accept(TK.SEMI)
                 defs.append(ast.Uses.create(
                     service_name=service_name,
                     **self._info_exclude(pos)
@@ -4929,25 +5330,25 @@ class JavaParser:
         >>> JavaParser(LexicalFSM("import static a.b.*;")).import_declaration().kind.name
         'IMPORT'
         """
-        pos = self.token.pos
+        pos = self.token_pos
         self.next_token()
         is_static = False
-        if self.token.kind == TokenKind.STATIC:
+        if self.token_kind is TK.STATIC:
             is_static = True
             self.next_token()
-        elif (self.token.kind == TokenKind.IDENTIFIER
+        elif (self.token_kind is TK.IDENTIFIER
               and self.token.name == "module"
-              and self.peek_token(0, TokenKind.IDENTIFIER)):
+              and self.peek_token(0, TK.IDENTIFIER)):
             # TODO 待补充检查逻辑
             self.next_token()
             module_name = self.qualident(allow_annotations=False)
-            self.accept(TokenKind.SEMI)
+            self.accept(TK.SEMI)
             return ast.Import.create_module(
                 identifier=module_name,
                 **self._info_exclude(pos)
             )
 
-        pos_2 = self.token.pos
+        pos_2 = self.token_pos
         name = self.ident()
         pid = ast.Identifier.create(
             name=name,
@@ -4955,9 +5356,9 @@ class JavaParser:
         )
 
         while True:
-            pos_1 = self.token.pos
-            self.accept(TokenKind.DOT)
-            if self.token.kind == TokenKind.STAR:
+            pos_1 = self.token_pos
+            self.accept(TK.DOT)
+            if self.token_kind is TK.STAR:
                 pid = ast.MemberSelect.create(
                     expression=pid,
                     identifier=ast.Identifier.create(
@@ -4978,10 +5379,10 @@ class JavaParser:
                 **self._info_exclude(pos_1)
             )
 
-            if self.token.kind != TokenKind.DOT:
+            if self.token_kind is not TK.DOT:
                 break
 
-        self.accept(TokenKind.SEMI)
+        self.accept(TK.SEMI)
         return ast.Import.create(
             is_static=is_static,
             is_module=False,
@@ -5009,8 +5410,8 @@ class JavaParser:
         >>> JavaParser(LexicalFSM(";")).type_declaration(None).kind.name
         'EMPTY_STATEMENT'
         """
-        pos = self.token.pos
-        if modifiers is None and self.token.kind == TokenKind.SEMI:
+        pos = self.token_pos
+        if modifiers is None and self.token_kind is TK.SEMI:
             self.next_token()
             return ast.EmptyStatement.create(**self._info_exclude(pos))
         else:
@@ -5045,15 +5446,15 @@ class JavaParser:
         >>> JavaParser(LexicalFSM(demo3)).class_or_record_or_interface_or_enum_declaration(mock).kind.name
         'CLASS'
         """
-        if self.token.kind == TokenKind.CLASS:
+        if self.token_kind is TK.CLASS:
             return self.class_declaration(modifiers)
         if self.is_record_start():
             return self.record_declaration(modifiers)
-        if self.token.kind == TokenKind.INTERFACE:
+        if self.token_kind is TK.INTERFACE:
             return self.interface_declaration(modifiers)
-        if self.token.kind == TokenKind.ENUM:
+        if self.token_kind is TK.ENUM:
             return self.enum_declaration(modifiers)
-        return self.raise_syntax_error(self.token.pos, "cannot find class, record, interface or enum")
+        return self.raise_syntax_error(self.token_pos, "cannot find class, record, interface or enum")
 
     def class_declaration(self, modifiers: ast.Modifiers) -> ast.Class:
         """解析 class 声明语句
@@ -5081,19 +5482,19 @@ class JavaParser:
         >>> JavaParser(LexicalFSM(demo)).class_declaration(ast.Modifiers.mock()).kind.name
         'CLASS'
         """
-        pos = self.token.pos
-        self.accept(TokenKind.CLASS)
+        pos = self.token_pos
+        self.accept(TK.CLASS)
         name = self.type_name()
 
         type_parameters: List[ast.TypeParameter] = self.type_parameters_opt()
 
         extends_clause: Optional[ast.Expression] = None
-        if self.token.kind == TokenKind.EXTENDS:
+        if self.token_kind is TK.EXTENDS:
             self.next_token()
             extends_clause = self.parse_type()
 
         implements_clause = []
-        if self.token.kind == TokenKind.IMPLEMENTS:
+        if self.token_kind is TK.IMPLEMENTS:
             self.next_token()
             implements_clause = self.type_list()
 
@@ -5152,7 +5553,7 @@ class JavaParser:
 
         TODO 待补充单元测试
         """
-        pos = self.token.pos
+        pos = self.token_pos
         self.next_token()
         modifiers.flags.append(Modifier.RECORD)
         name = self.type_name()
@@ -5161,7 +5562,7 @@ class JavaParser:
         header_fields = self.formal_parameters(lambda_parameter=False, record_component=True)
 
         implements_clause = []
-        if self.token.kind == TokenKind.IMPLEMENTS:
+        if self.token_kind is TK.IMPLEMENTS:
             self.next_token()
             implements_clause = self.type_list()
 
@@ -5201,7 +5602,7 @@ class JavaParser:
         >>> JavaParser(LexicalFSM("String")).type_name()
         'String'
         """
-        pos = self.token.pos
+        pos = self.token_pos
         name = self.ident()
         if self.restricted_type_name_starting_at_source(name) is not None:
             self.raise_syntax_error(pos, f"RestrictedTypeNotAllowed: {name}")
@@ -5270,14 +5671,14 @@ class JavaParser:
         >>> JavaParser(LexicalFSM(demo)).interface_declaration(ast.Modifiers.mock()).kind.name
         'CLASS'
         """
-        pos = self.token.pos
-        self.accept(TokenKind.INTERFACE)
+        pos = self.token_pos
+        self.accept(TK.INTERFACE)
 
         name = self.type_name()
 
         type_parameters = self.type_parameters_opt()
         extends_clause = []
-        if self.token.kind == TokenKind.EXTENDS:
+        if self.token_kind is TK.EXTENDS:
             self.next_token()
             extends_clause = self.type_list()
 
@@ -5303,7 +5704,7 @@ class JavaParser:
 
         [JDK Code] JavacParser.permitsClause(JCModifiers mods, String classOrInterface)
         """
-        if self.allow_sealed_types and self.token.kind == TokenKind.IDENTIFIER and self.token.name == "permits":
+        if self.allow_sealed_types and self.token_kind is TK.IDENTIFIER and self.token.name == "permits":
             # TODO 待补充检查逻辑
             self.next_token()
             return self.qualident_list(allow_annotation=False)
@@ -5324,17 +5725,17 @@ class JavaParser:
         ...     ast.Modifiers.mock()).kind.name
         'CLASS'
         """
-        pos = self.token.pos
-        self.accept(TokenKind.ENUM)
+        pos = self.token_pos
+        self.accept(TK.ENUM)
 
         name = self.type_name()
-        type_name_pos = self.token.pos
+        type_name_pos = self.token_pos
         type_parameters = self.type_parameters_opt(parse_empty=True)
         if len(type_parameters) > 0:
             raise self.raise_syntax_error(type_name_pos, "EnumCantBeGeneric")
 
         implements_clause = []
-        if self.token.kind == TokenKind.IMPLEMENTS:
+        if self.token_kind is TK.IMPLEMENTS:
             self.next_token()
             implements_clause = self.type_list()
 
@@ -5377,22 +5778,22 @@ class JavaParser:
         >>> len(JavaParser(LexicalFSM("{ A(100), B(90), C(75), D(60); }")).enum_body("MyEnumName"))
         4
         """
-        self.accept(TokenKind.LBRACE)
+        self.accept(TK.LBRACE)
         members = []
         was_semi = False
-        if self.token.kind == TokenKind.COMMA:
+        if self.token_kind is TK.COMMA:
             self.next_token()
-            if self.token.kind == TokenKind.SEMI:
+            if self.token_kind is TK.SEMI:
                 was_semi = True
                 self.next_token()
-            elif self.token.kind != TokenKind.RBRACE:
+            elif self.token_kind is not TK.RBRACE:
                 self.raise_syntax_error(self.last_token.pos, "Expected RBRACE or SEMI")
 
-        while self.token.kind not in {TokenKind.RBRACE, TokenKind.EOF}:
-            if self.token.kind == TokenKind.SEMI:
-                self.accept(TokenKind.SEMI)
+        while self.token_kind not in RBRACE_OR_EOF:
+            if self.token_kind is TK.SEMI:
+                self.accept(TK.SEMI)
                 was_semi = True
-                if self.token.kind in {TokenKind.RBRACE, TokenKind.EOF}:
+                if self.token_kind in RBRACE_OR_EOF:
                     break
 
             member_type = self.estimate_enumerator_or_member(enum_name)
@@ -5404,18 +5805,18 @@ class JavaParser:
 
             if member_type == grammar_enum.EnumeratorEstimate.ENUMERATOR:
                 if was_semi:
-                    self.raise_syntax_error(self.token.pos, "EnumConstantNotExpected")
+                    self.raise_syntax_error(self.token_pos, "EnumConstantNotExpected")
                 members.append(self.enumerator_declaration(enum_name))
                 # TODO 待补充错误恢复机制
-                if self.token.kind not in {TokenKind.RBRACE, TokenKind.SEMI, TokenKind.EOF}:
-                    if self.token.kind == TokenKind.COMMA:
+                if self.token_kind not in RBRACE_SEMI_OR_EOF:
+                    if self.token_kind is TK.COMMA:
                         self.next_token()
                     else:
                         self.raise_syntax_error(self.last_token.pos,
-                                                f"expect COMMA, RBRACE, SEMI, but get {self.token.kind.name}")
+                                                f"expect COMMA, RBRACE, SEMI, but get {self.token_kind.name}")
             else:
                 if not was_semi:
-                    self.raise_syntax_error(self.token.pos, "EnumConstantExpected")
+                    self.raise_syntax_error(self.token_pos, "EnumConstantExpected")
                 members.extend(self.class_or_interface_or_record_body_declaration(
                     modifiers=None,
                     class_name=enum_name,
@@ -5424,7 +5825,7 @@ class JavaParser:
                 ))
                 # TODO 待补充检查和错误恢复机制
 
-        self.accept(TokenKind.RBRACE)
+        self.accept(TK.RBRACE)
         return members
 
     def estimate_enumerator_or_member(self, enum_name: str) -> grammar_enum.EnumeratorEstimate:
@@ -5441,18 +5842,17 @@ class JavaParser:
         >>> JavaParser(LexicalFSM("JSON,")).estimate_enumerator_or_member("MyEnumName").name
         'ENUMERATOR'
         """
-        if (self.token.kind in {TokenKind.IDENTIFIER, TokenKind.UNDERSCORE}
+        if (self.token_kind in IDENTIFIER_OR_UNDERSCORE
                 and self.token.name != enum_name
                 and (not self.allow_records or not self.is_record_start())):
             next_token = self.lexer.token(1)
             # 【异于 JDK 源码逻辑】当枚举类中没有其他内容时，最后一个枚举值末尾的 ";" 可以省略，此时下一个元素是 RBRACE
-            if next_token.kind in {TokenKind.LPAREN, TokenKind.LBRACE, TokenKind.COMMA, TokenKind.SEMI,
-                                   TokenKind.RBRACE}:
+            if next_token.kind in ENUMERATOR_FOLLOWER:
                 return grammar_enum.EnumeratorEstimate.ENUMERATOR
-        if self.token.kind == TokenKind.IDENTIFIER:
+        if self.token_kind is TK.IDENTIFIER:
             if self.allow_records and self.is_record_start():
                 return grammar_enum.EnumeratorEstimate.MEMBER
-        if self.token.kind in {TokenKind.MONKEYS_AT, TokenKind.LT, TokenKind.UNDERSCORE}:
+        if self.token_kind in ENUMERATOR_UNKNOWN_START:
             return grammar_enum.EnumeratorEstimate.UNKNOWN
         return grammar_enum.EnumeratorEstimate.MEMBER
 
@@ -5483,7 +5883,7 @@ class JavaParser:
         flags = [Modifier.PUBLIC, Modifier.STATIC, Modifier.FINAL, Modifier.ENUM]
         if self.token.deprecated_flag():
             flags.append(Modifier.DEPRECATED)
-        pos = self.token.pos
+        pos = self.token_pos
         annotations = self.annotations_opt(TreeKind.ANNOTATION)
         modifiers = ast.Modifiers.create(
             flags=flags,
@@ -5491,18 +5891,18 @@ class JavaParser:
             **self._info_exclude(None if not annotations else pos)
         )
         type_arguments = self.type_argument_list_opt()
-        ident_pos = self.token.pos
+        ident_pos = self.token_pos
         name = self.ident()
-        create_pos = self.token.pos
+        create_pos = self.token_pos
 
         # 解析枚举值的参数，例如：VALUE(1)
         arguments = []
-        if self.token.kind == TokenKind.LPAREN:
+        if self.token_kind is TK.LPAREN:
             arguments = self.argument_list()
 
         # 解析枚举值的定义逻辑
         class_body = None
-        if self.token.kind == TokenKind.LBRACE:
+        if self.token_kind is TK.LBRACE:
             modifiers = ast.Modifiers.create(
                 flags=[Modifier.ENUM],
                 annotations=None,
@@ -5562,11 +5962,7 @@ class JavaParser:
         >>> len(JavaParser(LexicalFSM("Class1, Class2")).type_list())
         2
         """
-        type_list = [self.parse_type()]
-        while self.token.kind == TokenKind.COMMA:
-            self.next_token()
-            type_list.append(self.parse_type())
-        return type_list
+        return self._comma_separated(self.parse_type)
 
     def class_interface_or_record_body(self,
                                        class_name: Optional[str],
@@ -5587,13 +5983,13 @@ class JavaParser:
         >>> len(JavaParser(LexicalFSM("{ static {} \\n {} }")).class_interface_or_record_body(None, False, False))
         2
         """
-        self.accept(TokenKind.LBRACE)
+        self.accept(TK.LBRACE)
         # TODO 补充错误恢复逻辑
         defs: List[ast.Tree] = []
-        while self.token.kind not in {TokenKind.RBRACE, TokenKind.EOF}:
+        while self.token_kind not in RBRACE_OR_EOF:
             defs.extend(self.class_or_interface_or_record_body_declaration(None, class_name, is_interface, is_record))
             # TODO 补充错误恢复逻辑
-        self.accept(TokenKind.RBRACE)
+        self.accept(TK.RBRACE)
         return defs
 
     def class_or_interface_or_record_body_declaration(self,
@@ -5668,11 +6064,11 @@ class JavaParser:
         ...     None, None, False,False)[0].kind.name
         'VARIABLE'
         """
-        if self.token.kind == TokenKind.SEMI:
+        if self.token_kind is TK.SEMI:
             self.next_token()
             return []
 
-        pos = self.token.pos
+        pos = self.token_pos
 
         # 解析修饰词
         modifiers = self.modifiers_opt(modifiers)
@@ -5688,15 +6084,15 @@ class JavaParser:
         # StaticInitializer:
         #   static Block
         non_static_modifier = [modifier for modifier in modifiers.actual_flags if modifier != Modifier.STATIC]
-        if self.token.kind == TokenKind.LBRACE and len(non_static_modifier) == 0 and not modifiers.annotations:
+        if self.token_kind is TK.LBRACE and len(non_static_modifier) == 0 and not modifiers.annotations:
             if is_interface:
-                self.raise_syntax_error(self.token.pos, "InitializerNotAllowed")
+                self.raise_syntax_error(self.token_pos, "InitializerNotAllowed")
             if is_record and Modifier.STATIC not in modifiers.flags:
-                self.raise_syntax_error(self.token.pos, "InstanceInitializerNotAllowedInRecords")
+                self.raise_syntax_error(self.token_pos, "InstanceInitializerNotAllowedInRecords")
             return [self.block(pos, is_static=Modifier.STATIC in modifiers.flags)]
 
         if self.is_definite_statement_start_token():
-            self.raise_syntax_error(self.token.pos, "StatementNotExpected")
+            self.raise_syntax_error(self.token_pos, "StatementNotExpected")
 
         return self.constructor_or_method_or_field_declaration(
             modifiers=modifiers,
@@ -5739,9 +6135,9 @@ class JavaParser:
             modifiers.annotations.extend(annotations_after_params)
             # TODO 待补充代码位置逻辑
 
-        pos = self.token.pos
+        pos = self.token_pos
         token = self.token
-        is_void = self.token.kind == TokenKind.VOID
+        is_void = self.token_kind is TK.VOID
         if is_void:
             return_type = ast.PrimitiveType.create_void(**self._info_include(pos))
             self.next_token()
@@ -5758,24 +6154,24 @@ class JavaParser:
         #
         # SimpleTypeName:
         #   TypeIdentifier
-        if (((self.token.kind == TokenKind.LPAREN and not is_interface) or
-             (self.token.kind == TokenKind.LBRACE and is_record)) and return_type.kind == TreeKind.IDENTIFIER):
+        if (((self.token_kind is TK.LPAREN and not is_interface) or
+             (self.token_kind is TK.LBRACE and is_record)) and return_type.kind == TreeKind.IDENTIFIER):
             if is_interface or token.name != class_name:
                 self.raise_syntax_error(pos, "InvalidMethDeclRetTypeReq")
             if annotations_after_params:
                 self.illegal()
 
-            if is_record and self.token.kind == TokenKind.LBRACE:
+            if is_record and self.token_kind is TK.LBRACE:
                 modifiers.flags.append(Modifier.COMPACT_RECORD_CONSTRUCTOR)
 
             return [self.method_declarator_rest(pos, modifiers, None, "init", type_parameters, is_interface, True,
                                                 is_record)]
 
         # Record constructor
-        if is_record and return_type.kind == TreeKind.IDENTIFIER and self.token.kind == TokenKind.THROWS:
+        if is_record and return_type.kind == TreeKind.IDENTIFIER and self.token_kind is TK.THROWS:
             self.raise_syntax_error(pos, "InvalidCanonicalConstructorInRecord")
 
-        pos = self.token.pos
+        pos = self.token_pos
         name = self.ident()
 
         # Method
@@ -5793,7 +6189,7 @@ class JavaParser:
         #
         # MethodDeclarator:
         #   Identifier ( [ReceiverParameter ,] [FormalParameterList] ) [Dims]
-        if self.token.kind == TokenKind.LPAREN:
+        if self.token_kind is TK.LPAREN:
             return [self.method_declarator_rest(pos, modifiers, return_type, name, type_parameters, is_interface,
                                                 is_void, False)]
 
@@ -5812,21 +6208,21 @@ class JavaParser:
                     v_defs=[],
                     local_decl=False
                 )
-                self.accept(TokenKind.SEMI)
+                self.accept(TK.SEMI)
                 return defs
 
             # TODO 待补充异常恢复逻辑
-            self.raise_syntax_error(self.token.pos, "RecordCannotDeclareInstanceFields")
+            self.raise_syntax_error(self.token_pos, "RecordCannotDeclareInstanceFields")
 
         # TODO 待补充异常恢复逻辑
-        self.raise_syntax_error(self.token.pos, f"expect LPAREN, but get {self.token.kind.name}")
+        self.raise_syntax_error(self.token_pos, f"expect LPAREN, but get {self.token_kind.name}")
 
     def is_declaration(self) -> bool:
         """TODO 名称待整理
 
         [JDK Code] JavacParser.isDeclaration()
         """
-        return (self.token.kind in {TokenKind.CLASS, TokenKind.INTERFACE, TokenKind.ENUM}
+        return (self.token_kind in CLASS_INTERFACE_OR_ENUM
                 or (self.is_record_start() and self.allow_records is True))
 
     def is_definite_statement_start_token(self) -> bool:
@@ -5834,18 +6230,16 @@ class JavaParser:
 
         [JDK Code] JavacParser.isDefiniteStatementStartToken
         """
-        return self.token.kind in {TokenKind.IF, TokenKind.WHILE, TokenKind.DO, TokenKind.RETURN, TokenKind.TRY,
-                                   TokenKind.FOR, TokenKind.ASSERT, TokenKind.BREAK, TokenKind.CONTINUE,
-                                   TokenKind.THROW}
+        return self.token_kind in DEFINITE_STATEMENT_START
 
     def is_record_start(self) -> bool:
         """TODO 名称待整理
 
         [JDK Code] JavacParser.isRecordStart()
         """
-        return (self.token.kind == TokenKind.IDENTIFIER
+        return (self.token_kind is TK.IDENTIFIER
                 and self.token.name == "record"
-                and self.peek_token(0, TokenKind.IDENTIFIER))
+                and self.peek_token(0, TK.IDENTIFIER))
 
     def is_non_sealed_class_start(self, local: bool):
         """如果从当前 Token 开始为 non-sealed 关键字则返回 True，否则返回 False
@@ -5867,13 +6261,17 @@ class JavaParser:
 
         [JDK Code] JavacParser.isNonSealedIdentifier
         """
-        if some_token.name == "non" and self.peek_token(lookahead, TokenKind.SUB, TokenKind.IDENTIFIER):
-            token_sub: Token = self.lexer.token(lookahead + 1)
-            token_sealed: Token = self.lexer.token(lookahead + 2)
-            return (some_token.end_pos == token_sub.pos
-                    and token_sub.end_pos == token_sealed.pos
-                    and token_sealed.name == "sealed")
-        return False
+        if some_token.name != "non":
+            return False
+        # 前瞻的 Token 已缓存在词法解析器中：先只读取类型列，匹配后再读取完整的 Token 比较位置和名称
+        lexer = self.lexer
+        if lexer.kind(lookahead + 1) is not TK.SUB or lexer.kind(lookahead + 2) is not TK.IDENTIFIER:
+            return False
+        token_sub: Token = lexer.token(lookahead + 1)
+        token_sealed: Token = lexer.token(lookahead + 2)
+        return (some_token.end_pos == token_sub.pos
+                and token_sub.end_pos == token_sealed.pos
+                and token_sealed.name == "sealed")
 
     def is_sealed_class_start(self, local: bool):
         """如果当前 Token 为 sealed 关键字则返回 True，否则返回 False
@@ -5896,15 +6294,13 @@ class JavaParser:
         [JDK Code] JavacParser.allowedAfterSealedOrNonSealed
         """
         tk = next_token.kind
-        if tk == TokenKind.MONKEYS_AT:
-            return self.lexer.token(2).kind != TokenKind.INTERFACE or current_is_non_sealed
+        if tk is TK.MONKEYS_AT:
+            return self.lexer.kind(2) is not TK.INTERFACE or current_is_non_sealed
         if local is True:
-            return tk in {TokenKind.ABSTRACT, TokenKind.FINAL, TokenKind.STRICTFP, TokenKind.CLASS, TokenKind.INTERFACE,
-                          TokenKind.ENUM}
-        elif tk in {TokenKind.PUBLIC, TokenKind.PROTECTED, TokenKind.PRIVATE, TokenKind.ABSTRACT, TokenKind.STATIC,
-                    TokenKind.FINAL, TokenKind.STRICTFP, TokenKind.CLASS, TokenKind.INTERFACE, TokenKind.ENUM}:
+            return tk in LOCAL_SEALED_FOLLOWER
+        elif tk in SEALED_FOLLOWER:
             return True
-        elif tk == TokenKind.IDENTIFIER:
+        elif tk is TK.IDENTIFIER:
             return (self.is_non_sealed_identifier(next_token, 3 if current_is_non_sealed else 1)
                     or next_token.name == "sealed")
         return False
@@ -5956,26 +6352,26 @@ class JavaParser:
             self.receiver_param = None
             parameters: List[ast.Variable] = []
             throws: List[ast.Expression] = []
-            if not is_record or name != "init" or self.token.kind == TokenKind.LPAREN:
+            if not is_record or name != "init" or self.token_kind is TK.LPAREN:
                 parameters = self.formal_parameters()
                 if not is_void:
                     return_type = self.brackets_opt(return_type)
-                if self.token.kind == TokenKind.THROWS:
+                if self.token_kind is TK.THROWS:
                     self.next_token()
                     throws = self.qualident_list(True)
 
             block: Optional[ast.Block] = None
             default_value: Optional[ast.Expression]
-            if self.token.kind == TokenKind.LBRACE:
+            if self.token_kind is TK.LBRACE:
                 block = self.block()
                 default_value = None
-            elif self.token.kind == TokenKind.DEFAULT:
-                self.accept(TokenKind.DEFAULT)
+            elif self.token_kind is TK.DEFAULT:
+                self.accept(TK.DEFAULT)
                 default_value = self.annotation_value()
-                self.accept(TokenKind.SEMI)
+                self.accept(TK.SEMI)
             else:
                 default_value = None
-                self.accept(TokenKind.SEMI)
+                self.accept(TK.SEMI)
             return ast.Method.create(
                 modifiers=modifiers,
                 name=name,
@@ -6020,7 +6416,7 @@ class JavaParser:
         else:
             result.append(qualident)
 
-        while self.token.kind == TokenKind.COMMA:
+        while self.token_kind is TK.COMMA:
             self.next_token()
 
             if allow_annotation:
@@ -6068,19 +6464,16 @@ class JavaParser:
         >>> len(JavaParser(LexicalFSM("<MyType1, MyType2>")).type_parameters_opt())
         2
         """
-        if self.token.kind != TokenKind.LT:
+        if self.token_kind is not TK.LT:
             return []
 
         self.next_token()
-        if parse_empty is True and self.token.kind == TokenKind.GT:
-            self.accept(TokenKind.GT)
+        if parse_empty is True and self.token_kind is TK.GT:
+            self.accept(TK.GT)
             return []
 
-        ty_params: List[ast.TypeParameter] = [self.type_parameter()]
-        while self.token.kind == TokenKind.COMMA:
-            self.next_token()
-            ty_params.append(self.type_parameter())
-        self.accept(TokenKind.GT)
+        ty_params: List[ast.TypeParameter] = self._comma_separated(self.type_parameter)
+        self.accept(TK.GT)
         return ty_params
 
     def type_parameter(self) -> ast.TypeParameter:
@@ -6114,14 +6507,14 @@ class JavaParser:
         >>> len(res.annotations)
         1
         """
-        pos = self.token.pos
+        pos = self.token_pos
         annotations: List[ast.Annotation] = self.type_annotations_opt()
         name: str = self.type_name()
         bounds: List[ast.Expression] = []
-        if self.token.kind == TokenKind.EXTENDS:
+        if self.token_kind is TK.EXTENDS:
             self.next_token()
             bounds.append(self.parse_type())
-            while self.token.kind == TokenKind.AMP:
+            while self.token_kind is TK.AMP:
                 self.next_token()
                 bounds.append(self.parse_type())
         return ast.TypeParameter.create(
@@ -6167,9 +6560,9 @@ class JavaParser:
         >>> len(JavaParser(LexicalFSM("(int value)")).formal_parameters())
         1
         """
-        self.accept(TokenKind.LPAREN)
+        self.accept(TK.LPAREN)
         params: List[ast.Variable] = []
-        if self.token.kind != TokenKind.RPAREN:
+        if self.token_kind is not TK.RPAREN:
             self.allow_this_ident = not lambda_parameter and not record_component
             self.select_type_mode()
             last_param = self.formal_parameter(lambda_parameter, record_component)
@@ -6178,12 +6571,13 @@ class JavaParser:
             else:
                 params.append(last_param)
             self.allow_this_ident = False
-            while self.token.kind == TokenKind.COMMA:
+            kind_comma = TK.COMMA
+            while self.token_kind is kind_comma:
                 self.next_token()
                 self.select_type_mode()
                 params.append(self.formal_parameter(lambda_parameter, record_component))
-        if self.token.kind != TokenKind.RPAREN:
-            self.raise_syntax_error(self.token.pos, f"expect COMMA, RPAREN or LBRACKET, but get {self.token.kind}")
+        if self.token_kind is not TK.RPAREN:
+            self.raise_syntax_error(self.token_pos, f"expect COMMA, RPAREN or LBRACKET, but get {self.token_kind}")
         self.next_token()
         return params
 
@@ -6219,25 +6613,29 @@ class JavaParser:
         'name2'
         """
         if has_parens is True:
-            self.accept(TokenKind.LPAREN)
+            self.accept(TK.LPAREN)
         params = []
-        if self.token.kind not in {TokenKind.RPAREN, TokenKind.ARROW}:
-            params.append(self.implicit_parameter())
-            while self.token.kind == TokenKind.COMMA:
-                self.next_token()
-                params.append(self.implicit_parameter())
+        if self.token_kind not in RPAREN_OR_ARROW:
+            params = self._comma_separated(self.implicit_parameter)
         if has_parens is True:
-            self.accept(TokenKind.RPAREN)
+            self.accept(TK.RPAREN)
         return params
 
     def opt_final(self, flags: List[Modifier]):
         """可选的 final 关键字
 
         [JDK Code] JavacParser.optFinal
+
+        Examples
+        --------
+        >>> JavaParser(LexicalFSM("final int x")).opt_final([Modifier.PARAMETER]).flags
+        [<Modifier.FINAL: 'final'>, <Modifier.PARAMETER: 'parameter'>]
         """
         modifiers = self.modifiers_opt()
-        if len({flag for flag in modifiers.flags if flag not in {Modifier.FINAL, Modifier.DEPRECATED}}) > 0:
-            self.raise_syntax_error(self.token.pos, f"存在不是 FINAL 的修饰符: {flags}")
+        # 修饰符列表通常为空或只有 final，遇到第一个不允许的修饰符时即抛出异常，不需要构造集合
+        for flag in modifiers.flags:
+            if flag is not Modifier.FINAL and flag is not Modifier.DEPRECATED:
+                self.raise_syntax_error(self.token_pos, f"存在不是 FINAL 的修饰符: {flags}")
         modifiers.flags.extend(flags)
         return modifiers
 
@@ -6288,7 +6686,7 @@ class JavaParser:
         param_type = self.parse_type(allow_var=False)
         self.permit_type_annotations_push_back = False
 
-        if self.token.kind == TokenKind.ELLIPSIS:
+        if self.token_kind is TK.ELLIPSIS:
             varargs_annotations: List[ast.Annotation] = self.type_annotations_pushed_back
             modifiers.flags.append(Modifier.VARARGS)
             # TODO 考虑是否需要增加 insertAnnotationsToMostInner 的逻辑
@@ -6298,7 +6696,9 @@ class JavaParser:
                 **self._info_include(None)
             )
             self.next_token()
-        self.type_annotations_pushed_back = []
+        # 被推迟的注解列表通常为空，仅在确实存入过注解时才替换为新的空列表（原列表可能已被 AnnotatedType 节点持有，不能原地清空）
+        if self.type_annotations_pushed_back:
+            self.type_annotations_pushed_back = []
         return self.variable_declarator_id(modifiers, param_type, False, lambda_parameter)
 
     def implicit_parameter(self) -> ast.Variable:
@@ -6318,7 +6718,7 @@ class JavaParser:
         modifiers = ast.Modifiers.create(
             flags=[Modifier.PARAMETER],
             annotations=None,
-            **self._info_include(self.token.pos)  # TODO 下标待修正
+            **self._info_include(self.token_pos)  # TODO 下标待修正
         )
         return self.variable_declarator_id(modifiers, None, False, True)
 
@@ -6328,8 +6728,42 @@ class JavaParser:
 
         [JDK Code] JavacParser.prec(TokenKind)
         """
-        return grammar_hash.TOKEN_TO_OPERATOR_PRECEDENCE.get(token_kind, grammar_enum.OperatorPrecedence.NO_PREC)
-
+        return _TOKEN_TO_OPERATOR_PRECEDENCE.get(token_kind, _NO_PREC)
+
+
+# term3 中根据第 1 个 Token（类型实参之后）的类型分派的解析方法
+_TERM3_DISPATCH = {
+    TK.QUES: JavaParser._term3_ques,
+    TK.LPAREN: JavaParser._term3_parens,
+    TK.THIS: JavaParser._term3_this,
+    TK.SUPER: JavaParser._term3_super,
+    TK.NEW: JavaParser._term3_new,
+    TK.MONKEYS_AT: JavaParser._term3_annotated,
+    TK.VOID: JavaParser._term3_void,
+    TK.SWITCH: JavaParser._term3_switch,
+}
+for _token_kind in (TK.PLUS_PLUS, TK.SUB_SUB, TK.BANG, TK.TILDE, TK.PLUS,
+                    TK.SUB):
+    _TERM3_DISPATCH[_token_kind] = JavaParser._term3_unary
+for _token_kind in (TK.INT_OCT_LITERAL, TK.INT_DEC_LITERAL, TK.INT_HEX_LITERAL,
+                    TK.LONG_OCT_LITERAL, TK.LONG_DEC_LITERAL, TK.LONG_HEX_LITERAL,
+                    TK.FLOAT_LITERAL, TK.DOUBLE_LITERAL, TK.CHAR_LITERAL,
+                    TK.STRING_LITERAL, TK.TRUE, TK.FALSE, TK.NULL):
+    _TERM3_DISPATCH[_token_kind] = JavaParser._term3_literal
+for _token_kind in (TK.UNDERSCORE, TK.IDENTIFIER, TK.ASSERT, TK.ENUM):
+    _TERM3_DISPATCH[_token_kind] = JavaParser._term3_identifier
+for _token_kind in (TK.BYTE, TK.SHORT, TK.CHAR, TK.INT, TK.LONG, TK.FLOAT,
+                    TK.DOUBLE, TK.BOOLEAN):
+    _TERM3_DISPATCH[_token_kind] = JavaParser._term3_primitive
+del _token_kind
+
+# 括号开头的表达式：按 analyze_parens 的结果分派
+_PARENS_DISPATCH = {
+    ParensResult.CAST: JavaParser._parens_cast,
+    ParensResult.IMPLICIT_LAMBDA: JavaParser._parens_implicit_lambda,
+    ParensResult.EXPLICIT_LAMBDA: JavaParser._parens_explicit_lambda,
+    ParensResult.PARENS: JavaParser._parens_plain,
+}
 
 if __name__ == "__main__":
     # print(JavaParser(LexicalFSM(" OTS }")).estimate_enumerator_or_member("KafkaType"))
@@ -3,9 +3,11 @@
 """
 
 import enum
+import types
 
 __all__ = [
-    "ParserMode"
+    "ParserMode",
+    "PARSER_MODE",
 ]
 
 
@@ -19,3 +21,8 @@ class ParserMode(enum.IntFlag):
     TYPE_ARG = enum.auto()  # 类型实参
     DIAMOND = enum.auto()
     NO_LAMBDA = enum.auto()  # 不允许 lambda 表达式
+
+
+# 解析模式的原生整数值：IntFlag 之间的位运算每次都会构造新的枚举对象，所以解析器内部使用原生 int 进行位运算；
+# 外部调用方（如 JavaParser 的 mode 参数）使用 ParserMode，PARSER_MODE 仅供解析器内部使用
+PARSER_MODE = types.SimpleNamespace(**{name: member.value for name, member in ParserMode.__members__.items()})
@@ -1,12 +1,207 @@
 """
 Token 类型的集合
+
+所有集合均为 frozenset：在模块加载时一次性构造，避免在解析循环中每次执行到时重新构造集合字面值；且 TokenKind 使用整数哈希，frozenset
+的成员检查比 TokenKind 按位或组合（IntFlag 的位掩码检查）快数倍
 """
 
+from metasequoia_java.grammar.grammar_hash.modifier import TOKEN_TO_MODIFIER
 from metasequoia_java.lexical import TokenKind
 
 __all__ = [
-    "LAX_IDENTIFIER"
+    "LAX_IDENTIFIER",
+    "PRIMITIVE_TYPE",
+    "RIGHT_ANGLE_BRACKETS",
+    "GT_COMPOUND",
+    "WILDCARD_BOUND",
+    "CASE_OR_DEFAULT",
+    "RBRACE_OR_EOF",
+    "POSTFIX_INC_DEC",
+    "LBRACKET_OR_MONKEYS_AT",
+    "LBRACKET_OR_ELLIPSIS",
+    "MEMBER_REF_TYPE_ELEMENT",
+    "MEMBER_REF_TYPE_FOLLOWER",
+    "CAST_FOLLOWER",
+    "PATTERN_TYPE_START",
+    "PATTERN_TYPE_SKIP",
+    "ARROW_OR_COMMA",
+    "RPAREN_OR_COMMA",
+    "LAX_IDENTIFIER_OR_LPAREN",
+    "RPAREN_OR_ARROW",
+    "ASSIGN_OPERATOR",
+    "LOCAL_SEALED_FOLLOWER",
+    "SEALED_FOLLOWER",
+    "MODIFIERS_OPT_AFFECTING",
+    "INT_OR_LONG_DEC_LITERAL",
+    "BLOCK_STATEMENT_END",
+    "STATEMENT_START",
+    "FINAL_OR_MONKEYS_AT",
+    "ABSTRACT_OR_STRICTFP",
+    "CLASS_OR_INTERFACE",
+    "YIELD_EXPRESSION_START",
+    "BANG_OR_TILDE",
+    "CATCH_OR_FINALLY",
+    "SEMI_OR_DOT",
+    "RBRACE_SEMI_OR_EOF",
+    "IDENTIFIER_OR_UNDERSCORE",
+    "ENUMERATOR_FOLLOWER",
+    "ENUMERATOR_UNKNOWN_START",
+    "CLASS_INTERFACE_OR_ENUM",
+    "DEFINITE_STATEMENT_START",
+    "IDENTIFIER_SUFFIX_START",
 ]
 
 # 所有类似标识符的 Token 类型的集合（Accepts all identifier-like tokens）
-LAX_IDENTIFIER = TokenKind.IDENTIFIER | TokenKind.UNDERSCORE | TokenKind.ASSERT | TokenKind.ENUM
+LAX_IDENTIFIER = frozenset({TokenKind.IDENTIFIER, TokenKind.UNDERSCORE, TokenKind.ASSERT, TokenKind.ENUM})
+
+# 基本类型
+PRIMITIVE_TYPE = frozenset({TokenKind.BYTE, TokenKind.SHORT, TokenKind.CHAR, TokenKind.INT, TokenKind.LONG,
+                            TokenKind.FLOAT, TokenKind.DOUBLE, TokenKind.BOOLEAN})
+
+# 泛型的右尖括号：>>>、>>、>
+RIGHT_ANGLE_BRACKETS = frozenset({TokenKind.GT_GT_GT, TokenKind.GT_GT, TokenKind.GT})
+
+# 以 > 开头的复合 Token，在类型实参列表的结尾需要拆分出第 1 个 >
+GT_COMPOUND = frozenset({TokenKind.GT_GT, TokenKind.GT_EQ, TokenKind.GT_GT_GT, TokenKind.GT_GT_EQ,
+                         TokenKind.GT_GT_GT_EQ})
+
+# 通配符的上界或下界：extends、super
+WILDCARD_BOUND = frozenset({TokenKind.EXTENDS, TokenKind.SUPER})
+
+# switch 语句中的子句开始：case、default
+CASE_OR_DEFAULT = frozenset({TokenKind.CASE, TokenKind.DEFAULT})
+
+# 代码块的结束：}、EOF
+RBRACE_OR_EOF = frozenset({TokenKind.RBRACE, TokenKind.EOF})
+
+# 后缀自增、自减运算符
+POSTFIX_INC_DEC = frozenset({TokenKind.PLUS_PLUS, TokenKind.SUB_SUB})
+
+# 数组维度的开始（可能包含类型注解）：[、@
+LBRACKET_OR_MONKEYS_AT = frozenset({TokenKind.LBRACKET, TokenKind.MONKEYS_AT})
+
+# 类型注解之后允许出现的 Token 类型：[、...
+LBRACKET_OR_ELLIPSIS = frozenset({TokenKind.LBRACKET, TokenKind.ELLIPSIS})
+
+# is_unbound_member_ref 中，在方法引用的类型部分中可以直接跳过的 Token 类型
+MEMBER_REF_TYPE_ELEMENT = frozenset({
+    TokenKind.IDENTIFIER, TokenKind.UNDERSCORE, TokenKind.QUES, TokenKind.EXTENDS, TokenKind.SUPER, TokenKind.DOT,
+    TokenKind.RBRACKET, TokenKind.LBRACKET, TokenKind.COMMA, TokenKind.BYTE, TokenKind.SHORT, TokenKind.INT,
+    TokenKind.LONG, TokenKind.FLOAT, TokenKind.DOUBLE, TokenKind.BOOLEAN, TokenKind.CHAR, TokenKind.MONKEYS_AT
+})
+
+# is_unbound_member_ref 中，在泛型闭合之后说明是方法引用的类型部分的 Token 类型
+MEMBER_REF_TYPE_FOLLOWER = frozenset({TokenKind.DOT, TokenKind.LBRACKET, TokenKind.COL_COL})
+
+# analyze_parens 中，右括号之后说明括号中为强制类型转换的 Token 类型
+CAST_FOLLOWER = frozenset({
+    TokenKind.CASE, TokenKind.TILDE, TokenKind.LPAREN, TokenKind.THIS, TokenKind.SUPER,
+    TokenKind.INT_OCT_LITERAL, TokenKind.INT_DEC_LITERAL, TokenKind.INT_HEX_LITERAL,
+    TokenKind.LONG_OCT_LITERAL, TokenKind.LONG_DEC_LITERAL, TokenKind.LONG_HEX_LITERAL,
+    TokenKind.FLOAT_LITERAL, TokenKind.DOUBLE_LITERAL, TokenKind.CHAR_LITERAL, TokenKind.STRING_LITERAL,
+    TokenKind.STRING_FRAGMENT, TokenKind.TRUE, TokenKind.FALSE, TokenKind.NULL, TokenKind.NEW,
+    TokenKind.IDENTIFIER, TokenKind.ASSERT, TokenKind.ENUM, TokenKind.UNDERSCORE, TokenKind.SWITCH,
+    TokenKind.BYTE, TokenKind.SHORT, TokenKind.CHAR, TokenKind.INT, TokenKind.LONG, TokenKind.FLOAT,
+    TokenKind.DOUBLE, TokenKind.BOOLEAN, TokenKind.VOID
+})
+
+# analyze_pattern 中可能是类型开始的 Token 类型
+PATTERN_TYPE_START = frozenset({
+    TokenKind.BYTE, TokenKind.SHORT, TokenKind.INT, TokenKind.LONG, TokenKind.FLOAT, TokenKind.DOUBLE,
+    TokenKind.BOOLEAN, TokenKind.CHAR, TokenKind.VOID, TokenKind.ASSERT, TokenKind.ENUM, TokenKind.IDENTIFIER
+})
+
+# analyze_pattern 中可以直接跳过的 Token 类型
+PATTERN_TYPE_SKIP = frozenset({TokenKind.DOT, TokenKind.QUES, TokenKind.EXTENDS, TokenKind.SUPER, TokenKind.COMMA})
+
+# analyze_pattern 中使用的前瞻 Token 类型
+ARROW_OR_COMMA = frozenset({TokenKind.ARROW, TokenKind.COMMA})
+RPAREN_OR_COMMA = frozenset({TokenKind.RPAREN, TokenKind.COMMA})
+LAX_IDENTIFIER_OR_LPAREN = frozenset({TokenKind.IDENTIFIER, TokenKind.UNDERSCORE, TokenKind.ASSERT, TokenKind.ENUM,
+                                      TokenKind.LPAREN})
+
+# 隐式 lambda 参数列表为空时的结束 Token：)、->
+RPAREN_OR_ARROW = frozenset({TokenKind.RPAREN, TokenKind.ARROW})
+
+# 赋值运算符：=、+=、-=、*=、/=、&=、|=、^=、%=、<<=、>>=、>>>=
+ASSIGN_OPERATOR = frozenset({TokenKind.EQ, TokenKind.PLUS_EQ, TokenKind.SUB_EQ, TokenKind.STAR_EQ, TokenKind.SLASH_EQ,
+                             TokenKind.AMP_EQ, TokenKind.BAR_EQ, TokenKind.CARET_EQ, TokenKind.PERCENT_EQ,
+                             TokenKind.LT_LT_EQ, TokenKind.GT_GT_EQ, TokenKind.GT_GT_GT_EQ})
+
+# 局部类声明中，sealed 或 non-sealed 之后允许出现的 Token 类型
+LOCAL_SEALED_FOLLOWER = frozenset({TokenKind.ABSTRACT, TokenKind.FINAL, TokenKind.STRICTFP, TokenKind.CLASS,
+                                   TokenKind.INTERFACE, TokenKind.ENUM})
+
+# 非局部类声明中，sealed 或 non-sealed 之后允许出现的 Token 类型（不包含需要进一步检查的 IDENTIFIER 和 MONKEYS_AT）
+SEALED_FOLLOWER = frozenset({TokenKind.PUBLIC, TokenKind.PROTECTED, TokenKind.PRIVATE, TokenKind.ABSTRACT,
+                             TokenKind.STATIC, TokenKind.FINAL, TokenKind.STRICTFP, TokenKind.CLASS, TokenKind.INTERFACE,
+                             TokenKind.ENUM})
+
+# 会被 modifiers_opt 处理的 Token 类型：修饰符关键字、注解、可能是 sealed 或 non-sealed 的标识符，以及会添加虚拟修饰符的 enum 和 interface
+MODIFIERS_OPT_AFFECTING = frozenset(TOKEN_TO_MODIFIER) | {TokenKind.MONKEYS_AT, TokenKind.IDENTIFIER, TokenKind.ENUM,
+                                                          TokenKind.INTERFACE}
+
+# 负号之后直接作为负数字面值解析的十进制整数字面值
+INT_OR_LONG_DEC_LITERAL = frozenset({TokenKind.INT_DEC_LITERAL, TokenKind.LONG_DEC_LITERAL})
+
+# block_statement 中说明代码块语句列表结束的 Token 类型：}、case、default、EOF
+BLOCK_STATEMENT_END = frozenset({TokenKind.RBRACE, TokenKind.CASE, TokenKind.DEFAULT, TokenKind.EOF})
+
+# block_statement 中直接作为语句解析的开始 Token 类型
+STATEMENT_START = frozenset({
+    TokenKind.LBRACE, TokenKind.IF, TokenKind.FOR, TokenKind.WHILE, TokenKind.DO, TokenKind.TRY, TokenKind.SWITCH,
+    TokenKind.SYNCHRONIZED, TokenKind.RETURN, TokenKind.THROW, TokenKind.BREAK, TokenKind.CONTINUE, TokenKind.SEMI,
+    TokenKind.ELSE, TokenKind.FINALLY, TokenKind.CATCH, TokenKind.ASSERT
+})
+
+# 可能是局部变量声明、资源声明或 catch 参数的修饰符开始：final、@
+FINAL_OR_MONKEYS_AT = frozenset({TokenKind.FINAL, TokenKind.MONKEYS_AT})
+
+# 局部类声明的修饰符开始：abstract、strictfp
+ABSTRACT_OR_STRICTFP = frozenset({TokenKind.ABSTRACT, TokenKind.STRICTFP})
+
+# 局部类或接口声明的开始：class、interface
+CLASS_OR_INTERFACE = frozenset({TokenKind.INTERFACE, TokenKind.CLASS})
+
+# block_statement 中，yield 之后说明是 yield 语句的 Token 类型
+YIELD_EXPRESSION_START = frozenset({
+    TokenKind.PLUS, TokenKind.SUB, TokenKind.STRING_LITERAL, TokenKind.CHAR_LITERAL, TokenKind.STRING_FRAGMENT,
+    TokenKind.INT_OCT_LITERAL, TokenKind.INT_DEC_LITERAL, TokenKind.INT_HEX_LITERAL, TokenKind.LONG_OCT_LITERAL,
+    TokenKind.LONG_DEC_LITERAL, TokenKind.LONG_HEX_LITERAL, TokenKind.FLOAT_LITERAL, TokenKind.DOUBLE_LITERAL,
+    TokenKind.NULL, TokenKind.IDENTIFIER, TokenKind.UNDERSCORE, TokenKind.TRUE, TokenKind.FALSE, TokenKind.NEW,
+    TokenKind.SWITCH, TokenKind.THIS, TokenKind.SUPER, TokenKind.BYTE, TokenKind.CHAR, TokenKind.SHORT, TokenKind.INT,
+    TokenKind.LONG, TokenKind.FLOAT, TokenKind.DOUBLE, TokenKind.VOID, TokenKind.BOOLEAN
+})
+
+# 逻辑非、按位取反运算符：!、~
+BANG_OR_TILDE = frozenset({TokenKind.BANG, TokenKind.TILDE})
+
+# try 语句的 catch 或 finally 子句的开始
+CATCH_OR_FINALLY = frozenset({TokenKind.CATCH, TokenKind.FINALLY})
+
+# 模块声明中，transitive 之后说明其为模块名而不是修饰符的 Token 类型：;、.
+SEMI_OR_DOT = frozenset({TokenKind.SEMI, TokenKind.DOT})
+
+# 枚举类中，枚举值之后不需要逗号分隔的 Token 类型：}、;、EOF
+RBRACE_SEMI_OR_EOF = frozenset({TokenKind.RBRACE, TokenKind.SEMI, TokenKind.EOF})
+
+# 标识符或下划线
+IDENTIFIER_OR_UNDERSCORE = frozenset({TokenKind.IDENTIFIER, TokenKind.UNDERSCORE})
+
+# estimate_enumerator_or_member 中，标识符之后说明是枚举值的 Token 类型
+ENUMERATOR_FOLLOWER = frozenset({TokenKind.LPAREN, TokenKind.LBRACE, TokenKind.COMMA, TokenKind.SEMI, TokenKind.RBRACE})
+
+# estimate_enumerator_or_member 中，无法确定是枚举值还是成员的开始 Token 类型：@、<、_
+ENUMERATOR_UNKNOWN_START = frozenset({TokenKind.MONKEYS_AT, TokenKind.LT, TokenKind.UNDERSCORE})
+
+# 类、接口或枚举类声明的开始（不包含需要进一步检查的 record）
+CLASS_INTERFACE_OR_ENUM = frozenset({TokenKind.CLASS, TokenKind.INTERFACE, TokenKind.ENUM})
+
+# 一定是语句开始的 Token 类型
+DEFINITE_STATEMENT_START = frozenset({
+    TokenKind.IF, TokenKind.WHILE, TokenKind.DO, TokenKind.RETURN, TokenKind.TRY, TokenKind.FOR, TokenKind.ASSERT,
+    TokenKind.BREAK, TokenKind.CONTINUE, TokenKind.THROW
+})
+
+# term3 中，标识符之后需要继续解析的 Token 类型：[、(、.、...、<
+IDENTIFIER_SUFFIX_START = frozenset({TokenKind.LBRACKET, TokenKind.LPAREN, TokenKind.DOT, TokenKind.ELLIPSIS, TokenKind.LT})
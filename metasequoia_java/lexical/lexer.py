@@ -12,7 +12,8 @@ TODO 增加 JavaDoc 的区分逻辑
 
 import abc
 import collections
-from typing import Dict, List, Optional, Tuple
+import sys
+from typing import Dict, List, Optional
 
 from metasequoia_java.lexical.charset import DEFAULT, END_CHAR, END_WORD, HEX_NUMBER, NUMBER, OCT_NUMBER
 from metasequoia_java.lexical.keyword_hash import KEYWORD_HASH
@@ -36,7 +37,7 @@ class LexicalFSM:
     其中类似 JDK 词法解析器 API 是通过 Bison 实现的。
     """
 
-    __slots__ = ("_text", "_length", "pos_start", "pos", "state", "affiliations", "_ahead")
+    __slots__ = ("_text", "_length", "pos_start", "pos", "state", "affiliations", "_ahead", "_ahead_kinds")
 
     def __init__(self, text: str):
         self._text: str = text  # Unicode 字符串
@@ -48,6 +49,7 @@ class LexicalFSM:
         self.affiliations: List[Affiliation] = []  # 还没有写入 Token 的附属元素的列表
 
         self._ahead: collections.deque[Token] = collections.deque()  # 提前获取前置元素的缓存
+        self._ahead_kinds: collections.deque[TokenKind] = collections.deque()  # 与 _ahead 一一对应的终结符类型缓存（前瞻扫描时只读取这一列）
 
     @property
     def text(self):
@@ -57,14 +59,6 @@ class LexicalFSM:
     def length(self) -> int:
         return self._length
 
-    # ------------------------------ Unicode 字符串迭代器 ------------------------------
-
-    def _char(self):
-        """返回当前字符"""
-        if self.pos == self._length:
-            return END_CHAR
-        return self._text[self.pos]
-
     # ------------------------------ 工具函数 ------------------------------
 
     def get_word(self) -> str:
@@ -80,39 +74,87 @@ class LexicalFSM:
     # ------------------------------ Bison API ------------------------------
 
     def lex(self) -> Token:
-        """解析并生成一个终结符"""
+        """解析并生成一个终结符
+
+        逐字符执行状态转移：先按状态取出该状态的行为映射表，再按字符查询行为（不需要为每个字符构造 (状态, 字符) 元组）
+        """
+        text = self._text
+        length = self._length
+        operation_map = FSM_OPERATION_MAP
+        operation_map_default = FSM_OPERATION_MAP_DEFAULT
         while True:
-            char = self._char()
+            pos = self.pos
+            char = END_CHAR if pos == length else text[pos]
+            state = self.state
 
-            # print(f"state: {self.state.name}({self.state.value}), char: {char}")
+            # print(f"state: {state.name}({state.value}), char: {char}")
 
-            operate: Optional["Operator"] = FSM_OPERATION_MAP.get((self.state, char))
+            operate: Optional["Operator"] = operation_map[state].get(char)
 
             if operate is None:
                 # 如果没有则使用当前状态的默认处理规则
-                operate: "Operator" = FSM_OPERATION_MAP_DEFAULT[self.state]
+                operate: "Operator" = operation_map_default[state]
 
             res: Optional[Token] = operate(self)
             if res is not None:
                 return res
 
+    def tokenize_all(self) -> List[Token]:
+        """一次性解析剩余的全部终结符（包含结束符），将其存入前置元素的缓存并返回
+
+        调用后，token(idx) 和 kind(idx) 均直接读取缓存，不会再触发词法解析
+        """
+        if len(self._ahead) == 0 or self._ahead_kinds[-1] is not TokenKind.EOF:
+            while True:
+                token = self.lex()
+                self._ahead.append(token)
+                self._ahead_kinds.append(token.kind)
+                if token.kind is TokenKind.EOF:
+                    break
+        return list(self._ahead)
+
     # ------------------------------ JDK 词法解析器 API ------------------------------
 
     def token(self, idx: int = 0):
         """提前获取当前终结符之后的第 idx 个终结符，其中 ahead(0) 对应当前终结符"""
         if len(self._ahead) <= idx:
             for _ in range(idx - len(self._ahead) + 1):
-                self._ahead.append(self.lex())
+                token = self.lex()
+                self._ahead.append(token)
+                self._ahead_kinds.append(token.kind)
         return self._ahead[idx]
 
+    def kind(self, idx: int = 0) -> TokenKind:
+        """提前获取当前终结符之后的第 idx 个终结符的类型；在已缓存时直接读取类型缓存，不访问 Token 对象"""
+        try:
+            return self._ahead_kinds[idx]
+        except IndexError:
+            return self.token(idx).kind
+
     def next_token(self):
-        if len(self._ahead) == 0:
-            self._ahead.append(self.lex())
-        self._ahead.popleft()
+        """将当前指向的终结符向后移动 1 个，并返回移动后的当前终结符（等价于 next_token() 之后调用 token(0)）"""
+        ahead = self._ahead
+        if len(ahead) == 0:
+            self.token(0)
+        ahead.popleft()
+        self._ahead_kinds.popleft()
+        if ahead:
+            return ahead[0]
+        return self.token(0)
+
+    def advance(self, n: int):
+        """将当前指向的终结符向后移动 n 个（等价于连续调用 n 次 next_token()）"""
+        if len(self._ahead) < n:
+            self.token(n - 1)
+        ahead = self._ahead
+        ahead_kinds = self._ahead_kinds
+        for _ in range(n):
+            ahead.popleft()
+            ahead_kinds.popleft()
 
     def split(self):
         if len(self._ahead) == 0:
-            self._ahead.append(self.lex())
+            self.token(0)
         if self._ahead[0].kind not in SPLIT_HASH:
             raise KeyError("拆分失败")  # TODO 待修改异常类型
         kind1, kind2 = SPLIT_HASH[self._ahead[0].kind]
@@ -131,6 +173,7 @@ class LexicalFSM:
             source=self._ahead[0].source[1:]
         )
         self._ahead[0] = token2
+        self._ahead_kinds[0] = kind2
         return token2
 
 
@@ -367,14 +410,18 @@ class ReduceDoubleSetState(Operator):
 
 
 class ReduceSetStateMaybeKeyword(Operator):
-    """【不移动指针】结束规约操作，尝试将当前词语解析为关键词"""
+    """【不移动指针】结束规约操作，尝试将当前词语解析为关键词
+
+    词语会被驻留（sys.intern）：同名标识符共享同一个字符串对象，语法解析器中与 "sealed"、"non"、"permits" 等常量名称的比较可以
+    直接命中字符串比较的同一对象快速路径，而不必逐字符比较。
+    """
 
     def __init__(self, state: LexicalState):
         self._state = state
 
     def __call__(self, fsm: LexicalFSM):
         pos = fsm.pos_start
-        source = fsm.get_word()
+        source = sys.intern(fsm.get_word())
         fsm.state = self._state
         fsm.pos_start = fsm.pos
         kind = KEYWORD_HASH.get(source, TokenKind.IDENTIFIER)
@@ -1035,10 +1082,12 @@ FSM_OPERATION_MAP_SOURCE: Dict[LexicalState, Dict[str, Operator]] = {
     }
 }
 
-# 状态行为映射表（用于用时行为映射信息，输入参数必须是一个字符）
-FSM_OPERATION_MAP: Dict[Tuple[LexicalState, str], Operator] = {}
+# 状态行为映射表（用于用时行为映射信息，先按状态、再按字符查询，输入参数必须是一个字符）
+FSM_OPERATION_MAP: Dict[LexicalState, Dict[str, Operator]] = {}
 FSM_OPERATION_MAP_DEFAULT: Dict[LexicalState, Operator] = {}
 for state_, operation_map in FSM_OPERATION_MAP_SOURCE.items():
+    state_operation_map = FSM_OPERATION_MAP[state_] = {}
+
     # 如果没有定义默认值，则默认其他字符为 Error
     if DEFAULT not in operation_map:
         FSM_OPERATION_MAP_DEFAULT[state_] = Error()
@@ -1048,18 +1097,18 @@ for state_, operation_map in FSM_OPERATION_MAP_SOURCE.items():
         if ch_or_set is DEFAULT:
             FSM_OPERATION_MAP_DEFAULT[state_] = fsm_operation
         elif isinstance(ch_or_set, str):
-            FSM_OPERATION_MAP[(state_, ch_or_set)] = fsm_operation
+            state_operation_map[ch_or_set] = fsm_operation
         elif isinstance(ch_or_set, frozenset):
             for ch in ch_or_set:
-                FSM_OPERATION_MAP[(state_, ch)] = fsm_operation
+                state_operation_map[ch] = fsm_operation
         else:
             raise KeyError("非法的行为映射表设置表")
 
     # 将 ASCII 编码 20 - 7E 之间的字符添加到行为映射表中（从而令第一次查询的命中率提高，避免第二次查询）
     for dec in range(32, 127):
         ch = chr(dec)
-        if (state_, ch) not in FSM_OPERATION_MAP:
-            FSM_OPERATION_MAP[(state_, ch)] = FSM_OPERATION_MAP_DEFAULT[state_]
+        if ch not in state_operation_map:
+            state_operation_map[ch] = FSM_OPERATION_MAP_DEFAULT[state_]
 
 if __name__ == "__main__":
     lexical_fsm = LexicalFSM(r'"(\"value\":\")([^\"]*)(\")"')
@@ -3,6 +3,7 @@ Java 终结符类型的枚举类
 """
 
 import enum
+import types
 
 
 class TokenKind(enum.IntFlag):
@@ -147,3 +148,8 @@ class TokenKind(enum.IntFlag):
 
     # ------------------------------ 其他元素 ------------------------------
     CUSTOM = enum.auto()
+
+
+# 终结符类型的命名空间：在 Python 3.11 中通过枚举类访问成员（TokenKind.LPAREN）需要经过枚举元类的描述符查找，比普通对象的属性访问慢
+# 数倍，所以语法解析器的热点路径通过该命名空间获取同一组枚举成员
+TOKEN_KIND = types.SimpleNamespace(**TokenKind.__members__)
@@ -0,0 +1,20 @@
+"""
+抽象语法树节点单元测试
+"""
+
+import inspect
+import unittest
+
+from metasequoia_java import ast
+from metasequoia_java.ast import node
+
+
+class AstTest(unittest.TestCase):
+    """测试用例"""
+
+    def test_node_slots(self):
+        """测试所有抽象语法树节点均使用 __slots__ 存储属性（实例没有 __dict__）"""
+        for name, cls in inspect.getmembers(node, inspect.isclass):
+            if issubclass(cls, ast.Tree):
+                for base in cls.__mro__[:-1]:
+                    self.assertIn("__slots__", vars(base), f"{name} 的基类 {base.__name__} 没有定义 __slots__")
@@ -1,10 +1,17 @@
+import concurrent.futures
+import inspect
+import sys
 import unittest
+import unittest.mock
 from typing import List, Tuple
 
 from metasequoia_java import ast
-from metasequoia_java.ast import TreeKind, constants
+from metasequoia_java.ast import Modifier, TreeKind, constants
+from metasequoia_java.grammar import parser as parser_module
+from metasequoia_java.grammar import token_set
 from metasequoia_java.grammar.parans_result import ParensResult
 from metasequoia_java.grammar.parser import JavaParser, JavaSyntaxError
+from metasequoia_java.grammar.token_set import LAX_IDENTIFIER
 from metasequoia_java.lexical import LexicalFSM
 from metasequoia_java.lexical import TokenKind
 
@@ -120,11 +127,32 @@ class LexicalTest(unittest.TestCase):
         self.assertEqual(4, res.identifier.start_pos)
         self.assertEqual(7, res.identifier.end_pos)
 
+    def test_intern_name(self):
+        # 标识符名称在词法解析时驻留，ident() 和 qualident() 返回的名称均为驻留后的同一个字符串对象
+        name = "".join(["value", "Name"])
+        res = JavaParser(LexicalFSM(f"{name}.{name}")).qualident(False)
+        self.assertIs(res.expression.name, res.identifier.name)
+        self.assertIs(sys.intern(name), JavaParser(LexicalFSM(name)).ident())
+
+    def test_split_token_kind(self):
+        # 语法解析器使用 is 比较终结符类型，拆分 >> 和 >>> 后得到的终结符类型同样需要是枚举单例
+        res = JavaParser(LexicalFSM("Map<String, List<List<Integer>>>")).parse_type()
+        self.assertEqual(TreeKind.PARAMETERIZED_TYPE, res.kind)
+        self.assertEqual(2, len(res.type_arguments))
+        self.assertEqual(TreeKind.PARAMETERIZED_TYPE, res.type_arguments[1].type_arguments[0].kind)
+        parser = JavaParser(LexicalFSM("List<List<String>> x"))
+        self.assertEqual(TreeKind.PARAMETERIZED_TYPE, parser.parse_type().kind)
+        self.assertIs(TokenKind.IDENTIFIER, parser.token_kind)
+
     def test_peek_token(self):
         self.assertTrue(JavaParser(LexicalFSM("1 + 2")).peek_token(0, TokenKind.PLUS))
         self.assertTrue(JavaParser(LexicalFSM("1 + 2")).peek_token(0, TokenKind.PLUS, TokenKind.INT_DEC_LITERAL))
         self.assertTrue(JavaParser(LexicalFSM("1 + 2")).peek_token(0, TokenKind.PLUS, TokenKind.INT_DEC_LITERAL,
                                                                    TokenKind.EOF))
+        self.assertFalse(JavaParser(LexicalFSM("1 + 2")).peek_token(0, TokenKind.SUB))
+        self.assertFalse(JavaParser(LexicalFSM("1 + 2")).peek_token(0, TokenKind.PLUS, TokenKind.IDENTIFIER))
+        self.assertTrue(JavaParser(LexicalFSM("(a) -> a")).peek_token(0, LAX_IDENTIFIER, TokenKind.RPAREN))
+        self.assertFalse(JavaParser(LexicalFSM("(1) -> a")).peek_token(0, LAX_IDENTIFIER, TokenKind.RPAREN))
 
     def test_skip_annotation(self):
         self.assertEqual(4, JavaParser(LexicalFSM("@abc(de) xxx")).skip_annotation(0))
@@ -137,3 +165,115 @@ class LexicalTest(unittest.TestCase):
         self.assertEqual(ParensResult.PARENS, JavaParser(LexicalFSM("(i % 2 == 0)")).analyze_parens())
         self.assertEqual(ParensResult.EXPLICIT_LAMBDA, JavaParser(LexicalFSM("(Integer i)")).analyze_parens())
         self.assertEqual(ParensResult.CAST, JavaParser(LexicalFSM("(String) b")).analyze_parens())
+
+    def test_opt_final(self):
+        self.assertEqual([Modifier.PARAMETER], JavaParser(LexicalFSM("int x")).opt_final([Modifier.PARAMETER]).flags)
+        self.assertEqual([Modifier.FINAL, Modifier.PARAMETER],
+                         JavaParser(LexicalFSM("final int x")).opt_final([Modifier.PARAMETER]).flags)
+        with self.assertRaises(JavaSyntaxError):
+            JavaParser(LexicalFSM("static int x")).opt_final([Modifier.PARAMETER])
+        with self.assertRaises(JavaSyntaxError):
+            JavaParser(LexicalFSM("final static int x")).opt_final([Modifier.PARAMETER])
+
+    def test_parse_in_threads(self):
+        # 词法解析器与语法解析器的状态均保存在实例中，模块级的状态表只读，因此可以在多个线程中分别解析不同的文件
+        scripts = [f"class A{i} {{ int f(int x) {{ return (x + {i}) * 2; }} }}" for i in range(16)]
+        expected = [JavaParser(LexicalFSM(script)).parse_compilation_unit().generate() for script in scripts]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            actual = list(executor.map(lambda s: JavaParser(LexicalFSM(s)).parse_compilation_unit().generate(),
+                                       scripts))
+        self.assertEqual(expected, actual)
+
+    def test_parser_slots(self):
+        # 语法解析器的所有实例属性均声明在 __slots__ 中，实例没有 __dict__
+        parser = JavaParser(LexicalFSM("int x"))
+        self.assertFalse(hasattr(parser, "__dict__"))
+        with self.assertRaises(AttributeError):
+            parser.undeclared_attribute = None
+
+    def test_accept(self):
+        # 匹配时移动到下一个 Token；不匹配时不移动，且只在报错时构造包含期望和实际 Token 类型名称的错误信息
+        parser = JavaParser(LexicalFSM("(a;"))
+        parser.accept(TokenKind.LPAREN)
+        self.assertIs(TokenKind.IDENTIFIER, parser.token_kind)
+        with self.assertRaisesRegex(JavaSyntaxError, "expect TokenKind RPAREN.*but get IDENTIFIER"):
+            parser.accept(TokenKind.RPAREN)
+        self.assertIs(TokenKind.IDENTIFIER, parser.token_kind)
+
+    def test_pattern_owns_lists(self):
+        # 嵌套模式和交叉类型的列表直接作为节点属性返回给调用方，每个节点必须持有独立的列表，不能在解析器中复用
+        res = JavaParser(LexicalFSM("Point(int x, Point(int a, int b))")).parse_pattern(0, None, None, False, False)
+        self.assertEqual(TreeKind.DECONSTRUCTION_PATTERN, res.kind)
+        self.assertEqual(2, len(res.nested_patterns))
+        inner = res.nested_patterns[1]
+        self.assertEqual(TreeKind.DECONSTRUCTION_PATTERN, inner.kind)
+        self.assertIsNot(res.nested_patterns, inner.nested_patterns)
+        self.assertEqual(2, len(inner.nested_patterns))
+        res = JavaParser(LexicalFSM("(Runnable & Serializable) x")).term3()
+        self.assertEqual(TreeKind.INTERSECTION_TYPE, res.cast_type.kind)
+        self.assertEqual(2, len(res.cast_type.bounds))
+
+    def test_token_set_frozen(self):
+        # Token 类型集合均在模块加载时构造为 frozenset，且只包含 TokenKind 的枚举成员
+        for name in token_set.__all__:
+            value = getattr(token_set, name)
+            self.assertIsInstance(value, frozenset, name)
+            for kind in value:
+                self.assertIsInstance(kind, TokenKind, name)
+
+    def test_term3_dispatch(self):
+        # term3 按第 1 个 Token 的类型查表分派：所有可作为标识符的 Token 均分派到标识符的解析方法，表中不存在的类型直接抛出语法错误
+        for kind in LAX_IDENTIFIER:
+            self.assertIs(JavaParser._term3_identifier, parser_module._TERM3_DISPATCH[kind])
+        for script in ["a", "1", "'c'", "true", "null", "int.class", "void.class", "this", "new A()", "-a", "(a)"]:
+            self.assertIsInstance(JavaParser(LexicalFSM(script)).parse_expression(), ast.Expression)
+        with self.assertRaises(JavaSyntaxError):
+            JavaParser(LexicalFSM(";")).term3()
+
+    def test_long_selector_chain(self):
+        # 标识符后的选择器和 term3_rest 中的后缀均在循环中处理，递归深度不随链的长度增加
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(len(inspect.stack()) + 100)  # 只为解析留出固定的栈深度，与测试运行器本身的调用栈深度无关
+        try:
+            for script in [".".join(["a"] * 3000), "a" + ".b()" * 3000, "a" + "[0]" * 3000]:
+                self.assertIsInstance(JavaParser(LexicalFSM(script)).parse_expression(), ast.Expression)
+        finally:
+            sys.setrecursionlimit(limit)
+
+    def test_member_select_identifier(self):
+        expression = JavaParser(LexicalFSM("a.b.c + d")).parse_expression().left_operand
+        self.assertEqual("c", expression.identifier.name)
+        self.assertEqual("b", expression.expression.identifier.name)
+        self.assertEqual("class", JavaParser(LexicalFSM("A.class")).parse_expression().identifier.name)
+
+    def _analyzed_positions(self, method: str, script: str) -> List[int]:
+        """解析表达式 script，返回每次调用前瞻分析方法 method 时分析开始处 Token 的位置"""
+        positions = []
+        original = getattr(JavaParser, method)
+
+        def wrapper(parser, *args, **kwargs):
+            lookahead = kwargs.get("lookahead", args[0] if args else 0)
+            positions.append(parser.lexer.token(lookahead).pos)
+            return original(parser, *args, **kwargs)
+
+        with unittest.mock.patch.object(JavaParser, method, wrapper):
+            JavaParser(LexicalFSM(script)).parse_expression()
+        return positions
+
+    def test_lookahead_analysis_positions(self):
+        # analyze_parens 对每个左括号、analyze_pattern 对每个 case 标签各分析一次
+        self.assertEqual([0, 1, 7, 17, 23], self._analyzed_positions("analyze_parens", "((a) + (b, c) -> (int) (d))"))
+        self.assertEqual([18, 50, 70, 73, 86], self._analyzed_positions(
+            "analyze_pattern", "switch (o) { case Integer i when i > 0 -> 1; case String s -> 2; "
+                               "case 1, 2 -> 3; case A.B -> 4; }"))
+
+    def test_lookahead_read_only(self):
+        # analyze_parens、is_unbound_member_ref 和 skip_annotation 只读取前瞻 Token 的类型并返回分析结果，不移动当前 Token
+        for script, method, args in [("(@Ann(x = (1)) List<String> a) -> a", "analyze_parens", ()),
+                                     ("<A<B>, C>::m", "is_unbound_member_ref", ()),
+                                     ("@a.b.Ann(x = (1)) int", "skip_annotation", (0,))]:
+            parser = JavaParser(LexicalFSM(script))
+            token = parser.token
+            getattr(parser, method)(*args)
+            self.assertIs(token, parser.token)
+            self.assertIsNone(parser.last_token)
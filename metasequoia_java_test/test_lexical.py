@@ -638,3 +638,58 @@ class LexicalTest(unittest.TestCase):
         self._assert_equal("\"\"\"abc\"\"\"", [
             (TokenKind.TEXT_BLOCK, "\"\"\"abc\"\"\""),
         ])
+
+    def test_token_kind_identity(self):
+        """测试终结符类型为单例（语法解析器使用 is 比较终结符类型）"""
+        lexical_fsm = LexicalFSM("a >> b")
+        self.assertIs(TokenKind.IDENTIFIER, lexical_fsm.token(0).kind)
+        self.assertIs(TokenKind.GT_GT, lexical_fsm.kind(1))
+        lexical_fsm.next_token()
+        self.assertIs(TokenKind.GT, lexical_fsm.split().kind)
+        self.assertIs(TokenKind.GT, lexical_fsm.kind(0))
+        self.assertIs(TokenKind(TokenKind.COMMA.value), TokenKind.COMMA)
+
+    def test_intern_identifier(self):
+        """测试标识符的名称被驻留为同一个字符串对象"""
+        lexical_fsm = LexicalFSM("sealed interface A permits B, sealed")
+        self.assertIs("sealed", lexical_fsm.token(0).name)
+        self.assertIs(lexical_fsm.token(0).name, lexical_fsm.token(6).name)
+
+    def test_advance(self):
+        """测试一次向后移动多个终结符"""
+        lexical_fsm = LexicalFSM("non-sealed class A")
+        lexical_fsm.advance(3)
+        self.assertEqual((TokenKind.CLASS, "class"), (lexical_fsm.token(0).kind, lexical_fsm.token(0).source))
+        self.assertIs(TokenKind.IDENTIFIER, lexical_fsm.kind(1))
+
+    def test_next_token(self):
+        """测试向后移动终结符时返回移动后的当前终结符"""
+        lexical_fsm = LexicalFSM("a + b")
+        self.assertIs(lexical_fsm.token(1), lexical_fsm.next_token())
+        self.assertEqual("b", lexical_fsm.next_token().source)
+        self.assertIs(TokenKind.EOF, lexical_fsm.next_token().kind)
+        self.assertIs(TokenKind.EOF, lexical_fsm.kind(0))
+
+    def test_tokenize_all(self):
+        """测试一次性解析全部终结符"""
+        lexical_fsm = LexicalFSM("a = 1;")
+        self.assertIs(TokenKind.IDENTIFIER, lexical_fsm.kind(0))
+        tokens = lexical_fsm.tokenize_all()
+        self.assertEqual([TokenKind.IDENTIFIER, TokenKind.EQ, TokenKind.INT_DEC_LITERAL, TokenKind.SEMI, TokenKind.EOF],
+                         [token.kind for token in tokens])
+        self.assertEqual(5, len(lexical_fsm.tokenize_all()))
+        self.assertIs(TokenKind.SEMI, lexical_fsm.kind(3))
+
+    def test_kind_buffer(self):
+        """测试终结符类型缓存与终结符缓存在前瞻、移动和拆分后保持一致"""
+        lexical_fsm = LexicalFSM("List<List<String>> a = (b);")
+        self.assertIs(TokenKind.GT_GT, lexical_fsm.kind(5))
+        for _ in range(5):
+            lexical_fsm.next_token()
+        lexical_fsm.split()
+        while True:
+            for idx in range(3):
+                self.assertIs(lexical_fsm.token(idx).kind, lexical_fsm.kind(idx))
+            if lexical_fsm.kind(0) is TokenKind.EOF:
+                break
+            lexical_fsm.next_token()